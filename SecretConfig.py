@@ -9,6 +9,10 @@ load_dotenv()
 class SecretConfig:
     DB_URL = os.getenv("DB_URL")
 
+    # Connection pool size used by ResultsController (optional, in the .env file)
+    DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+    DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "5"))
+
     # Raise an error if DB_URL is not set in the .env file
     if not DB_URL:
         raise ValueError("DB_URL is not set. Please check your .env file.")
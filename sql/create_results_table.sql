@@ -1,10 +1,29 @@
-CREATE TABLE IF NOT EXISTS clustering_results (
+-- Una fila por análisis, con sus parámetros y su duración
+CREATE TABLE IF NOT EXISTS clustering_runs (
     id SERIAL PRIMARY KEY,
     title TEXT NOT NULL,
     n_clusters INTEGER NOT NULL,
     used_iterations INTEGER NOT NULL,
-    coordinates FLOAT8[] NOT NULL,
+    parameters JSONB NOT NULL DEFAULT '{}',
+    duration_seconds FLOAT8,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS clustering_runs_title_idx ON clustering_runs (title);
+
+-- Una fila por punto o centroide de un análisis
+CREATE TABLE IF NOT EXISTS clustering_points (
+    id BIGSERIAL PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES clustering_runs (id) ON DELETE CASCADE,
     assigned_cluster INTEGER NOT NULL,
+    coordinates FLOAT8[] NOT NULL,
     is_centroid BOOLEAN NOT NULL,
     centroid_label TEXT
-);
\ No newline at end of file
+);
+
+CREATE INDEX IF NOT EXISTS clustering_points_run_cluster_idx
+    ON clustering_points (run_id, assigned_cluster);
+
+-- Lecturas por lotes de un análisis en el orden en que se guardaron sus puntos
+CREATE INDEX IF NOT EXISTS clustering_points_run_order_idx
+    ON clustering_points (run_id, id);
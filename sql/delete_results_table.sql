@@ -1 +1,3 @@
-DROP TABLE IF EXISTS clustering_results
\ No newline at end of file
+DROP TABLE IF EXISTS clustering_points;
+DROP TABLE IF EXISTS clustering_runs;
+DROP TABLE IF EXISTS clustering_results;
@@ -0,0 +1,30 @@
+-- Migra el esquema anterior (clustering_results, una fila por punto con los datos
+-- del análisis repetidos) a clustering_runs y clustering_points. Cada combinación
+-- de título, número de clusters e iteraciones pasa a ser un análisis, y sus puntos
+-- se copian en el orden de su ID. Si la tabla anterior no existe, no hace nada.
+DO $$
+BEGIN
+    IF to_regclass('clustering_results') IS NULL THEN
+        RETURN;
+    END IF;
+
+    WITH legacy_runs AS (
+        INSERT INTO clustering_runs (title, n_clusters, used_iterations)
+        SELECT title, n_clusters, used_iterations
+        FROM clustering_results
+        GROUP BY title, n_clusters, used_iterations
+        ORDER BY MIN(id)
+        RETURNING id, title, n_clusters, used_iterations
+    )
+    INSERT INTO clustering_points (
+        run_id, assigned_cluster, coordinates, is_centroid, centroid_label
+    )
+    SELECT legacy_runs.id, results.assigned_cluster, results.coordinates,
+           results.is_centroid, results.centroid_label
+    FROM clustering_results AS results
+    JOIN legacy_runs USING (title, n_clusters, used_iterations)
+    ORDER BY results.id;
+
+    DROP TABLE clustering_results;
+END
+$$;
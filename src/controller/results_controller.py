@@ -1,6 +1,10 @@
+import numpy as np
 import psycopg2 as pg
-from typing import Optional, List, Dict
+from psycopg2 import extensions, extras, pool
+from typing import Optional, List, Dict, Any, Iterator
 import sys
+import threading
+import uuid
 from contextlib import contextmanager
 
 sys.path.append(".")
@@ -10,13 +14,109 @@ from SecretConfig import SecretConfig
 from model.result_model import ClusteringResult
 
 class ResultsController:
-    def __init__(self):
-        """Inicializa la conexión a la base de datos utilizando la URL de conexión de SecretConfig."""
+    def __init__(
+        self,
+        use_pool: bool = True,
+        min_pool_size: int = SecretConfig.DB_POOL_MIN_SIZE,
+        max_pool_size: int = SecretConfig.DB_POOL_MAX_SIZE,
+        itersize: int = 2000,
+    ):
+        """
+        Inicializa la conexión a la base de datos utilizando la URL de conexión de SecretConfig.
+
+        Con use_pool (por defecto) las conexiones se reutilizan desde un pool de entre
+        min_pool_size y max_pool_size conexiones, creado en el primer uso; sin él, cada
+        operación abre y cierra su propia conexión. itersize es el número de filas que
+        traen por viaje al servidor las lecturas por lotes (iter_run_batches, iter_run_results).
+        """
+        if min_pool_size < 0 or max_pool_size < max(1, min_pool_size):
+            raise ValueError("El tamaño del pool debe cumplir 0 <= mínimo <= máximo y máximo >= 1")
+        if itersize < 1:
+            raise ValueError("itersize debe ser un número entero positivo")
         self.db_url = SecretConfig.DB_URL
+        self.use_pool = use_pool
+        self.min_pool_size = min_pool_size
+        self.max_pool_size = max_pool_size
+        self.itersize = itersize
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        # Limita las conexiones prestadas: al agotarse el pool se espera en vez de fallar
+        self._pool_slots = threading.BoundedSemaphore(max_pool_size)
+
+    def _get_pool(self) -> pool.ThreadedConnectionPool:
+        """Crea el pool de conexiones en el primer uso (una sola vez entre hilos)."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = pool.ThreadedConnectionPool(
+                    self.min_pool_size, self.max_pool_size, self.db_url
+                )
+            return self._pool
+
+    def _is_healthy(self, connection) -> bool:
+        """Comprueba que una conexión del pool sigue abierta y responde al servidor."""
+        if connection.closed or (
+            connection.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE
+        ):
+            return False
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except (pg.OperationalError, pg.InterfaceError):
+            return False
+
+    def _checkout(self, connection_pool: pool.ThreadedConnectionPool):
+        """Toma una conexión sana del pool, descartando las que se hayan cerrado."""
+        for _ in range(self.max_pool_size + 1):
+            connection = connection_pool.getconn()
+            if self._is_healthy(connection):
+                return connection
+            connection_pool.putconn(connection, close=True)
+        raise pg.OperationalError("No fue posible obtener una conexión válida del pool")
+
+    def _release(self, connection_pool: pool.ThreadedConnectionPool, connection):
+        """Devuelve una conexión al pool sin transacciones abiertas."""
+        if connection_pool.closed:
+            # El pool se cerró mientras la conexión estaba prestada
+            connection.close()
+            return
+        if not connection.closed and (
+            connection.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE
+        ):
+            try:
+                connection.rollback()
+            except pg.Error:
+                pass
+        connection_pool.putconn(connection, close=bool(connection.closed))
+
+    def close(self):
+        """Cierra todas las conexiones del pool, si se creó."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
 
     @contextmanager
     def _connect(self):
         """Método privado para gestionar la conexión a la base de datos de forma segura."""
+        if not self.use_pool:
+            with self._connect_direct() as connection:
+                yield connection
+            return
+
+        with self._pool_slots:
+            connection_pool = self._get_pool()
+            connection = self._checkout(connection_pool)
+            try:
+                yield connection
+            finally:
+                # _release deshace la transacción si la operación falló
+                self._release(connection_pool, connection)
+
+    @contextmanager
+    def _connect_direct(self):
+        """Abre una conexión propia para una sola operación y la cierra al terminar."""
         connection = None
         try:
             connection = pg.connect(self.db_url)
@@ -30,12 +130,17 @@ class ResultsController:
                 connection.close()
 
     def create_table(self):
-        """Crea la tabla 'clustering_results' si no existe."""
+        """
+        Crea las tablas 'clustering_runs' y 'clustering_points' si no existen y migra
+        a ellas los datos de la tabla anterior 'clustering_results', si existe.
+        """
         try:
             with self._connect() as connection:
                 cursor = connection.cursor()
                 with open("sql/create_results_table.sql", "r") as file:
                     cursor.execute(file.read())
+                with open("sql/migrate_results_table.sql", "r") as file:
+                    cursor.execute(file.read())
                 connection.commit()
                 cursor.close()
         except pg.Error as e:
@@ -43,7 +148,7 @@ class ResultsController:
             raise
 
     def delete_table(self):
-        """Elimina la tabla 'clustering_results' si existe."""
+        """Elimina las tablas de análisis y puntos (y la tabla anterior) si existen."""
         try:
             with self._connect() as connection:
                 cursor = connection.cursor()
@@ -55,50 +160,177 @@ class ResultsController:
             print(f"Error al eliminar la tabla: {e}")
             raise
 
+    def _insert_run(
+        self,
+        cursor,
+        title: str,
+        n_clusters: int,
+        used_iterations: int,
+        parameters: Optional[Dict[str, Any]] = None,
+        duration_seconds: Optional[float] = None
+    ) -> int:
+        """Inserta un análisis en 'clustering_runs' con el cursor recibido y devuelve su ID."""
+        query = """
+        INSERT INTO clustering_runs (
+            title,
+            n_clusters,
+            used_iterations,
+            parameters,
+            duration_seconds
+        ) VALUES (%s, %s, %s, %s, %s) RETURNING id
+        """
+        cursor.execute(query, (
+            title,
+            n_clusters,
+            used_iterations,
+            extras.Json(parameters or {}),
+            duration_seconds
+        ))
+        return cursor.fetchone()[0]
+
+    def _insert_points(
+        self,
+        cursor,
+        run_ids: List[int],
+        clustering_results: List[ClusteringResult],
+        page_size: int
+    ) -> List[int]:
+        """
+        Inserta los puntos de uno o varios análisis en 'clustering_points' con INSERT
+        de varias filas por sentencia, y devuelve sus IDs en el orden de entrada.
+        """
+        rows = [
+            (
+                position,
+                run_id,
+                result.assigned_cluster,
+                [float(value) for value in result.coordinates],
+                result.is_centroid,
+                result.centroid_label
+            )
+            for position, (run_id, result) in enumerate(zip(run_ids, clustering_results))
+        ]
+
+        # Los IDs se generan en el orden de ORDER BY, así que ordenar los IDs
+        # devueltos recupera el orden de entrada
+        query = """
+        INSERT INTO clustering_points (
+            run_id,
+            assigned_cluster,
+            coordinates,
+            is_centroid,
+            centroid_label
+        )
+        SELECT run_id, assigned_cluster, coordinates, is_centroid, centroid_label
+        FROM (VALUES %s) AS new_rows (
+            position, run_id, assigned_cluster, coordinates, is_centroid, centroid_label
+        )
+        ORDER BY position
+        RETURNING id
+        """
+        template = "(%s, %s, %s, %s::FLOAT8[], %s, %s::TEXT)"
+        inserted_rows = extras.execute_values(
+            cursor, query, rows, template=template, page_size=page_size, fetch=True
+        )
+        return sorted(row[0] for row in inserted_rows)
+
     def insert_result(self, clustering_result: ClusteringResult) -> int:
-        """Inserta un nuevo resultado en la tabla 'clustering_results'."""
+        """Inserta un nuevo resultado, como un análisis de un solo punto."""
         if not isinstance(clustering_result, ClusteringResult):
             raise TypeError("El parámetro debe ser una instancia de ClusteringResult")
-            
+
+        return self.insert_results([clustering_result])[0]
+
+    def insert_results(
+        self, clustering_results: List[ClusteringResult], page_size: int = 1000
+    ) -> List[int]:
+        """
+        Inserta varios resultados en una sola transacción, con INSERT de varias filas
+        por sentencia. Los resultados con el mismo título, número de clusters e
+        iteraciones forman un análisis. Si alguna fila falla no se guarda ninguna.
+
+        Args:
+            clustering_results: Resultados a insertar.
+            page_size: Número de filas por sentencia INSERT.
+
+        Returns:
+            Los IDs de los puntos generados, en el mismo orden que clustering_results.
+        """
+        if not all(isinstance(result, ClusteringResult) for result in clustering_results):
+            raise TypeError("Todos los elementos deben ser instancias de ClusteringResult")
+        if not clustering_results:
+            return []
+
         try:
             with self._connect() as connection:
                 cursor = connection.cursor()
-                result = clustering_result.to_dict()
+                run_ids_by_key = {}
+                for result in clustering_results:
+                    key = (result.title, result.n_clusters, result.used_iterations)
+                    if key not in run_ids_by_key:
+                        run_ids_by_key[key] = self._insert_run(cursor, *key)
 
-                query = """
-                INSERT INTO clustering_results (
-                    title,
-                    n_clusters,
-                    used_iterations,
-                    coordinates,
-                    assigned_cluster,
-                    is_centroid,
-                    centroid_label
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s) RETURNING id
-                """
+                run_ids = [
+                    run_ids_by_key[(result.title, result.n_clusters, result.used_iterations)]
+                    for result in clustering_results
+                ]
+                inserted_ids = self._insert_points(cursor, run_ids, clustering_results, page_size)
+                connection.commit()
+                cursor.close()
+                return inserted_ids
+        except pg.Error as e:
+            print(f"Error al insertar resultados: {e}")
+            raise
 
-                cursor.execute(query, (
-                    result["title"],
-                    result["n_clusters"],
-                    result["used_iterations"],
-                    result["coordinates"],
-                    result["assigned_cluster"],
-                    result["is_centroid"],
-                    result["centroid_label"]
-                ))
+    def insert_run(
+        self,
+        clustering_results: List[ClusteringResult],
+        parameters: Optional[Dict[str, Any]] = None,
+        duration_seconds: Optional[float] = None,
+        page_size: int = 1000
+    ) -> int:
+        """
+        Guarda un análisis completo (todos sus puntos y centroides) en una sola
+        transacción, junto con los parámetros usados y su duración.
+
+        Args:
+            clustering_results: Puntos y centroides del análisis; todos deben tener el
+                mismo título, número de clusters e iteraciones.
+            parameters: Parámetros del algoritmo (por ejemplo, algoritmo y escalado).
+            duration_seconds: Duración del ajuste en segundos.
+            page_size: Número de filas por sentencia INSERT.
+
+        Returns:
+            El ID del análisis creado.
+        """
+        if not clustering_results:
+            raise ValueError("El análisis debe tener al menos un resultado")
+        if not all(isinstance(result, ClusteringResult) for result in clustering_results):
+            raise TypeError("Todos los elementos deben ser instancias de ClusteringResult")
+        first = clustering_results[0]
+        key = (first.title, first.n_clusters, first.used_iterations)
+        if any(
+            (result.title, result.n_clusters, result.used_iterations) != key
+            for result in clustering_results
+        ):
+            raise ValueError("Todos los resultados deben pertenecer al mismo análisis")
 
-                # Obtener el ID generado
-                inserted_id = cursor.fetchone()[0]
+        try:
+            with self._connect() as connection:
+                cursor = connection.cursor()
+                run_id = self._insert_run(cursor, *key, parameters, duration_seconds)
+                self._insert_points(
+                    cursor, [run_id] * len(clustering_results), clustering_results, page_size
+                )
                 connection.commit()
                 cursor.close()
-                
-                return inserted_id
+                return run_id
         except pg.Error as e:
-            print(f"Error al insertar resultado: {e}")
+            print(f"Error al guardar el análisis: {e}")
             raise
 
     def get_result_by_id(self, result_id: int) -> Optional[ClusteringResult]:
-        """Obtiene un resultado específico por su ID."""
+        """Obtiene un resultado específico (un punto o centroide) por su ID."""
         if not isinstance(result_id, int) or result_id <= 0:
             raise ValueError("El ID debe ser un número entero positivo")
             
@@ -106,10 +338,12 @@ class ResultsController:
             with self._connect() as connection:
                 cursor = connection.cursor()
                 query = """
-                SELECT id, title, n_clusters, used_iterations, coordinates,
-                       assigned_cluster, is_centroid, centroid_label
-                FROM clustering_results
-                WHERE id = %s
+                SELECT points.id, runs.title, runs.n_clusters, runs.used_iterations,
+                       points.coordinates, points.assigned_cluster, points.is_centroid,
+                       points.centroid_label, points.run_id
+                FROM clustering_points AS points
+                JOIN clustering_runs AS runs ON runs.id = points.run_id
+                WHERE points.id = %s
                 """
                 cursor.execute(query, (result_id,))
                 row = cursor.fetchone()
@@ -124,14 +358,18 @@ class ResultsController:
                         coordinates=row[4],
                         assigned_cluster=row[5],
                         is_centroid=row[6],
-                        centroid_label=row[7]
+                        centroid_label=row[7],
+                        run_id=row[8]
                     )
                 return None
         except pg.Error as e:
             raise
 
     def update_result(self, result_id: int, clustering_result: ClusteringResult):
-        """Actualiza un resultado existente en la tabla."""
+        """
+        Actualiza un resultado existente. El título, el número de clusters y las
+        iteraciones pertenecen al análisis, por lo que cambian para todos sus puntos.
+        """
         if not isinstance(result_id, int) or result_id <= 0:
             raise ValueError("El ID debe ser un número entero positivo")
         if not isinstance(clustering_result, ClusteringResult):
@@ -142,16 +380,25 @@ class ResultsController:
                 cursor = connection.cursor()
                 
                 # Verificar si el resultado existe
-                cursor.execute("SELECT id FROM clustering_results WHERE id = %s", (result_id,))
-                if cursor.fetchone() is None:
+                cursor.execute("SELECT run_id FROM clustering_points WHERE id = %s", (result_id,))
+                row = cursor.fetchone()
+                if row is None:
                     raise ValueError(f"No existe un resultado con el ID {result_id}")
                 
                 new_data = clustering_result.to_dict()
+                cursor.execute(
+                    """
+                    UPDATE clustering_runs SET
+                        title = %s,
+                        n_clusters = %s,
+                        used_iterations = %s
+                    WHERE id = %s
+                    """,
+                    (new_data["title"], new_data["n_clusters"], new_data["used_iterations"], row[0])
+                )
+
                 query = """
-                UPDATE clustering_results SET
-                    title = %s,
-                    n_clusters = %s,
-                    used_iterations = %s,
+                UPDATE clustering_points SET
                     coordinates = %s,
                     assigned_cluster = %s,
                     is_centroid = %s,
@@ -160,10 +407,7 @@ class ResultsController:
                 """
 
                 cursor.execute(query, (
-                    new_data["title"],
-                    new_data["n_clusters"],
-                    new_data["used_iterations"],
-                    new_data["coordinates"],
+                    [float(value) for value in new_data["coordinates"]],
                     new_data["assigned_cluster"],
                     new_data["is_centroid"],
                     new_data["centroid_label"],
@@ -178,31 +422,416 @@ class ResultsController:
             raise
 
     def delete_result(self, result_id: int) -> bool:
-        """Elimina un resultado de la tabla por su ID."""
+        """Elimina un resultado por su ID, y su análisis si queda sin puntos."""
         if not isinstance(result_id, int) or result_id <= 0:
             raise ValueError("El ID debe ser un número entero positivo")
             
         try:
             with self._connect() as connection:
                 cursor = connection.cursor()
-                cursor.execute("DELETE FROM clustering_results WHERE id = %s", (result_id,))
+                cursor.execute(
+                    "DELETE FROM clustering_points WHERE id = %s RETURNING run_id", (result_id,)
+                )
+                row = cursor.fetchone()
+                if row is not None:
+                    cursor.execute(
+                        """
+                        DELETE FROM clustering_runs
+                        WHERE id = %s
+                          AND NOT EXISTS (SELECT 1 FROM clustering_points WHERE run_id = %s)
+                        """,
+                        (row[0], row[0])
+                    )
+                connection.commit()
+                cursor.close()
+                return row is not None
+        except pg.Error as e:
+            print(f"Error al eliminar resultado: {e}")
+            raise
+
+    def get_run(self, run_id: int) -> Optional[Dict]:
+        """Obtiene los datos de un análisis (sin sus puntos) por su ID."""
+        if not isinstance(run_id, int) or run_id <= 0:
+            raise ValueError("El ID debe ser un número entero positivo")
+
+        runs = self._select_runs("WHERE id = %s", (run_id,))
+        return runs[0] if runs else None
+
+    def get_latest_run(self, title: str) -> Optional[Dict]:
+        """Obtiene los datos del análisis más reciente con el título dado (el de get_run_centroids)."""
+        runs = self._select_runs(
+            "WHERE id = (SELECT id FROM clustering_runs WHERE title = %s ORDER BY id DESC LIMIT 1)",
+            (title,)
+        )
+        return runs[0] if runs else None
+
+    def update_run(self, run_id: int, title: str, n_clusters: int, used_iterations: int) -> bool:
+        """Actualiza el título, el número de clusters y las iteraciones de un análisis."""
+        if not isinstance(run_id, int) or run_id <= 0:
+            raise ValueError("El ID debe ser un número entero positivo")
+
+        try:
+            with self._connect() as connection:
+                cursor = connection.cursor()
+                cursor.execute(
+                    """
+                    UPDATE clustering_runs SET
+                        title = %s,
+                        n_clusters = %s,
+                        used_iterations = %s
+                    WHERE id = %s
+                    """,
+                    (title, n_clusters, used_iterations, run_id)
+                )
+                updated = cursor.rowcount > 0
+                connection.commit()
+                cursor.close()
+                return updated
+        except pg.Error as e:
+            print(f"Error al actualizar el análisis: {e}")
+            raise
+
+    def delete_run(self, run_id: int) -> bool:
+        """Elimina un análisis y todos sus puntos."""
+        if not isinstance(run_id, int) or run_id <= 0:
+            raise ValueError("El ID debe ser un número entero positivo")
+
+        try:
+            with self._connect() as connection:
+                cursor = connection.cursor()
+                cursor.execute("DELETE FROM clustering_runs WHERE id = %s", (run_id,))
                 deleted = cursor.rowcount > 0
                 connection.commit()
                 cursor.close()
                 return deleted
         except pg.Error as e:
-            print(f"Error al eliminar resultado: {e}")
+            print(f"Error al eliminar el análisis: {e}")
             raise
 
+    def _select_runs(self, condition: str = "", parameters: tuple = ()) -> List[Dict]:
+        """Consulta la tabla de análisis con una condición opcional, ordenados por ID."""
+        try:
+            with self._connect() as connection:
+                cursor = connection.cursor()
+                cursor.execute(
+                    f"""
+                    SELECT id, title, n_clusters, used_iterations, parameters,
+                           duration_seconds, created_at
+                    FROM clustering_runs
+                    {condition}
+                    ORDER BY id
+                    """,
+                    parameters
+                )
+                rows = cursor.fetchall()
+                cursor.close()
+                return [
+                    {
+                        "id": row[0],
+                        "title": row[1],
+                        "n_clusters": row[2],
+                        "used_iterations": row[3],
+                        "parameters": row[4],
+                        "duration_seconds": row[5],
+                        "created_at": row[6]
+                    }
+                    for row in rows
+                ]
+        except pg.Error as e:
+            print(f"Error al consultar los análisis: {e}")
+            raise
+
+    def _parse_values(self, text: Optional[str], dtype) -> np.ndarray:
+        """Convierte una lista de números separados por comas en un arreglo de NumPy."""
+        if not text:
+            return np.empty(0, dtype=dtype)
+        return np.fromstring(text, dtype=dtype, sep=",")
+
+    def get_runs_arrays(self, run_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Carga varios análisis completos (datos generales, puntos, clusters y centroides)
+        como arreglos contiguos de NumPy, con una consulta para los análisis y otra para
+        todos sus puntos. Los puntos de cada análisis se agregan en el servidor, de modo
+        que no se construye un objeto por fila.
+
+        Args:
+            run_ids: IDs de los análisis a cargar.
+
+        Returns:
+            Diccionario {run_id: análisis} con los datos de list_runs más "points"
+            (n, d), "labels" (n,), "centroids" (k, d), "centroid_clusters" (k,) y
+            "centroid_labels" (lista de k etiquetas). Los puntos siguen el orden en
+            que se guardaron y los centroides el de su cluster. Los IDs inexistentes
+            no aparecen en el resultado.
+        """
+        if not all(isinstance(run_id, int) and run_id > 0 for run_id in run_ids):
+            raise ValueError("Los IDs deben ser números enteros positivos")
+        run_ids = list(dict.fromkeys(run_ids))
+        if not run_ids:
+            return {}
+
+        runs = {run["id"]: run for run in self._select_runs("WHERE id = ANY(%s)", (run_ids,))}
+
+        try:
+            with self._connect() as connection:
+                cursor = connection.cursor()
+                query = """
+                SELECT run_id,
+                       is_centroid,
+                       MAX(array_length(coordinates, 1)),
+                       string_agg(
+                           array_to_string(coordinates, ','), ','
+                           ORDER BY CASE WHEN is_centroid THEN assigned_cluster END, id
+                       ),
+                       string_agg(
+                           assigned_cluster::TEXT, ','
+                           ORDER BY CASE WHEN is_centroid THEN assigned_cluster END, id
+                       ),
+                       array_agg(centroid_label ORDER BY assigned_cluster, id)
+                           FILTER (WHERE is_centroid)
+                FROM clustering_points
+                WHERE run_id = ANY(%s)
+                GROUP BY run_id, is_centroid
+                """
+                cursor.execute(query, (list(runs),))
+                rows = cursor.fetchall()
+                cursor.close()
+        except pg.Error as e:
+            print(f"Error al cargar los análisis: {e}")
+            raise
+
+        groups = {(row[0], row[1]): row for row in rows}
+        for run_id, run in runs.items():
+            dimensions = max(
+                (row[2] or 0 for key, row in groups.items() if key[0] == run_id), default=0
+            )
+            for is_centroid, coordinates_key, labels_key in [
+                (False, "points", "labels"),
+                (True, "centroids", "centroid_clusters"),
+            ]:
+                row = groups.get((run_id, is_centroid))
+                coordinates = self._parse_values(row[3] if row else None, np.float64)
+                run[coordinates_key] = (
+                    coordinates.reshape(-1, dimensions) if dimensions else np.empty((0, 0))
+                )
+                run[labels_key] = self._parse_values(row[4] if row else None, np.int64)
+            centroid_row = groups.get((run_id, True))
+            run["centroid_labels"] = list(centroid_row[5]) if centroid_row else []
+
+        return {run_id: runs[run_id] for run_id in run_ids if run_id in runs}
+
+    def get_run_arrays(self, run_id: int) -> Optional[Dict[str, Any]]:
+        """Carga un análisis completo como arreglos de NumPy (ver get_runs_arrays)."""
+        return self.get_runs_arrays([run_id]).get(run_id)
+
+    def _iter_rows(self, query: str, parameters: tuple, itersize: Optional[int]) -> Iterator[List[tuple]]:
+        """
+        Ejecuta una consulta con un cursor con nombre (del lado del servidor) y devuelve
+        sus filas por lotes de itersize, sin traer el resultado completo a memoria. La
+        conexión queda ocupada hasta que el generador termina o se cierra.
+        """
+        itersize = itersize or self.itersize
+        try:
+            with self._connect() as connection:
+                cursor = connection.cursor(name=f"results_{uuid.uuid4().hex}")
+                cursor.itersize = itersize
+                try:
+                    cursor.execute(query, parameters)
+                    while True:
+                        rows = cursor.fetchmany(itersize)
+                        if not rows:
+                            break
+                        yield rows
+                finally:
+                    cursor.close()
+        except pg.Error as e:
+            print(f"Error al leer los resultados: {e}")
+            raise
+
+    def _run_points_condition(self, is_centroid: Optional[bool]) -> tuple:
+        """Filtro y orden de los puntos de un análisis según is_centroid (None: todos)."""
+        if is_centroid is None:
+            return "", "points.id"
+        if is_centroid:
+            return "AND points.is_centroid", "points.assigned_cluster, points.id"
+        return "AND NOT points.is_centroid", "points.id"
+
+    def iter_run_batches(
+        self, run_id: int, is_centroid: Optional[bool] = False, itersize: Optional[int] = None
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Recorre los puntos de un análisis por lotes, como arreglos de NumPy, con un
+        cursor del lado del servidor. La memoria depende de itersize, no del tamaño
+        del análisis.
+
+        Args:
+            run_id: ID del análisis.
+            is_centroid: False para los puntos (por defecto), True para los centroides
+                y None para ambos.
+            itersize: Filas por lote (por defecto, el itersize del controlador).
+
+        Yields:
+            Diccionario con "ids" (b,), "points" (b, d) y "labels" (b,) de cada lote.
+        """
+        if not isinstance(run_id, int) or run_id <= 0:
+            raise ValueError("El ID debe ser un número entero positivo")
+
+        condition, order = self._run_points_condition(is_centroid)
+        query = f"""
+        SELECT points.id, points.assigned_cluster, array_to_string(points.coordinates, ',')
+        FROM clustering_points AS points
+        WHERE points.run_id = %s {condition}
+        ORDER BY {order}
+        """
+        for rows in self._iter_rows(query, (run_id,), itersize):
+            yield {
+                "ids": np.array([row[0] for row in rows], dtype=np.int64),
+                "points": self._parse_values(
+                    ",".join(row[2] for row in rows), np.float64
+                ).reshape(len(rows), -1),
+                "labels": np.array([row[1] for row in rows], dtype=np.int64),
+            }
+
+    def iter_run_results(
+        self, run_id: int, is_centroid: Optional[bool] = None, itersize: Optional[int] = None
+    ) -> Iterator[List[ClusteringResult]]:
+        """
+        Recorre los resultados de un análisis por lotes de ClusteringResult, con un
+        cursor del lado del servidor.
+
+        Args:
+            run_id: ID del análisis.
+            is_centroid: False para los puntos, True para los centroides y None (por
+                defecto) para ambos.
+            itersize: Resultados por lote (por defecto, el itersize del controlador).
+
+        Yields:
+            Lista con los ClusteringResult de cada lote.
+        """
+        if not isinstance(run_id, int) or run_id <= 0:
+            raise ValueError("El ID debe ser un número entero positivo")
+
+        condition, order = self._run_points_condition(is_centroid)
+        query = f"""
+        SELECT points.id, runs.title, runs.n_clusters, runs.used_iterations,
+               points.coordinates, points.assigned_cluster, points.is_centroid,
+               points.centroid_label, points.run_id
+        FROM clustering_points AS points
+        JOIN clustering_runs AS runs ON runs.id = points.run_id
+        WHERE points.run_id = %s {condition}
+        ORDER BY {order}
+        """
+        for rows in self._iter_rows(query, (run_id,), itersize):
+            yield [
+                ClusteringResult(
+                    id=row[0],
+                    title=row[1],
+                    n_clusters=row[2],
+                    used_iterations=row[3],
+                    coordinates=row[4],
+                    assigned_cluster=row[5],
+                    is_centroid=row[6],
+                    centroid_label=row[7],
+                    run_id=row[8]
+                )
+                for row in rows
+            ]
+
+    def get_run_points_page(
+        self, run_id: int, after_id: int = 0, limit: int = 10
+    ) -> List[ClusteringResult]:
+        """
+        Obtiene una página de los puntos (no centroides) de un análisis con paginación
+        por clave: los primeros limit puntos con ID mayor que after_id, en orden de ID
+        (índice clustering_points_run_order_idx). La conexión se libera al terminar,
+        así que entre una página y la siguiente no queda nada abierto en el servidor.
+
+        Args:
+            run_id: ID del análisis.
+            after_id: ID del último punto de la página anterior (0 para la primera).
+            limit: Número máximo de puntos de la página.
+
+        Returns:
+            Lista con los ClusteringResult de la página.
+        """
+        if not isinstance(run_id, int) or run_id <= 0:
+            raise ValueError("El ID debe ser un número entero positivo")
+        if limit < 1:
+            raise ValueError("limit debe ser un número entero positivo")
+
+        try:
+            with self._connect() as connection:
+                cursor = connection.cursor()
+                cursor.execute(
+                    """
+                    SELECT points.id, runs.title, runs.n_clusters, runs.used_iterations,
+                           points.coordinates, points.assigned_cluster, points.is_centroid,
+                           points.centroid_label, points.run_id
+                    FROM clustering_points AS points
+                    JOIN clustering_runs AS runs ON runs.id = points.run_id
+                    WHERE points.run_id = %s AND NOT points.is_centroid AND points.id > %s
+                    ORDER BY points.id
+                    LIMIT %s
+                    """,
+                    (run_id, after_id, limit)
+                )
+                rows = cursor.fetchall()
+                cursor.close()
+                return [
+                    ClusteringResult(
+                        id=row[0],
+                        title=row[1],
+                        n_clusters=row[2],
+                        used_iterations=row[3],
+                        coordinates=row[4],
+                        assigned_cluster=row[5],
+                        is_centroid=row[6],
+                        centroid_label=row[7],
+                        run_id=row[8]
+                    )
+                    for row in rows
+                ]
+        except pg.Error as e:
+            print(f"Error al leer los resultados: {e}")
+            raise
+
+    def list_runs(self) -> List[Dict]:
+        """Devuelve todos los análisis guardados con sus parámetros y duración."""
+        return self._select_runs()
+
     def list_all_titles(self) -> List[Dict]:
-        """Devuelve una lista de todos los resultados con sus IDs y títulos."""
+        """Devuelve una lista de todos los análisis con sus IDs y títulos."""
         try:
             with self._connect() as connection:
                 cursor = connection.cursor()
-                cursor.execute("SELECT id, title FROM clustering_results ORDER BY id")
+                cursor.execute("SELECT id, title FROM clustering_runs ORDER BY id")
                 rows = cursor.fetchall()
                 cursor.close()
                 return [{"id": row[0], "title": row[1]} for row in rows]
         except pg.Error as e:
             print(f"Error al listar títulos: {e}")
             raise
+
+    def get_run_centroids(self, title: str) -> List[List[float]]:
+        """
+        Devuelve las coordenadas de los centroides del análisis más reciente con el
+        título dado, ordenadas por cluster.
+        """
+        try:
+            with self._connect() as connection:
+                cursor = connection.cursor()
+                query = """
+                SELECT coordinates
+                FROM clustering_points
+                WHERE is_centroid AND run_id = (
+                    SELECT id FROM clustering_runs WHERE title = %s ORDER BY id DESC LIMIT 1
+                )
+                ORDER BY assigned_cluster
+                """
+                cursor.execute(query, (title,))
+                rows = cursor.fetchall()
+                cursor.close()
+                return [list(row[0]) for row in rows]
+        except pg.Error as e:
+            print(f"Error al obtener los centroides: {e}")
+            raise
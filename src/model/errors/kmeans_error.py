@@ -40,3 +40,93 @@ class NoNumericColumnsError(KmeansError):
             "Revisa y transforma los datos de las columnas indicadas a formato numérico, o elimínalas."
         )
         super().__init__(message)
+
+
+class InvalidAlgorithmError(KmeansError):
+    def __init__(self, algorithm: str, valid_algorithms: list[str]):
+        message = (
+            f"El algoritmo '{algorithm}' no es válido: "
+            f"Los algoritmos disponibles son: {valid_algorithms}. "
+            "Selecciona uno de los algoritmos disponibles para continuar."
+        )
+        super().__init__(message)
+
+
+class InvalidInitError(KmeansError):
+    def __init__(self, init: str, valid_inits: list[str]):
+        message = (
+            f"El método de inicialización '{init}' no es válido: "
+            f"Los métodos disponibles son: {valid_inits}. "
+            "Selecciona uno de los métodos disponibles para continuar."
+        )
+        super().__init__(message)
+
+
+class InvalidScalingError(KmeansError):
+    def __init__(self, scaling: str, valid_scalings: list[str]):
+        message = (
+            f"El método de escalado '{scaling}' no es válido: "
+            f"Los métodos disponibles son: {valid_scalings}. "
+            "Selecciona uno de los métodos disponibles para continuar."
+        )
+        super().__init__(message)
+
+
+class MissingColumnsError(KmeansError):
+    def __init__(self, missing_columns: list[str]):
+        message = (
+            "Faltan columnas en el dataset: "
+            f"Las siguientes columnas no se encontraron: {missing_columns}. "
+            "Verifica los nombres de las columnas del archivo o selecciona columnas existentes."
+        )
+        super().__init__(message)
+
+
+class NotFittedError(KmeansError):
+    def __init__(self):
+        message = (
+            "El modelo no está ajustado: "
+            "Se intentó clasificar datos sin centroides ni parámetros de escalado. "
+            "Ejecuta k_means_logic o carga un modelo guardado antes de clasificar."
+        )
+        super().__init__(message)
+
+
+class FeatureCountError(KmeansError):
+    def __init__(self, expected: int, received: int):
+        message = (
+            "El número de características no coincide: "
+            f"El modelo usa {expected} características y los datos tienen {received}. "
+            "Verifica que las columnas estén en el mismo orden que en el entrenamiento."
+        )
+        super().__init__(message)
+
+
+class InvalidDtypeError(KmeansError):
+    def __init__(self, dtype: str, valid_dtypes: list[str]):
+        message = (
+            f"El tipo de dato '{dtype}' no es válido: "
+            f"Los tipos disponibles son: {valid_dtypes}. "
+            "Selecciona uno de los tipos disponibles para continuar."
+        )
+        super().__init__(message)
+
+
+class MoreInitCentroidsError(KmeansError):
+    def __init__(self, num_init_centroids: int, num_centroids: int):
+        message = (
+            "El número de centroides iniciales es inválido: "
+            f"Se indicaron {num_init_centroids} centroides iniciales para {num_centroids} clusters. "
+            "Usa un número de clusters mayor o igual al de centroides iniciales, o elige cuáles conservar."
+        )
+        super().__init__(message)
+
+
+class InitScalerColumnsError(KmeansError):
+    def __init__(self, scaler_columns: list[str], feature_columns: list[str]):
+        message = (
+            "Las columnas de los centroides iniciales no coinciden: "
+            f"Su escalado se ajustó con {scaler_columns} y el análisis usa {feature_columns}. "
+            "Usa centroides de un modelo o análisis con las mismas columnas."
+        )
+        super().__init__(message)
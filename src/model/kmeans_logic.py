@@ -3,15 +3,28 @@ import sys
 # Agregar la raíz del proyecto al sistema de rutas
 sys.path.append("src")
 
+import copy
 import random
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
 import pandas as pd
 import numpy as np
 
+from model.scaler import DataScaler
 from model.errors.kmeans_error import (
     EmptyDatasetError,
     ZeroCentroidsError,
     MoreCentroidsError,
     NoNumericColumnsError,
+    InvalidAlgorithmError,
+    InvalidInitError,
+    MissingColumnsError,
+    NotFittedError,
+    FeatureCountError,
+    InvalidDtypeError,
+    MoreInitCentroidsError,
+    InitScalerColumnsError,
 )
 
 # Se define una seed para el random en busca de que el comportamiento sea replicable y de esta manera sea testeable
@@ -20,41 +33,388 @@ FIXED_NUMPY_SEED= 32
 random.seed(FIXED_RANDOM_SEED)
 np.random.seed(FIXED_NUMPY_SEED)
 
+# Dimensionalidad máxima con la que el motor "kd-tree" usa el árbol; por encima
+# de ella las cajas de los nodos casi nunca descartan centroides
+KD_TREE_MAX_DIMENSIONS = 8
+
+# Número máximo de centroides en una hoja del índice de centroides
+CENTROID_INDEX_LEAF_SIZE = 16
+
+# Tipos de punto flotante con los que se pueden hacer los cálculos
+VALID_DTYPES = ("float32", "float64")
+
+
+def run_restart(kmeans: "Kmeans", data_subset: pd.DataFrame, seed: int) -> dict:
+    """
+    Ejecuta una corrida independiente (inicialización + refinamiento) con su propia
+    semilla. Se define a nivel de módulo para poder ejecutarse en otro proceso.
+    Trabaja sobre una copia de la instancia, creada recién al empezar la corrida,
+    para que solo exista una copia del dataset a la vez por proceso.
+
+    Args:
+        kmeans (Kmeans): Instancia con el dataset ya preprocesado (no se modifica).
+        data_subset (pd.DataFrame): Subconjunto del dataset con las características relevantes.
+        seed (int): Semilla para los generadores aleatorios de esta corrida.
+
+    Returns:
+        dict: Centroides, asignación, inercia, iteraciones y semilla de la corrida.
+    """
+    kmeans = copy.copy(kmeans)
+    kmeans.dataset = kmeans.dataset.copy()
+    kmeans.n_init = 1
+
+    random.seed(seed)
+    np.random.seed(seed)
+    kmeans.initialize_centroids(data_subset)
+    centroids = kmeans.calculate_clusters(data_subset)
+    return {
+        "seed": seed,
+        "centroids": centroids,
+        "assignment": kmeans.dataset[["centroid_probability", "assigned_cluster"]],
+        "inertia": kmeans.inertia,
+        "used_iterations": kmeans.used_iterations,
+    }
+
 
 class Kmeans:
     """
     Implementación del algoritmo K-Means Clustering.
 
     Atributos:
-        - dataset (pd.DataFrame): Conjunto de datos a procesar.
+        - dataset (pd.DataFrame): Conjunto de datos a procesar. También puede
+          recibirse como una matriz de NumPy (n, d), cuyas columnas se nombran
+          Feature_1, ..., Feature_d.
         - num_centroids (int): Número de centroides a utilizar.
         - max_iteration (int): Número máximo de iteraciones para la optimización.
+        - tolerance (float): Desplazamiento máximo de los centroides entre dos
+          iteraciones por debajo del cual se considera que el algoritmo convergió.
+        - used_iterations (int): Iteraciones realmente ejecutadas en la última corrida.
+        - inertia (float): Suma de distancias al cuadrado de cada punto a su centroide.
+        - algorithm (str): Motor de asignación usado en las iteraciones
+          ("lloyd" evalúa todas las distancias, "elkan" usa k cotas inferiores por punto,
+          "hamerly" una sola cota inferior por punto y "kd-tree" filtra los centroides
+          candidatos sobre un KD-tree de los puntos). "elkan" conviene con muchos
+          centroides (k >= 50) y pocas columnas; con d >= 8 casi todos los puntos
+          revisan sus k cotas y "lloyd" o "hamerly" son más rápidos.
+        - distance_evaluations (int): Distancias punto-centroide calculadas en la última corrida.
+        - pruned_distances (int): Distancias punto-centroide omitidas gracias a las cotas.
+        - n_init (int): Número de corridas independientes; se conserva la de menor inercia.
+        - n_jobs (int): Procesos usados para las corridas (None usa todos los núcleos).
+        - restart_stats (list): Semilla, inercia e iteraciones de cada corrida.
+        - init (str | np.ndarray): Método de inicialización de centroides ("k-means++" o
+          "k-means||"), o matriz (m, d) con centroides explícitos para un arranque en
+          caliente (por ejemplo, los de una corrida guardada o un modelo guardado). Si
+          m < num_centroids, los que faltan se eligen con K-Means++; m > num_centroids
+          es un error. Con centroides explícitos se hace una sola corrida, aunque
+          n_init sea mayor que 1.
+        - init_scaler (DataScaler): Escalador en cuyo espacio están los centroides de
+          init (por ejemplo, el de un modelo guardado); se convierten al espacio de
+          esta corrida. Debe haberse ajustado con las mismas columnas que
+          feature_columns (en cualquier orden). Con None se usan tal cual, como los
+          de una corrida guardada.
+        - dtype (str): Tipo de punto flotante de los datos normalizados, las distancias
+          y los centroides ("float64" o "float32"). Con "float32" se usa la mitad de
+          memoria; las sumas por cluster, la inercia y los parámetros de escalado se
+          acumulan siempre en float64.
+        - init_rounds (int): Rondas de sobremuestreo de K-Means||.
+        - oversampling_factor (float): Candidatos esperados por ronda de K-Means||,
+          como múltiplo del número de centroides.
+        - scaling (str): Método de escalado ("min-max", "z-score" o "robust").
+        - scaler (DataScaler): Escalador ajustado en el preprocesamiento, reutilizable
+          para escalar nuevos datos de la misma forma.
+        - centroids (np.ndarray): Matriz (k, d) con los centroides finales (en el espacio
+          normalizado). Junto con scaler forma el modelo ajustado que usan predict y
+          transform, y que save_model guarda en un archivo.
+        - feature_columns (list): Columnas usadas para el clustering, en cualquier
+          cantidad (por defecto, todas las columnas del dataset).
+        - max_block_memory (int): Bytes máximos de cada bloque temporal de distancias;
+          la asignación procesa los puntos por bloques para respetar este límite.
+        - leaf_size (int): Número máximo de puntos en una hoja del KD-tree.
+        - centroid_index (bool): Si es True, cada asignación construye un KD-tree sobre
+          los centroides y busca en él el centroide más cercano de cada punto, en
+          lugar de compararlo con todos (útil con miles de centroides). Por encima
+          de KD_TREE_MAX_DIMENSIONS se usa la comparación con todos los centroides.
+        - kd_tree (dict): KD-tree de los puntos normalizados, construido una sola vez
+          en k_means_logic cuando algorithm es "kd-tree" y la dimensionalidad no
+          supera KD_TREE_MAX_DIMENSIONS (en otro caso se usa el motor "lloyd").
     """
 
-    def __init__(self, dataset: pd.DataFrame, num_centroids: int, max_iteration: int) -> None:
+    def __init__(
+        self,
+        dataset: pd.DataFrame | np.ndarray,
+        num_centroids: int,
+        max_iteration: int,
+        tolerance: float = 1e-4,
+        algorithm: str = "lloyd",
+        n_init: int = 1,
+        n_jobs: int = None,
+        init: str | np.ndarray = "k-means++",
+        init_rounds: int = 5,
+        oversampling_factor: float = 2.0,
+        scaling: str = "min-max",
+        feature_columns: list[str] = None,
+        max_block_memory: int = 8 * 1024 * 1024,
+        leaf_size: int = 32,
+        centroid_index: bool = False,
+        init_scaler: DataScaler = None,
+        dtype: str = "float64",
+    ) -> None:
+        if isinstance(dataset, np.ndarray):
+            dataset = self.array_to_dataframe(dataset)
         self.dataset = dataset
         self.num_centroids = num_centroids
         self.max_iteration = max_iteration
+        self.tolerance = tolerance
+        self.algorithm = algorithm
+        self.used_iterations = 0
+        self.inertia = None
+        self.distance_evaluations = 0
+        self.pruned_distances = 0
+        self.engine_state = None
+        self.n_init = n_init
+        self.n_jobs = n_jobs
+        self.restart_stats = []
+        self.init = init
+        self.init_rounds = init_rounds
+        self.oversampling_factor = oversampling_factor
+        self.scaling = scaling
+        self.scaler = None
+        self.centroids = None
+        self.feature_columns = feature_columns
+        self.max_block_memory = max_block_memory
+        self.cache_point_norms = False
+        self.cached_points = None
+        self.cached_point_norms = None
+        self.leaf_size = leaf_size
+        self.kd_tree = None
+        self.centroid_index = centroid_index
+        self.init_scaler = init_scaler
+        self.dtype = dtype
+
+    def array_to_dataframe(self, values: np.ndarray) -> pd.DataFrame:
+        """
+        Envuelve una matriz de NumPy en un DataFrame sin copiar los datos.
+
+        Args:
+            values (np.ndarray): Matriz (n, d) o vector (n,) con los datos.
+
+        Returns:
+            pd.DataFrame: DataFrame con columnas Feature_1, ..., Feature_d.
+        """
+        if values.ndim == 1:
+            values = values.reshape(-1, 1)
+        return pd.DataFrame(
+            values, columns=[f"Feature_{i+1}" for i in range(values.shape[1])], copy=False
+        )
 
     def proccess_data(self) -> None:
         """
         Preprocesa el conjunto de datos:
             - Elimina filas con valores nulos.
-            - Normaliza cada columna a un rango entre 0 y 1 usando Min-Max Scaling.
+            - Escala cada columna con el método seleccionado (por defecto Min-Max,
+              a un rango entre 0 y 1). El escalador ajustado queda en self.scaler.
+        """
+
+        self.dataset = self.dataset.dropna()
+        self.scaler = DataScaler(self.scaling)
+        self.dataset = self.scaler.fit_transform(self.dataset, self.dtype)
+
+    def to_points(self, data_subset: pd.DataFrame) -> np.ndarray:
+        """
+        Convierte un subconjunto del dataset en una matriz contigua de flotantes,
+        sobre la cual se realizan todas las operaciones vectorizadas.
+
+        Args:
+            data_subset (pd.DataFrame): Subconjunto del dataset con las columnas relevantes.
+
+        Returns:
+            np.ndarray: Matriz de forma (n, d) con las coordenadas de cada punto.
+        """
+        return np.ascontiguousarray(data_subset.to_numpy(dtype=self.dtype))
+
+    def to_centroid_array(self, centroids: list) -> np.ndarray:
         """
+        Convierte una lista de centroides (tuplas o registros de NumPy) en una
+        matriz contigua de flotantes.
 
-        self.dataset = self.dataset.copy().dropna()
-        for column in self.dataset.columns:
-            min_value = self.dataset[column].min()
-            max_value = self.dataset[column].max()
-            self.dataset[column] = self.dataset[column].apply(
-                lambda x: (x - min_value) / (max_value - min_value)
+        Args:
+            centroids (list): Lista de coordenadas de los centroides.
+
+        Returns:
+            np.ndarray: Matriz de forma (k, d) con las coordenadas de los centroides.
+        """
+        return np.array([tuple(centroid) for centroid in centroids], dtype=self.dtype)
+
+    def calculate_point_norms(self, points: np.ndarray) -> np.ndarray:
+        """
+        Calcula la norma al cuadrado de cada punto. Durante el entrenamiento
+        (ver caching_point_norms) el resultado se guarda para reutilizarlo mientras
+        se sigan usando los mismos puntos (por ejemplo, en todas las iteraciones de
+        calculate_clusters); fuera de él no se guarda nada.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+
+        Returns:
+            np.ndarray: Arreglo de n normas al cuadrado.
+        """
+        if points is self.cached_points:
+            return self.cached_point_norms
+        point_norms = np.einsum("ij,ij->i", points, points)
+        if self.cache_point_norms:
+            self.cached_points = points
+            self.cached_point_norms = point_norms
+        return point_norms
+
+    @contextmanager
+    def caching_point_norms(self):
+        """
+        Activa la caché de calculate_point_norms mientras dura el bloque y la vacía
+        al salir, para que la instancia no retenga los puntos de entrenamiento ni
+        los de predict o transform.
+        """
+        self.cache_point_norms = True
+        try:
+            yield
+        finally:
+            self.cache_point_norms = False
+            self.cached_points = None
+            self.cached_point_norms = None
+
+    def calculate_distance_matrix(
+        self,
+        points: np.ndarray,
+        centroids: np.ndarray,
+        point_norms: np.ndarray = None,
+    ) -> np.ndarray:
+        """
+        Calcula la matriz de distancias euclidianas al cuadrado entre todos los
+        puntos y todos los centroides como ||x||² - 2x·c + ||c||², de modo que el
+        trabajo principal es un producto de matrices.
+
+        Esa expansión tiene un error de redondeo mayor que la resta directa x - c.
+        Para que el centroide más cercano sea el mismo que con la resta directa (la
+        que usan los motores con cotas), las filas cuyo mínimo no supera a otro
+        centroide por más que ese error se recalculan con la resta directa.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+            point_norms (np.ndarray): Normas al cuadrado de los puntos, si ya se conocen.
+
+        Returns:
+            np.ndarray: Matriz (n, k) de distancias al cuadrado.
+        """
+        if point_norms is None:
+            point_norms = np.einsum("ij,ij->i", points, points)
+        centroid_norms = np.einsum("ij,ij->i", centroids, centroids)
+
+        distances = points @ centroids.T
+        distances *= -2.0
+        distances += point_norms[:, np.newaxis]
+        distances += centroid_norms[np.newaxis, :]
+        # Los errores de redondeo pueden dar valores levemente negativos
+        np.maximum(distances, 0.0, out=distances)
+
+        if centroids.shape[0] > 1:
+            # Cota del error de la expansión al comparar dos centroides de una fila
+            tolerance = (
+                4.0
+                * (points.shape[1] + 2)
+                * np.finfo(distances.dtype).eps
+                * (point_norms + centroid_norms.max())
+            )
+            threshold = distances[np.arange(distances.shape[0]), np.argmin(distances, axis=1)]
+            threshold += tolerance
+            near_ties = np.flatnonzero(
+                np.add.reduce(distances <= threshold[:, np.newaxis], axis=1, dtype=np.intp) > 1
             )
+            if near_ties.size:
+                distances[near_ties] = self.calculate_squared_differences(
+                    points[near_ties, np.newaxis, :], centroids[np.newaxis, :, :]
+                )
+        return distances
+
+    def calculate_squared_differences(
+        self, points: np.ndarray, centroids: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calcula distancias euclidianas al cuadrado con la resta directa, sumando las
+        columnas siempre en el mismo orden. Así una misma pareja (punto, centroide) da
+        exactamente el mismo valor en todos los motores, sin importar la forma de los
+        arreglos (einsum puede cambiar el orden de la suma según la forma), y los
+        empates se resuelven igual en todos.
+
+        Args:
+            points (np.ndarray): Arreglo (..., d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Arreglo (..., d) con los centroides, compatible
+                con points por broadcasting.
+
+        Returns:
+            np.ndarray: Distancias al cuadrado, con la forma de points sin la última dimensión.
+        """
+        differences = points - centroids
+        squared = np.square(differences[..., 0])
+        for column in range(1, differences.shape[-1]):
+            squared += np.square(differences[..., column])
+        return squared
+
+    def iterate_blocks(self, num_rows: int, num_columns: int):
+        """
+        Divide num_rows filas en bloques consecutivos tales que una matriz de
+        distancias de (filas del bloque, num_columns) no supere max_block_memory.
+
+        Args:
+            num_rows (int): Número total de filas (puntos).
+            num_columns (int): Número de columnas de la matriz de distancias (centroides).
+
+        Yields:
+            slice: Rango de filas de cada bloque.
+        """
+        item_size = np.dtype(self.dtype).itemsize
+        rows_per_block = max(1, self.max_block_memory // (item_size * max(1, num_columns)))
+        for start in range(0, num_rows, rows_per_block):
+            yield slice(start, start + rows_per_block)
+
+    def assign_points(
+        self, points: np.ndarray, centroids: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Asigna cada punto a su centroide más cercano de forma vectorizada,
+        procesando los puntos por bloques para no superar max_block_memory. Con
+        centroid_index la búsqueda se hace sobre un KD-tree de los centroides.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+
+        Returns:
+            tuple: Arreglo con el índice del centroide asignado a cada punto y
+            arreglo con la distancia mínima (al cuadrado) correspondiente.
+        """
+        if self.centroid_index and points.shape[1] <= KD_TREE_MAX_DIMENSIONS:
+            return self.query_centroid_index(points, centroids)
+
+        num_points = points.shape[0]
+        point_norms = self.calculate_point_norms(points)
+        labels = np.empty(num_points, dtype=np.int64)
+        min_distances = np.empty(num_points)
+
+        for block in self.iterate_blocks(num_points, centroids.shape[0]):
+            distances = self.calculate_distance_matrix(
+                points[block], centroids, point_norms[block]
+            )
+            labels[block] = np.argmin(distances, axis=1)
+            min_distances[block] = distances[
+                np.arange(distances.shape[0]), labels[block]
+            ]
+
+        return labels, min_distances
 
     def calculate_euclidean_distance_between_points(
         self,
-        centroids: list[tuple[float, float, float]],
-        point: tuple[float, float, float],
+        centroids: list[tuple[float, ...]],
+        point: tuple[float, ...],
     ) -> tuple[int, float]:
         """
         Calcula la distancia euclidiana entre un punto y todos los centroides,
@@ -67,40 +427,36 @@ class Kmeans:
         Returns:
             tuple: Índice del centroide asignado y la distancia mínima calculada.
         """
-
-        # Calcular la suma de las diferencias al cuadrado para cada centroide
-        distances = {
-            i: (sum((c - p) ** 2 for c, p in zip(centroid, point)))
-            for i, centroid in enumerate(centroids)
-        }
-
-        assigned_cluster, min_distance = min(
-            distances.items(), key=lambda item: item[1]
+        labels, min_distances = self.assign_points(
+            np.array([tuple(point)], dtype=self.dtype),
+            self.to_centroid_array(centroids),
         )
-        return assigned_cluster, min_distance
+        return int(labels[0]), float(min_distances[0])
 
     def calculate_centroid_probability(
         self, distances_list: list[float]
     ) -> list[float]:
         """
         Calcula la probabilidad de que un punto sea elegido como nuevo centroide,
-        basada en el cuadrado de su distancia al centroide más cercano.
+        proporcional al cuadrado de su distancia al centroide más cercano. Si todos
+        los puntos coinciden con un centroide, la probabilidad es uniforme.
 
         Args:
-            distances_list (list): Lista de distancias para cada punto.
+            distances_list (list): Distancias al cuadrado de cada punto a su centroide más cercano.
 
         Returns:
             list: Probabilidades normalizadas.
         """
-        distances_array = np.array(distances_list) ** 2
-        sum_of_squares = np.sum(distances_array**2)
-        probabilities = distances_array / sum_of_squares
+        distances_array = np.asarray(distances_list, dtype=np.float64)
+        total = distances_array.sum()
+        if total <= 0:
+            return np.full(distances_array.shape, 1.0 / distances_array.size).tolist()
 
-        return probabilities.tolist()
+        return (distances_array / total).tolist()
 
     def assign_centroid_probabilities(
         self,
-        centroids_list: list[tuple[float, float, float]],
+        centroids_list: list[tuple[float, ...]],
         data_subset: pd.DataFrame,
     ):
         """
@@ -111,22 +467,901 @@ class Kmeans:
             centroids_list (list): Lista actual de centroides.
             data_subset (pd.DataFrame): Subconjunto del dataset con las columnas relevantes.
         """
-        distances_list = []
-        cluster_list = []
-        for point in data_subset.itertuples(index=False):
-            key, distance = self.calculate_euclidean_distance_between_points(
-                centroids_list, point
-            )
-            distances_list.append(distance)
-            cluster_list.append(key)
+        cluster_list, distances_list = self.assign_points(
+            self.to_points(data_subset), self.to_centroid_array(centroids_list)
+        )
 
         probabilities_list = self.calculate_centroid_probability(distances_list)
         self.dataset["centroid_probability"] = probabilities_list
         self.dataset["assigned_cluster"] = cluster_list
 
+    def get_assignment_engines(self) -> dict:
+        """
+        Devuelve los motores de asignación disponibles, indexados por nombre.
+
+        Returns:
+            dict: Diccionario {nombre: método} de los motores de asignación.
+        """
+        return {
+            "lloyd": self.assign_lloyd,
+            "elkan": self.assign_elkan,
+            "hamerly": self.assign_hamerly,
+            "kd-tree": self.assign_kd_tree,
+        }
+
+    def calculate_paired_distances(
+        self, points: np.ndarray, centroids: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calcula la distancia euclidiana entre cada punto y el centroide de su misma fila.
+
+        Args:
+            points (np.ndarray): Matriz (m, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (m, d) o vector (d,) con los centroides.
+
+        Returns:
+            np.ndarray: Arreglo de m distancias (sin elevar al cuadrado).
+        """
+        return np.sqrt(self.calculate_squared_differences(points, centroids))
+
+    def calculate_inertia(
+        self, points: np.ndarray, centroids: np.ndarray, labels: np.ndarray
+    ) -> float:
+        """
+        Calcula la inercia: suma de distancias al cuadrado de cada punto a su centroide.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+            labels (np.ndarray): Índice del centroide asignado a cada punto.
+
+        Returns:
+            float: Inercia de la asignación.
+        """
+        differences = points - centroids[labels]
+        return float(np.einsum("ij,ij->", differences, differences, dtype=np.float64))
+
+    def calculate_centroid_separation(
+        self, centroids: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Calcula la mitad de la distancia entre cada par de centroides y, para cada
+        centroide, la mitad de la distancia a su centroide vecino más cercano.
+        Un punto más cerca de su centroide que esa mitad no puede cambiar de cluster.
+
+        Args:
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+
+        Returns:
+            tuple: Matriz (k, k) de medias distancias y arreglo de k separaciones.
+        """
+        half_centroid_distances = 0.5 * np.sqrt(
+            self.calculate_distance_matrix(centroids, centroids)
+        )
+        np.fill_diagonal(half_centroid_distances, np.inf)
+        separation = half_centroid_distances.min(axis=1)
+        np.fill_diagonal(half_centroid_distances, 0.0)
+        return half_centroid_distances, separation
+
+    def find_two_nearest(
+        self, points: np.ndarray, centroids: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calcula, para cada punto, el centroide más cercano y las distancias al
+        primer y al segundo centroide más cercanos.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+
+        Returns:
+            tuple: Etiquetas, distancia al más cercano y distancia al segundo más cercano.
+        """
+        num_points = points.shape[0]
+        labels = np.empty(num_points, dtype=np.int64)
+        nearest = np.empty(num_points)
+        second_nearest = np.full(num_points, np.inf)
+
+        for block in self.iterate_blocks(num_points, centroids.shape[0]):
+            distances = self.calculate_distance_matrix(points[block], centroids)
+            labels[block] = np.argmin(distances, axis=1)
+            nearest[block] = distances[np.arange(distances.shape[0]), labels[block]]
+            if centroids.shape[0] > 1:
+                second_nearest[block] = np.partition(distances, 1, axis=1)[:, 1]
+
+        return labels, np.sqrt(nearest), np.sqrt(second_nearest)
+
+    def assign_lloyd(self, points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """
+        Motor de asignación estándar: evalúa la distancia de cada punto a todos los centroides.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+
+        Returns:
+            np.ndarray: Índice del centroide asignado a cada punto.
+        """
+        labels, _ = self.assign_points(points, centroids)
+        self.distance_evaluations += points.shape[0] * centroids.shape[0]
+        return labels
+
+    def assign_elkan(self, points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """
+        Motor de asignación de Elkan. Mantiene por punto una cota superior de la
+        distancia a su centroide y k cotas inferiores (una por centroide). Usando la
+        desigualdad triangular y las distancias entre centroides se omiten las
+        distancias que no pueden cambiar la asignación. Las comparaciones son
+        estrictas, por lo que las etiquetas resultantes son idénticas a las del
+        motor "lloyd".
+
+        Para no recorrer la matriz (n, k) de cotas inferiores en cada iteración:
+            - Cada punto guarda además, como en Hamerly, una cota de la distancia a
+              su segundo centroide más cercano. Solo los puntos que esa cota y la
+              separación de su centroide no descartan leen sus k cotas.
+            - Las k cotas se guardan sumándoles el desplazamiento acumulado de su
+              centroide (drift_total), así que la cota vigente es el valor guardado
+              menos drift_total y las filas que no se leen no se actualizan.
+
+        Referencia (n=200000, d=3, 100 iteraciones, tolerance=0, un núcleo):
+            k=50: lloyd 10.3 s, elkan 5.2 s; k=100: lloyd 17.0 s, elkan 8.3 s;
+            k=200: lloyd 27.5 s, elkan 13.5 s. Con d=20 (n=60000, k=100) elkan
+            tarda 4.6 s frente a 2.6 s de lloyd.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+
+        Returns:
+            np.ndarray: Índice del centroide asignado a cada punto.
+        """
+        num_points, num_centroids = points.shape[0], centroids.shape[0]
+        state = self.engine_state
+
+        # Primera iteración (o cambio en el número de centroides): cálculo completo
+        if state is None or state["centroids"].shape != centroids.shape:
+            distances = np.sqrt(self.calculate_distance_matrix(points, centroids))
+            labels = np.argmin(distances, axis=1)
+            self.engine_state = {
+                "centroids": centroids,
+                "labels": labels,
+                "upper": distances[np.arange(num_points), labels],
+                "second_lower": (
+                    np.partition(distances, 1, axis=1)[:, 1]
+                    if num_centroids > 1
+                    else np.full(num_points, np.inf)
+                ),
+                "lower": distances,
+                "drift_total": np.zeros(num_centroids),
+            }
+            self.distance_evaluations += num_points * num_centroids
+            return labels
+
+        # Ajustar las cotas con el desplazamiento de los centroides; las k cotas
+        # inferiores solo a través del desplazamiento acumulado
+        drift = self.calculate_paired_distances(centroids, state["centroids"])
+        drift_total = state["drift_total"] + drift
+        labels = state["labels"].copy()
+        upper = state["upper"] + drift[labels]
+        second_lower = state["second_lower"] - self.calculate_other_drift(drift, labels)
+        lower = state["lower"]
+
+        half_centroid_distances, separation = self.calculate_centroid_separation(
+            centroids
+        )
+        bound = np.maximum(separation[labels], second_lower)
+
+        evaluated = 0
+        candidates = np.flatnonzero(upper >= bound)
+        assigned_distances = np.empty(0)
+        if candidates.size:
+            # Ajustar la cota superior a la distancia exacta antes de comparar
+            candidate_labels = labels[candidates]
+            assigned_distances = self.calculate_squared_differences(
+                points[candidates], centroids[candidate_labels]
+            )
+            upper[candidates] = np.sqrt(assigned_distances)
+            lower[candidates, candidate_labels] = (
+                upper[candidates] + drift_total[candidate_labels]
+            )
+            evaluated += candidates.size
+            keep = upper[candidates] >= bound[candidates]
+            candidates, assigned_distances = candidates[keep], assigned_distances[keep]
+
+        for block in self.iterate_blocks(candidates.size, num_centroids):
+            evaluated += self.refine_elkan_rows(
+                points,
+                centroids,
+                candidates[block],
+                assigned_distances[block],
+                labels,
+                upper,
+                second_lower,
+                lower,
+                drift_total,
+                half_centroid_distances,
+            )
+
+        self.engine_state = {
+            "centroids": centroids,
+            "labels": labels,
+            "upper": upper,
+            "second_lower": second_lower,
+            "lower": lower,
+            "drift_total": drift_total,
+        }
+        self.distance_evaluations += evaluated
+        self.pruned_distances += num_points * num_centroids - evaluated
+        return labels
+
+    def refine_elkan_rows(
+        self,
+        points: np.ndarray,
+        centroids: np.ndarray,
+        rows: np.ndarray,
+        assigned_distances: np.ndarray,
+        labels: np.ndarray,
+        upper: np.ndarray,
+        second_lower: np.ndarray,
+        lower: np.ndarray,
+        drift_total: np.ndarray,
+        half_centroid_distances: np.ndarray,
+    ) -> int:
+        """
+        Revisa un bloque de puntos del motor de Elkan de forma vectorizada: las k
+        cotas de cada punto se leen una sola vez para obtener los pares (punto,
+        centroide) candidatos, y las distancias exactas se calculan solo para esos
+        pares, agrupados por punto. Un centroide es candidato si la cota superior
+        (exacta) del punto no es menor que su cota inferior ni que la mitad de su
+        distancia al centroide asignado. Actualiza labels, upper, second_lower y
+        lower en el lugar.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+            rows (np.ndarray): Índices de los puntos del bloque.
+            assigned_distances (np.ndarray): Distancia al cuadrado exacta de cada punto
+                del bloque a su centroide.
+            labels (np.ndarray): Centroide asignado a cada punto.
+            upper (np.ndarray): Cota superior de la distancia de cada punto a su centroide.
+            second_lower (np.ndarray): Cota inferior de la distancia de cada punto a su
+                segundo centroide más cercano.
+            lower (np.ndarray): Matriz (n, k) de cotas inferiores más drift_total.
+            drift_total (np.ndarray): Desplazamiento acumulado de cada centroide.
+            half_centroid_distances (np.ndarray): Matriz (k, k) de medias distancias.
+
+        Returns:
+            int: Número de distancias calculadas.
+        """
+        positions = np.arange(rows.size)
+        row_labels = labels[rows]
+        row_upper = upper[rows]
+        bounds = lower[rows] - drift_total
+        bounds[positions, row_labels] = np.inf
+
+        # La menor de las k cotas vigentes es la del segundo centroide más cercano,
+        # que suele bastar para descartar el punto sin buscar candidatos uno por uno
+        second_lower[rows] = bounds.min(axis=1)
+        open_positions = np.flatnonzero(second_lower[rows] <= row_upper)
+        if open_positions.size == 0:
+            return 0
+        # Pares en orden de fila (punto) y, dentro de cada fila, de centroide
+        pair_open, pair_centroids = np.divmod(
+            np.flatnonzero(bounds[open_positions] <= row_upper[open_positions, np.newaxis]),
+            bounds.shape[1],
+        )
+        pair_positions = open_positions[pair_open]
+        pair_half_distances = half_centroid_distances[
+            row_labels[pair_positions], pair_centroids
+        ]
+        keep = pair_half_distances <= row_upper[pair_positions]
+
+        # En los pares descartados por la distancia entre centroides, la desigualdad
+        # triangular da una cota inferior mayor que la cota superior del punto:
+        # d(x, c) >= d(c_asignado, c) - d(x, c_asignado). Guardarla evita que esos
+        # pares vuelvan a revisarse en las siguientes iteraciones
+        discarded_positions = pair_positions[~keep]
+        discarded_centroids = pair_centroids[~keep]
+        bounds[discarded_positions, discarded_centroids] = (
+            2.0 * pair_half_distances[~keep] - row_upper[discarded_positions]
+        )
+        lower[rows[discarded_positions], discarded_centroids] = (
+            bounds[discarded_positions, discarded_centroids]
+            + drift_total[discarded_centroids]
+        )
+        pair_positions, pair_centroids = pair_positions[keep], pair_centroids[keep]
+
+        evaluated = pair_positions.size
+        if pair_positions.size:
+            pair_rows = rows[pair_positions]
+            pair_distances = self.calculate_squared_differences(
+                points[pair_rows], centroids[pair_centroids]
+            )
+            bounds[pair_positions, pair_centroids] = np.sqrt(pair_distances)
+            lower[pair_rows, pair_centroids] = (
+                bounds[pair_positions, pair_centroids] + drift_total[pair_centroids]
+            )
+
+            # Candidato más cercano de cada punto: el primero (menor índice) de los
+            # que alcanzan la distancia mínima de su grupo, igual que argmin
+            starts = np.flatnonzero(
+                np.r_[True, pair_positions[1:] != pair_positions[:-1]]
+            )
+            nearest_distances = np.minimum.reduceat(pair_distances, starts)
+            group_sizes = np.diff(np.r_[starts, pair_positions.size])
+            first_nearest = np.where(
+                pair_distances == np.repeat(nearest_distances, group_sizes),
+                np.arange(pair_positions.size),
+                pair_positions.size,
+            )
+            nearest = np.minimum.reduceat(first_nearest, starts)
+
+            # Cambiar de cluster si el candidato está más cerca (con las distancias
+            # al cuadrado exactas) o empata con un índice menor
+            group_positions = pair_positions[starts]
+            current_distances = assigned_distances[group_positions]
+            closer = (nearest_distances < current_distances) | (
+                (nearest_distances == current_distances)
+                & (pair_centroids[nearest] < row_labels[group_positions])
+            )
+            changed = group_positions[closer]
+            new_labels = pair_centroids[nearest[closer]]
+
+            # El centroide anterior pasa a ser uno más, con su distancia exacta
+            bounds[changed, row_labels[changed]] = row_upper[changed]
+            bounds[changed, new_labels] = np.inf
+            labels[rows[changed]] = new_labels
+            upper[rows[changed]] = np.sqrt(nearest_distances[closer])
+
+        second_lower[rows[open_positions]] = bounds[open_positions].min(axis=1)
+        return evaluated
+
+    def calculate_other_drift(self, drift: np.ndarray, labels: np.ndarray) -> np.ndarray:
+        """
+        Calcula, para cada punto, el mayor desplazamiento entre los centroides
+        distintos del suyo: lo máximo que puede acercarse cualquier otro centroide.
+
+        Args:
+            drift (np.ndarray): Desplazamiento de cada centroide en la iteración.
+            labels (np.ndarray): Centroide asignado a cada punto.
+
+        Returns:
+            np.ndarray: Arreglo con el desplazamiento correspondiente a cada punto.
+        """
+        largest_drift_index = int(np.argmax(drift))
+        largest_drift = drift[largest_drift_index]
+        second_largest_drift = np.partition(drift, -2)[-2] if drift.size > 1 else 0.0
+        return np.where(labels == largest_drift_index, second_largest_drift, largest_drift)
+
+    def assign_hamerly(self, points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """
+        Motor de asignación de Hamerly. Mantiene por punto una cota superior de la
+        distancia a su centroide y una única cota inferior de la distancia al segundo
+        centroide más cercano, por lo que usa memoria O(n) en lugar de O(n·k). Solo
+        los puntos cuyas cotas no descartan un cambio de cluster se comparan contra
+        todos los centroides. Las comparaciones son estrictas, por lo que las
+        etiquetas resultantes son idénticas a las del motor "lloyd".
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+
+        Returns:
+            np.ndarray: Índice del centroide asignado a cada punto.
+        """
+        num_points, num_centroids = points.shape[0], centroids.shape[0]
+        state = self.engine_state
+
+        # Primera iteración (o cambio en el número de centroides): cálculo completo
+        if state is None or state["centroids"].shape != centroids.shape:
+            labels, upper, lower = self.find_two_nearest(points, centroids)
+            self.engine_state = {
+                "centroids": centroids,
+                "labels": labels,
+                "upper": upper,
+                "lower": lower,
+            }
+            self.distance_evaluations += num_points * num_centroids
+            return labels
+
+        # Ajustar las cotas con el desplazamiento de los centroides
+        drift = self.calculate_paired_distances(centroids, state["centroids"])
+        labels = state["labels"].copy()
+        upper = state["upper"] + drift[labels]
+        lower = np.maximum(
+            state["lower"] - self.calculate_other_drift(drift, labels), 0.0
+        )
+
+        _, separation = self.calculate_centroid_separation(centroids)
+        bound = np.maximum(separation[labels], lower)
+
+        evaluated = 0
+        candidates = np.flatnonzero(upper >= bound)
+        if candidates.size:
+            # Ajustar la cota superior a la distancia exacta antes de comparar
+            upper[candidates] = self.calculate_paired_distances(
+                points[candidates], centroids[labels[candidates]]
+            )
+            evaluated += candidates.size
+            candidates = candidates[upper[candidates] >= bound[candidates]]
+
+        if candidates.size:
+            (
+                labels[candidates],
+                upper[candidates],
+                lower[candidates],
+            ) = self.find_two_nearest(points[candidates], centroids)
+            evaluated += candidates.size * num_centroids
+
+        self.engine_state = {
+            "centroids": centroids,
+            "labels": labels,
+            "upper": upper,
+            "lower": lower,
+        }
+        self.distance_evaluations += evaluated
+        self.pruned_distances += num_points * num_centroids - evaluated
+        return labels
+
+    def build_kd_tree(self, points: np.ndarray, leaf_size: int) -> dict:
+        """
+        Construye un KD-tree sobre los puntos dividiendo cada nodo por la mediana
+        de su dimensión de mayor rango. Los puntos de cada nodo ocupan un rango
+        contiguo de la permutación, por lo que un subárbol completo se puede
+        asignar a un centroide con una sola operación.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            leaf_size (int): Número máximo de puntos en una hoja.
+
+        Returns:
+            dict: Permutación de los puntos y, por nodo, la caja que contiene sus
+            puntos (lower, upper), su rango en la permutación (start, end) y sus
+            hijos (left, right; -1 en las hojas).
+        """
+        permutation = np.arange(points.shape[0])
+        starts, ends = [0], [points.shape[0]]
+        left, right = [-1], [-1]
+        lower, upper = [], []
+
+        # Los hijos se agregan al final de las listas, así que se recorre en anchura
+        node = 0
+        while node < len(starts):
+            start, end = starts[node], ends[node]
+            node_points = points[permutation[start:end]]
+            node_lower, node_upper = node_points.min(axis=0), node_points.max(axis=0)
+            lower.append(node_lower)
+            upper.append(node_upper)
+
+            split_dimension = int(np.argmax(node_upper - node_lower))
+            if (
+                end - start > leaf_size
+                and node_upper[split_dimension] > node_lower[split_dimension]
+            ):
+                middle = (start + end) // 2
+                order = np.argpartition(node_points[:, split_dimension], middle - start)
+                permutation[start:end] = permutation[start:end][order]
+                left[node], right[node] = len(starts), len(starts) + 1
+                starts += [start, middle]
+                ends += [middle, end]
+                left += [-1, -1]
+                right += [-1, -1]
+            node += 1
+
+        return {
+            "permutation": permutation,
+            "lower": np.array(lower),
+            "upper": np.array(upper),
+            "start": np.array(starts),
+            "end": np.array(ends),
+            "left": np.array(left),
+            "right": np.array(right),
+        }
+
+    def expand_ranges(
+        self, starts: np.ndarray, ends: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Concatena los rangos [start, end) sin recorrerlos uno por uno.
+
+        Args:
+            starts (np.ndarray): Inicio de cada rango.
+            ends (np.ndarray): Fin (exclusivo) de cada rango.
+
+        Returns:
+            tuple: Posiciones de todos los rangos concatenadas y longitud de cada rango.
+        """
+        lengths = ends - starts
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return offsets + np.arange(lengths.sum()), lengths
+
+    def find_group_starts(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Devuelve la posición donde empieza cada grupo de valores consecutivos iguales.
+
+        Args:
+            keys (np.ndarray): Arreglo agrupado (valores iguales contiguos).
+
+        Returns:
+            np.ndarray: Posición inicial de cada grupo.
+        """
+        return np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+
+    def find_group_minimum(
+        self, values: np.ndarray, group_starts: np.ndarray
+    ) -> np.ndarray:
+        """
+        Encuentra, en cada grupo contiguo, la posición del menor valor. En caso de
+        empate se conserva la primera posición del grupo, igual que argmin.
+
+        Args:
+            values (np.ndarray): Valores de todos los grupos concatenados.
+            group_starts (np.ndarray): Posición inicial de cada grupo.
+
+        Returns:
+            np.ndarray: Posición del mínimo de cada grupo.
+        """
+        group_sizes = np.diff(np.r_[group_starts, values.size])
+        minima = np.minimum.reduceat(values, group_starts)
+        is_minimum = np.flatnonzero(values == np.repeat(minima, group_sizes))
+        groups = np.repeat(np.arange(group_starts.size), group_sizes)[is_minimum]
+        return is_minimum[np.r_[True, groups[1:] != groups[:-1]]]
+
+    def filter_candidates(
+        self,
+        pair_nodes: np.ndarray,
+        pair_centroids: np.ndarray,
+        group_starts: np.ndarray,
+        centroids: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Descarta, para cada nodo, los centroides candidatos que están más lejos que
+        el candidato más cercano al centro de la caja en todos los puntos de la caja.
+        Basta comparar ambos contra el vértice de la caja que está más del lado del
+        centroide evaluado. La comparación es estricta, así que nunca se descarta un
+        centroide que pudiera empatar.
+
+        Args:
+            pair_nodes (np.ndarray): Nodo de cada par (nodo, centroide), agrupados por nodo.
+            pair_centroids (np.ndarray): Centroide candidato de cada par.
+            group_starts (np.ndarray): Posición del primer par de cada nodo.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+
+        Returns:
+            tuple: Nodos y centroides de los pares que siguen siendo candidatos.
+        """
+        lower = self.kd_tree["lower"][pair_nodes]
+        upper = self.kd_tree["upper"][pair_nodes]
+        candidates = centroids[pair_centroids]
+
+        midpoint_distances = self.calculate_squared_differences((lower + upper) / 2, candidates)
+        owners = candidates[self.find_group_minimum(midpoint_distances, group_starts)]
+        owners = np.repeat(owners, np.diff(np.r_[group_starts, pair_nodes.size]), axis=0)
+
+        vertices = np.where(candidates > owners, upper, lower)
+        keep = self.calculate_squared_differences(
+            vertices, candidates
+        ) <= self.calculate_squared_differences(vertices, owners)
+        return pair_nodes[keep], pair_centroids[keep]
+
+    def assign_leaf_points(
+        self,
+        points: np.ndarray,
+        centroids: np.ndarray,
+        pair_nodes: np.ndarray,
+        pair_centroids: np.ndarray,
+        labels: np.ndarray,
+    ) -> int:
+        """
+        Asigna los puntos de hojas con varios candidatos calculando solo las
+        distancias a sus centroides candidatos. Modifica labels en el lugar.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+            pair_nodes (np.ndarray): Hoja de cada par (hoja, centroide), agrupados por hoja.
+            pair_centroids (np.ndarray): Centroide candidato de cada par.
+            labels (np.ndarray): Índice del centroide asignado a cada punto.
+
+        Returns:
+            int: Número de distancias punto-centroide calculadas.
+        """
+        group_starts = self.find_group_starts(pair_nodes)
+        num_candidates = np.diff(np.r_[group_starts, pair_nodes.size])
+        leaves = pair_nodes[group_starts]
+        leaf_starts = self.kd_tree["start"][leaves]
+        leaf_sizes = self.kd_tree["end"][leaves] - leaf_starts
+
+        # Un par (punto, centroide) por cada punto de la hoja y cada candidato,
+        # ordenados por punto para poder reducir por grupos
+        offsets, pair_counts = self.expand_ranges(
+            np.zeros(leaves.size, dtype=np.int64), leaf_sizes * num_candidates
+        )
+        pair_leaves = np.repeat(np.arange(leaves.size), pair_counts)
+        pair_sizes = num_candidates[pair_leaves]
+        point_indices = self.kd_tree["permutation"][
+            leaf_starts[pair_leaves] + offsets // pair_sizes
+        ]
+        candidates = pair_centroids[group_starts[pair_leaves] + offsets % pair_sizes]
+
+        distances = self.calculate_squared_differences(
+            points[point_indices], centroids[candidates]
+        )
+        nearest = self.find_group_minimum(distances, np.flatnonzero(offsets % pair_sizes == 0))
+        labels[point_indices[nearest]] = candidates[nearest]
+        return distances.size
+
+    def assign_kd_tree(self, points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """
+        Motor de asignación por filtrado sobre el KD-tree (Kanungo et al.). Recorre
+        el árbol por niveles con pares (nodo, centroide candidato), descartando los
+        centroides que no pueden ser los más cercanos a ningún punto del nodo. Un
+        nodo con un único candidato asigna todo su subárbol de una vez; en las hojas
+        que aún tienen varios candidatos solo se calculan las distancias a ellos.
+        Los niveles demasiado grandes para max_block_memory se procesan por partes.
+        Si el árbol no se construyó (dimensionalidad alta) se usa el motor "lloyd".
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+
+        Returns:
+            np.ndarray: Índice del centroide asignado a cada punto.
+        """
+        tree = self.kd_tree
+        if tree is None or tree["permutation"].size != points.shape[0]:
+            return self.assign_lloyd(points, centroids)
+
+        num_points, num_centroids = points.shape[0], centroids.shape[0]
+        labels = np.empty(num_points, dtype=np.int64)
+        pair_bytes = 8 * self.leaf_size * points.shape[1]
+        evaluated = 0
+
+        frontiers = [(np.zeros(num_centroids, dtype=np.int64), np.arange(num_centroids))]
+        while frontiers:
+            pair_nodes, pair_centroids = frontiers.pop()
+            group_starts = self.find_group_starts(pair_nodes)
+            if pair_nodes.size * pair_bytes > self.max_block_memory and group_starts.size > 1:
+                middle = group_starts[group_starts.size // 2]
+                frontiers.append((pair_nodes[:middle], pair_centroids[:middle]))
+                frontiers.append((pair_nodes[middle:], pair_centroids[middle:]))
+                continue
+
+            pair_nodes, pair_centroids = self.filter_candidates(
+                pair_nodes, pair_centroids, group_starts, centroids
+            )
+            group_starts = self.find_group_starts(pair_nodes)
+            group_sizes = np.diff(np.r_[group_starts, pair_nodes.size])
+            group_nodes = pair_nodes[group_starts]
+
+            # Nodos con un único candidato: todo el subárbol pertenece a ese centroide
+            resolved = group_sizes == 1
+            positions, lengths = self.expand_ranges(
+                tree["start"][group_nodes[resolved]], tree["end"][group_nodes[resolved]]
+            )
+            labels[tree["permutation"][positions]] = np.repeat(
+                pair_centroids[group_starts[resolved]], lengths
+            )
+
+            is_leaf = np.repeat(tree["left"][group_nodes] < 0, group_sizes)
+            pending = np.repeat(~resolved, group_sizes)
+            if np.any(pending & is_leaf):
+                evaluated += self.assign_leaf_points(
+                    points,
+                    centroids,
+                    pair_nodes[pending & is_leaf],
+                    pair_centroids[pending & is_leaf],
+                    labels,
+                )
+
+            split = pending & ~is_leaf
+            if np.any(split):
+                frontiers.append(
+                    (
+                        np.concatenate(
+                            [tree["left"][pair_nodes[split]], tree["right"][pair_nodes[split]]]
+                        ),
+                        np.tile(pair_centroids[split], 2),
+                    )
+                )
+
+        self.distance_evaluations += evaluated
+        self.pruned_distances += num_points * num_centroids - evaluated
+        return labels
+
+    def calculate_box_distances(
+        self, points: np.ndarray, lower: np.ndarray, upper: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calcula la distancia al cuadrado de cada punto al punto más cercano de su caja.
+
+        Args:
+            points (np.ndarray): Matriz (m, d) con las coordenadas de los puntos.
+            lower (np.ndarray): Matriz (m, d) con la esquina inferior de cada caja.
+            upper (np.ndarray): Matriz (m, d) con la esquina superior de cada caja.
+
+        Returns:
+            np.ndarray: Arreglo de m distancias al cuadrado (0 si el punto está en la caja).
+        """
+        return self.calculate_squared_differences(points, np.clip(points, lower, upper))
+
+    def nearest_in_leaves(
+        self,
+        tree: dict,
+        points: np.ndarray,
+        centroids: np.ndarray,
+        pair_points: np.ndarray,
+        pair_leaves: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calcula las distancias de cada par (punto, hoja) a todos los centroides de la hoja.
+
+        Args:
+            tree (dict): KD-tree de los centroides.
+            points (np.ndarray): Matriz (m, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+            pair_points (np.ndarray): Punto de cada par.
+            pair_leaves (np.ndarray): Hoja de cada par.
+
+        Returns:
+            tuple: Punto, centroide y distancia al cuadrado de cada combinación.
+        """
+        positions, lengths = self.expand_ranges(
+            tree["start"][pair_leaves], tree["end"][pair_leaves]
+        )
+        candidate_points = np.repeat(pair_points, lengths)
+        candidates = tree["permutation"][positions]
+        return (
+            candidate_points,
+            candidates,
+            self.calculate_squared_differences(points[candidate_points], centroids[candidates]),
+        )
+
+    def query_centroid_index(
+        self, points: np.ndarray, centroids: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Busca el centroide más cercano de cada punto en un KD-tree construido sobre
+        los centroides (O(k log k)):
+            - Cada punto desciende hasta la hoja de la caja más cercana y toma como
+              cota la distancia al centroide más cercano de esa hoja.
+            - El árbol se recorre de nuevo por niveles con pares (punto, nodo),
+              descartando los nodos cuya caja está estrictamente más lejos que la cota.
+            - En las hojas restantes solo se calculan las distancias a sus centroides.
+        En caso de empate gana el centroide de menor índice, igual que en la
+        búsqueda sobre todos los centroides.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+
+        Returns:
+            tuple: Arreglo con el índice del centroide asignado a cada punto y
+            arreglo con la distancia mínima (al cuadrado) correspondiente.
+        """
+        tree = self.build_kd_tree(centroids, CENTROID_INDEX_LEAF_SIZE)
+        num_points, num_centroids = points.shape[0], centroids.shape[0]
+        labels = np.empty(num_points, dtype=np.int64)
+        min_distances = np.empty(num_points)
+
+        for block in self.iterate_blocks(
+            num_points, CENTROID_INDEX_LEAF_SIZE * points.shape[1]
+        ):
+            block_points = points[block]
+            block_size = block_points.shape[0]
+
+            # Descenso hacia la hoja más cercana para obtener una cota ajustada
+            nodes = np.zeros(block_size, dtype=np.int64)
+            descending = np.flatnonzero(tree["left"][nodes] >= 0)
+            while descending.size:
+                left, right = tree["left"][nodes[descending]], tree["right"][nodes[descending]]
+                coordinates = block_points[descending]
+                go_right = self.calculate_box_distances(
+                    coordinates, tree["lower"][right], tree["upper"][right]
+                ) < self.calculate_box_distances(
+                    coordinates, tree["lower"][left], tree["upper"][left]
+                )
+                nodes[descending] = np.where(go_right, right, left)
+                descending = descending[tree["left"][nodes[descending]] >= 0]
+
+            _, _, distances = self.nearest_in_leaves(
+                tree, block_points, centroids, np.arange(block_size), nodes
+            )
+            bound = np.minimum.reduceat(
+                distances, np.r_[0, np.cumsum(tree["end"][nodes] - tree["start"][nodes])[:-1]]
+            )
+
+            # Recorrido por niveles descartando las cajas más lejanas que la cota
+            leaf_pairs = []
+            pair_points = np.arange(block_size)
+            pair_nodes = np.zeros(block_size, dtype=np.int64)
+            while pair_points.size:
+                keep = self.calculate_box_distances(
+                    block_points[pair_points],
+                    tree["lower"][pair_nodes],
+                    tree["upper"][pair_nodes],
+                ) <= bound[pair_points]
+                pair_points, pair_nodes = pair_points[keep], pair_nodes[keep]
+                is_leaf = tree["left"][pair_nodes] < 0
+                leaf_pairs.append((pair_points[is_leaf], pair_nodes[is_leaf]))
+
+                pair_points = np.tile(pair_points[~is_leaf], 2)
+                pair_nodes = np.concatenate(
+                    [tree["left"][pair_nodes[~is_leaf]], tree["right"][pair_nodes[~is_leaf]]]
+                )
+
+            candidate_points, candidates, distances = self.nearest_in_leaves(
+                tree,
+                block_points,
+                centroids,
+                np.concatenate([pair[0] for pair in leaf_pairs]),
+                np.concatenate([pair[1] for pair in leaf_pairs]),
+            )
+            block_distances = np.full(block_size, np.inf)
+            np.minimum.at(block_distances, candidate_points, distances)
+            nearest = distances == block_distances[candidate_points]
+            block_labels = np.full(block_size, num_centroids)
+            np.minimum.at(block_labels, candidate_points[nearest], candidates[nearest])
+
+            labels[block] = block_labels
+            min_distances[block] = block_distances
+
+        return labels, min_distances
+
+    def calculate_centroid_shift(
+        self, previous_centroids: np.ndarray, centroids: np.ndarray
+    ) -> float:
+        """
+        Calcula el mayor desplazamiento euclidiano de un centroide entre dos iteraciones.
+
+        Args:
+            previous_centroids (np.ndarray): Centroides de la iteración anterior.
+            centroids (np.ndarray): Centroides de la iteración actual.
+
+        Returns:
+            float: Desplazamiento máximo entre ambas posiciones.
+        """
+        return float(np.sqrt(((centroids - previous_centroids) ** 2).sum(axis=1)).max())
+
+    def update_centroids(self, points: np.ndarray, labels: np.ndarray) -> np.ndarray:
+        """
+        Calcula cada centroide como el promedio de los puntos asignados a su cluster,
+        acumulando sumas y conteos por cluster en una sola pasada con bincount. Los
+        clusters que quedaron vacíos se reubican en los puntos más alejados de su
+        centroide, de modo que siempre se conservan num_centroids centroides.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            labels (np.ndarray): Índice del cluster asignado a cada punto.
+
+        Returns:
+            np.ndarray: Matriz (num_centroids, d) con los nuevos centroides.
+        """
+        counts = np.bincount(labels, minlength=self.num_centroids)
+        sums = np.stack(
+            [
+                np.bincount(labels, weights=points[:, column], minlength=self.num_centroids)
+                for column in range(points.shape[1])
+            ],
+            axis=1,
+        )
+        centroids = (sums / np.maximum(counts, 1)[:, np.newaxis]).astype(self.dtype)
+
+        empty_clusters = np.flatnonzero(counts == 0)
+        if empty_clusters.size:
+            distances = self.calculate_paired_distances(points, centroids[labels])
+            farthest = np.argpartition(distances, -empty_clusters.size)[-empty_clusters.size :]
+            # Ordenar de más a menos lejano para que el resultado sea determinista
+            farthest = farthest[np.argsort(-distances[farthest], kind="stable")]
+            centroids[empty_clusters] = points[farthest]
+
+        return centroids
+
     def calculate_clusters(self, data_subset: pd.DataFrame):
         """
         Refina la asignación de clusters y actualiza los centroides iterativamente.
+        Se detiene antes de max_iteration cuando ningún punto cambia de cluster o
+        cuando ningún centroide se desplaza más que la tolerancia.
 
         Args:
             data_subset (pd.DataFrame): Subconjunto del dataset con las características relevantes.
@@ -134,48 +1369,364 @@ class Kmeans:
         Returns:
             list: Lista con las nuevas coordenadas de los centroides.
         """
-        for _ in range(self.max_iteration):
+        points = self.to_points(data_subset)
+        assign_clusters = self.get_assignment_engines()[self.algorithm]
+        labels = self.dataset["assigned_cluster"].to_numpy()
+        centroids = None
+        self.used_iterations = 0
+        self.distance_evaluations = 0
+        self.pruned_distances = 0
+        self.engine_state = None
+
+        for iteration in range(1, self.max_iteration + 1):
             # Actualizar centroides como el promedio de los puntos asignados a cada cluster
-            new_centroids_df = self.dataset.groupby("assigned_cluster")[
-                ["GDP_per_capita", "life_expectancy", "literacy_rate"]
-            ].mean()
-            centroids_list = new_centroids_df.to_records(index=False).tolist()
-
-            # Reasignar cada punto al centroide más cercano
-            assigned_clusters = []
-            for point in data_subset.itertuples(index=False):
-                key, _ = self.calculate_euclidean_distance_between_points(
-                    centroids_list, point
-                )
-                assigned_clusters.append(key)
+            previous_centroids = centroids
+            centroids = self.update_centroids(points, labels)
 
-            self.dataset["assigned_cluster"] = assigned_clusters
+            # Reasignar los puntos al centroide más cercano con el motor seleccionado
+            assigned_clusters = assign_clusters(points, centroids)
+            self.used_iterations = iteration
+            self.inertia = self.calculate_inertia(points, centroids, assigned_clusters)
 
-        return (
-            centroids_list
+            # Verificar convergencia: sin reasignaciones o desplazamiento menor a la tolerancia
+            converged = np.array_equal(assigned_clusters, labels) or (
+                previous_centroids is not None
+                and self.calculate_centroid_shift(previous_centroids, centroids)
+                <= self.tolerance
+            )
+            labels = assigned_clusters
+            if converged:
+                break
+
+        self.dataset["assigned_cluster"] = labels
+        return [tuple(centroid) for centroid in centroids.tolist()]
+
+    def get_initializers(self) -> dict:
+        """
+        Devuelve los métodos de inicialización de centroides disponibles, indexados por nombre.
+
+        Returns:
+            dict: Diccionario {nombre: método} de los métodos de inicialización.
+        """
+        return {
+            "k-means++": self.initialize_kmeans_plus_plus,
+            "k-means||": self.initialize_kmeans_parallel,
+        }
+
+    def initialize_centroids(self, data_subset: pd.DataFrame) -> list:
+        """
+        Inicializa los centroides con el método seleccionado en init (o con los
+        centroides explícitos de init) y deja en el dataset la asignación de cada
+        punto al centroide inicial más cercano.
+
+        Args:
+            data_subset (pd.DataFrame): Subconjunto del dataset con las características relevantes.
+
+        Returns:
+            list: Lista con las coordenadas de los centroides iniciales.
+        """
+        if not isinstance(self.init, str):
+            return self.extend_centroids(data_subset, self.get_explicit_centroids())
+        return self.get_initializers()[self.init](data_subset)
+
+    def get_explicit_centroids(self) -> np.ndarray:
+        """
+        Devuelve los centroides explícitos de init en el espacio normalizado de esta
+        corrida, convirtiéndolos desde el espacio de init_scaler si se indicó (con
+        sus columnas reordenadas como feature_columns).
+
+        Returns:
+            np.ndarray: Matriz (m, d) con los centroides de partida.
+        """
+        centroids = np.asarray(self.init, dtype=np.float64)
+        if self.init_scaler is not None:
+            positions = [
+                self.init_scaler.feature_names.index(column) for column in self.feature_columns
+            ]
+            centroids = self.scaler.transform_array(
+                self.init_scaler.inverse_transform_array(centroids)[:, positions]
+            )
+        return centroids
+
+    def initialize_kmeans_plus_plus(self, data_subset: pd.DataFrame) -> list:
+        """
+        Inicializa los centroides con K-Means++:
+            - Selecciona el primer centroide de forma aleatoria.
+            - Selecciona los centroides restantes con probabilidad proporcional
+              al cuadrado de la distancia al centroide más cercano ya elegido.
+        Mantiene la distancia mínima de cada punto, por lo que en cada paso solo
+        calcula las distancias al último centroide agregado (O(n·k) en total).
+        Deja en el dataset la asignación de cada punto al centroide inicial más cercano.
+
+        Args:
+            data_subset (pd.DataFrame): Subconjunto del dataset con las características relevantes.
+
+        Returns:
+            list: Lista con las coordenadas de los centroides iniciales.
+        """
+        points = self.to_points(data_subset)
+        chosen, labels, min_distances = self.choose_weighted_centroids(
+            points, np.ones(points.shape[0]), self.num_centroids
         )
 
-    def k_means_logic(self):
+        self.dataset["centroid_probability"] = self.calculate_centroid_probability(
+            min_distances
+        )
+        self.dataset["assigned_cluster"] = labels
+        return [tuple(centroid) for centroid in points[chosen].tolist()]
+
+    def extend_centroids(self, data_subset: pd.DataFrame, centroids: list) -> list:
         """
-        Ejecuta el algoritmo completo de K-Means:
-            - Valida y preprocesa los datos.
-            - Inicializa el primer centroide de forma aleatoria.
-            - Selecciona los centroides restantes basados en probabilidades.
-            - Refina los centroides mediante iteraciones.
+        Parte de centroides dados (por ejemplo, los de una corrida anterior con
+        menos clusters, como máximo num_centroids; prepare_data lo valida para init)
+        y agrega los que falten hasta num_centroids con K-Means++:
+        cada nuevo centroide es un punto elegido con probabilidad proporcional al
+        cuadrado de su distancia al centroide más cercano. Deja en el dataset la
+        asignación de cada punto al centroide más cercano.
+
+        Args:
+            data_subset (pd.DataFrame): Subconjunto del dataset con las características relevantes.
+            centroids (list): Coordenadas de los centroides de partida.
 
         Returns:
-            tuple: (Lista de centroides finales, DataFrame con la asignación de clusters)
+            list: Lista con las coordenadas de los centroides iniciales.
+        """
+        points = self.to_points(data_subset)
+        centroid_array = self.to_centroid_array(centroids)
+        labels, min_distances = self.assign_points(points, centroid_array)
+
+        new_centroids = []
+        while centroid_array.shape[0] + len(new_centroids) < self.num_centroids:
+            if min_distances.sum() <= 0:
+                chosen = int(np.random.randint(points.shape[0]))
+            else:
+                chosen = self.sample_weighted_index(min_distances)
+            new_distances = self.calculate_paired_distances(points, points[chosen]) ** 2
+            closer = new_distances < min_distances
+            labels[closer] = centroid_array.shape[0] + len(new_centroids)
+            min_distances[closer] = new_distances[closer]
+            new_centroids.append(points[chosen])
+
+        if new_centroids:
+            centroid_array = np.vstack([centroid_array, new_centroids])
+
+        self.dataset["centroid_probability"] = self.calculate_centroid_probability(
+            min_distances
+        )
+        self.dataset["assigned_cluster"] = labels
+        return [tuple(centroid) for centroid in centroid_array.tolist()]
+
+    def choose_weighted_centroids(
+        self, candidates: np.ndarray, weights: np.ndarray, num_centroids: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Selecciona num_centroids centroides entre los candidatos con K-Means++
+        ponderado: la probabilidad de elegir un candidato es proporcional a su peso
+        por su distancia al cuadrado al centroide más cercano ya elegido. Mantiene
+        la distancia mínima de cada candidato y solo calcula la distancia al último
+        centroide agregado; el muestreo se hace con búsqueda binaria sobre la suma
+        acumulada de las probabilidades.
+
+        Args:
+            candidates (np.ndarray): Matriz (m, d) con los candidatos.
+            weights (np.ndarray): Peso de cada candidato.
+            num_centroids (int): Número de centroides a seleccionar.
+
+        Returns:
+            tuple: Índices de los candidatos elegidos, centroide elegido más cercano
+            a cada candidato y distancia al cuadrado a ese centroide.
+        """
+        num_candidates = candidates.shape[0]
+        chosen = [self.sample_weighted_index(weights)]
+        labels = np.zeros(num_candidates, dtype=np.int64)
+        min_distances = self.calculate_paired_distances(candidates, candidates[chosen[0]]) ** 2
+
+        while len(chosen) < num_centroids:
+            scores = weights * min_distances
+            if scores.sum() <= 0:
+                # Todos los candidatos coinciden con un centroide: elegir al azar entre los restantes
+                remaining = np.setdiff1d(np.arange(num_candidates), chosen)
+                chosen.append(int(remaining[np.random.randint(remaining.size)]))
+            else:
+                chosen.append(self.sample_weighted_index(scores))
+
+            new_distances = (
+                self.calculate_paired_distances(candidates, candidates[chosen[-1]]) ** 2
+            )
+            closer = new_distances < min_distances
+            labels[closer] = len(chosen) - 1
+            min_distances[closer] = new_distances[closer]
+
+        return np.array(chosen), labels, min_distances
+
+    def sample_weighted_index(self, weights: np.ndarray) -> int:
+        """
+        Elige un índice al azar con probabilidad proporcional a su peso, mediante
+        búsqueda binaria sobre la suma acumulada de los pesos.
+
+        Args:
+            weights (np.ndarray): Pesos no negativos, con suma positiva.
+
+        Returns:
+            int: Índice elegido.
+        """
+        cumulative_weights = np.cumsum(weights, dtype=np.float64)
+        target = np.random.random_sample() * cumulative_weights[-1]
+        index = int(np.searchsorted(cumulative_weights, target, side="right"))
+        return min(index, weights.size - 1)
+
+    def initialize_kmeans_parallel(self, data_subset: pd.DataFrame) -> list:
+        """
+        Inicializa los centroides con K-Means|| (K-Means escalable):
+            - Selecciona el primer candidato de forma aleatoria.
+            - En cada ronda agrega varios candidatos a la vez, cada punto con
+              probabilidad proporcional a su distancia al cuadrado a los candidatos.
+            - Pondera cada candidato por el número de puntos más cercanos a él.
+            - Reagrupa los candidatos ponderados (K-Means++ y Lloyd ponderados)
+              para obtener los centroides iniciales.
+        Deja en el dataset la asignación de cada punto al centroide inicial más cercano.
+
+        Args:
+            data_subset (pd.DataFrame): Subconjunto del dataset con las características relevantes.
+
+        Returns:
+            list: Lista con las coordenadas de los centroides iniciales.
+        """
+        points = self.to_points(data_subset)
+        num_points = points.shape[0]
+        oversampling = self.oversampling_factor * self.num_centroids
+
+        candidates = points[[np.random.randint(num_points)]]
+        min_distances = self.calculate_paired_distances(points, candidates[0]) ** 2
+
+        for _ in range(self.init_rounds):
+            cost = min_distances.sum()
+            if cost <= 0:
+                break
+            selected = np.flatnonzero(
+                np.random.random_sample(num_points) < oversampling * min_distances / cost
+            )
+            if selected.size == 0:
+                continue
+            candidates = np.concatenate([candidates, points[selected]])
+            _, new_distances = self.assign_points(points, points[selected])
+            min_distances = np.minimum(min_distances, new_distances)
+
+        # Sin suficientes candidatos distintos se usa K-Means++ sobre todo el dataset
+        if candidates.shape[0] < self.num_centroids:
+            return self.initialize_kmeans_plus_plus(data_subset)
+
+        # Ponderar cada candidato por el número de puntos que tiene más cerca
+        candidate_labels, _ = self.assign_points(points, candidates)
+        weights = np.bincount(candidate_labels, minlength=candidates.shape[0]).astype(np.float64)
+
+        # Reagrupar los candidatos ponderados hasta obtener num_centroids centroides
+        chosen, _, _ = self.choose_weighted_centroids(
+            candidates, weights, self.num_centroids
+        )
+        centroids = candidates[chosen]
+        for _ in range(self.init_rounds * 2):
+            labels, _ = self.assign_points(candidates, centroids)
+            cluster_weights = np.bincount(labels, weights=weights, minlength=self.num_centroids)
+            non_empty = cluster_weights > 0
+            weighted_sums = np.stack(
+                [
+                    np.bincount(
+                        labels,
+                        weights=weights * candidates[:, column],
+                        minlength=self.num_centroids,
+                    )
+                    for column in range(candidates.shape[1])
+                ],
+                axis=1,
+            )
+            centroids = centroids.copy()
+            centroids[non_empty] = (
+                weighted_sums[non_empty] / cluster_weights[non_empty][:, np.newaxis]
+            )
+
+        centroids_list = [tuple(centroid) for centroid in centroids.tolist()]
+        self.assign_centroid_probabilities(centroids_list, data_subset)
+        return centroids_list
+
+    def run_restarts(self, data_subset: pd.DataFrame) -> list:
+        """
+        Ejecuta n_init corridas independientes (cada una con su propia semilla,
+        derivada del generador global) en un pool de procesos y conserva la de
+        menor inercia. Las estadísticas de cada corrida quedan en restart_stats.
+
+        Args:
+            data_subset (pd.DataFrame): Subconjunto del dataset con las características relevantes.
+
+        Returns:
+            list: Lista con las coordenadas de los centroides de la mejor corrida.
+        """
+        seeds = np.random.randint(0, 2**31 - 1, size=self.n_init).tolist()
+
+        # Cada corrida copia la instancia dentro de run_restart, justo antes de empezar
+        if self.n_jobs == 1:
+            results = [run_restart(self, data_subset, seed) for seed in seeds]
+        else:
+            with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+                results = list(
+                    executor.map(
+                        run_restart,
+                        [self] * self.n_init,
+                        [data_subset] * self.n_init,
+                        seeds,
+                    )
+                )
+
+        self.restart_stats = [
+            {
+                "seed": result["seed"],
+                "inertia": result["inertia"],
+                "used_iterations": result["used_iterations"],
+            }
+            for result in results
+        ]
+        best = min(results, key=lambda result: result["inertia"])
+        self.dataset[["centroid_probability", "assigned_cluster"]] = best["assignment"]
+        self.inertia = best["inertia"]
+        self.used_iterations = best["used_iterations"]
+        return best["centroids"]
+
+    def prepare_data(self) -> pd.DataFrame:
         """
+        Valida y preprocesa los datos una sola vez, dejándolos listos para una o
+        varias corridas:
+            - Valida el dataset, el número de centroides, el motor y la inicialización.
+            - Selecciona las columnas de interés y verifica que sean numéricas.
+            - Normaliza los datos y construye el KD-tree si el motor lo usa.
 
+        Returns:
+            pd.DataFrame: Subconjunto del dataset normalizado con las características relevantes.
+        """
         if self.dataset.empty:
             raise EmptyDatasetError()
         if not self.num_centroids:
             raise ZeroCentroidsError()
+        if self.algorithm not in self.get_assignment_engines():
+            raise InvalidAlgorithmError(
+                self.algorithm, list(self.get_assignment_engines())
+            )
+        if isinstance(self.init, str) and self.init not in self.get_initializers():
+            raise InvalidInitError(self.init, list(self.get_initializers()))
+        if str(self.dtype) not in VALID_DTYPES:
+            raise InvalidDtypeError(self.dtype, list(VALID_DTYPES))
+
+        # Usar solo las columnas seleccionadas (por defecto, todas)
+        if self.feature_columns is None:
+            self.feature_columns = list(self.dataset.columns)
+        missing_columns = [
+            column for column in self.feature_columns if column not in self.dataset.columns
+        ]
+        if missing_columns:
+            raise MissingColumnsError(missing_columns)
+        self.dataset = self.dataset[self.feature_columns]
 
         # Verificar que todas las columnas sean numéricas
-        invalid_columns = self.dataset.select_dtypes(
-            exclude=["int64", "float64"]
-        ).columns
+        invalid_columns = self.dataset.select_dtypes(exclude=[np.number]).columns
         if not invalid_columns.empty:
             raise NoNumericColumnsError(invalid_columns)
 
@@ -184,29 +1735,166 @@ class Kmeans:
         if self.num_centroids > self.dataset.shape[0]:
             raise MoreCentroidsError(self.num_centroids, self.dataset.shape[0])
 
-        # Seleccionar un centroide aleatorio como inicio
-        random_centroid = tuple(
-            self.dataset.sample(n=1).values[0]
-        ) 
-        centroids_list = [random_centroid]
+        # Los centroides explícitos deben tener una coordenada por característica, no
+        # superar num_centroids y, con init_scaler, venir de las mismas columnas
+        if not isinstance(self.init, str):
+            init_shape = np.shape(self.init)
+            if len(init_shape) != 2 or init_shape[1] != len(self.feature_columns):
+                raise FeatureCountError(
+                    len(self.feature_columns), init_shape[-1] if init_shape else 0
+                )
+            if init_shape[0] > self.num_centroids:
+                raise MoreInitCentroidsError(init_shape[0], self.num_centroids)
+            if self.init_scaler is not None and sorted(self.init_scaler.feature_names) != sorted(
+                self.feature_columns
+            ):
+                raise InitScalerColumnsError(self.init_scaler.feature_names, self.feature_columns)
 
-        relevant_columns = ["GDP_per_capita", "life_expectancy", "literacy_rate"]
-        data_subset = self.dataset[
-            relevant_columns
-        ].copy()
+        data_subset = self.dataset[self.feature_columns].copy()
 
-        # Inicializar la asignación de probabilidades y clusters
-        self.assign_centroid_probabilities(centroids_list, data_subset)
+        # El KD-tree se construye una sola vez y se reutiliza en todas las iteraciones
+        self.kd_tree = None
+        if self.algorithm == "kd-tree" and data_subset.shape[1] <= KD_TREE_MAX_DIMENSIONS:
+            self.kd_tree = self.build_kd_tree(self.to_points(data_subset), self.leaf_size)
+
+        return data_subset
+
+    def k_means_logic(self):
+        """
+        Ejecuta el algoritmo completo de K-Means:
+            - Valida y preprocesa los datos.
+            - Inicializa los centroides (K-Means++, K-Means|| o centroides explícitos).
+            - Refina los centroides mediante iteraciones.
 
-        # Seleccionar los nuevos centroides basados en la probabilidad calculada
-        while len(centroids_list) < self.num_centroids:
-            options = data_subset.to_records(index=False)
-            weights = self.dataset["centroid_probability"].tolist()
-            random_centroid = random.choices(options, weights=weights, k=1)[0]
-            centroids_list.append(random_centroid)
-            self.assign_centroid_probabilities(centroids_list, data_subset)
+        Returns:
+            tuple: (Lista de centroides finales, DataFrame con la asignación de clusters)
+        """
+        data_subset = self.prepare_data()
+
+        with self.caching_point_norms():
+            if self.n_init > 1 and isinstance(self.init, str):
+                # Varias corridas independientes en paralelo, conservando la mejor
+                final_centroid = self.run_restarts(data_subset)
+            else:
+                self.initialize_centroids(data_subset)
 
-        # Refinar los centroides con iteraciones
-        final_centroid = self.calculate_clusters(data_subset)
+                # Refinar los centroides con iteraciones
+                final_centroid = self.calculate_clusters(data_subset)
 
+        self.centroids = self.to_centroid_array(final_centroid)
         return final_centroid, self.dataset
+
+    def prepare_features(self, data: pd.DataFrame | np.ndarray) -> np.ndarray:
+        """
+        Extrae de nuevos datos las características del modelo, en el orden del
+        entrenamiento, y las escala con los parámetros ajustados.
+
+        Args:
+            data (pd.DataFrame | np.ndarray): DataFrame con las columnas del modelo, o
+                matriz (n, d) cuyas columnas están en el orden de las características.
+
+        Returns:
+            np.ndarray: Matriz (n, d) con los datos escalados.
+        """
+        if self.centroids is None or self.scaler is None:
+            raise NotFittedError()
+
+        feature_names = self.scaler.feature_names
+        if isinstance(data, pd.DataFrame):
+            missing_columns = [column for column in feature_names if column not in data.columns]
+            if missing_columns:
+                raise MissingColumnsError(missing_columns)
+            values = data[feature_names].to_numpy()
+        else:
+            values = np.asarray(data)
+            if values.ndim == 1:
+                values = values.reshape(1, -1)
+            if values.shape[1] != len(feature_names):
+                raise FeatureCountError(len(feature_names), values.shape[1])
+
+        # Los valores originales se escalan en float64; solo el resultado pasa a dtype
+        return self.scaler.transform_array(values, self.dtype)
+
+    def predict(self, data: pd.DataFrame | np.ndarray) -> np.ndarray:
+        """
+        Asigna cada fila de un nuevo conjunto de datos al centroide más cercano del
+        modelo ajustado, sin volver a entrenar ni usar los datos de entrenamiento.
+
+        Args:
+            data (pd.DataFrame | np.ndarray): Nuevos datos (ver prepare_features).
+
+        Returns:
+            np.ndarray: Índice del cluster asignado a cada fila.
+        """
+        labels, _ = self.assign_points(self.prepare_features(data), self.centroids)
+        return labels
+
+    def transform(self, data: pd.DataFrame | np.ndarray) -> np.ndarray:
+        """
+        Expresa cada fila de un nuevo conjunto de datos como su distancia euclidiana
+        a cada centroide del modelo (en el espacio normalizado).
+
+        Args:
+            data (pd.DataFrame | np.ndarray): Nuevos datos (ver prepare_features).
+
+        Returns:
+            np.ndarray: Matriz (n, k) de distancias a los centroides.
+        """
+        points = self.prepare_features(data)
+        distances = np.empty((points.shape[0], self.centroids.shape[0]))
+        for block in self.iterate_blocks(points.shape[0], self.centroids.shape[0]):
+            distances[block] = np.sqrt(
+                self.calculate_distance_matrix(points[block], self.centroids)
+            )
+        return distances
+
+    def save_model(self, path: str) -> None:
+        """
+        Guarda el modelo ajustado (centroides, parámetros de escalado y nombres de
+        las características) en un archivo binario compacto de NumPy (.npz).
+
+        Args:
+            path (str): Ruta del archivo (si no termina en .npz, NumPy lo agrega).
+        """
+        if self.centroids is None or self.scaler is None:
+            raise NotFittedError()
+
+        np.savez(
+            path,
+            centroids=self.centroids,
+            feature_names=np.array(self.scaler.feature_names, dtype=str),
+            scaling=np.array(self.scaler.method),
+            center=self.scaler.center,
+            scale=self.scaler.scale,
+        )
+
+    @classmethod
+    def load_model(cls, path: str, **kwargs) -> "Kmeans":
+        """
+        Carga un modelo guardado con save_model, listo para predict y transform.
+
+        Args:
+            path (str): Ruta del archivo .npz.
+            **kwargs: Otros argumentos de Kmeans (por ejemplo, centroid_index).
+
+        Returns:
+            Kmeans: Instancia ajustada, sin datos de entrenamiento.
+        """
+        with np.load(path, allow_pickle=False) as stored:
+            feature_names = stored["feature_names"].tolist()
+            scaler = DataScaler(str(stored["scaling"])).set_parameters(
+                feature_names, stored["center"], stored["scale"]
+            )
+            centroids = stored["centroids"]
+
+        kmeans = cls(
+            pd.DataFrame(columns=feature_names),
+            centroids.shape[0],
+            0,
+            scaling=scaler.method,
+            feature_columns=feature_names,
+            **kwargs,
+        )
+        kmeans.scaler = scaler
+        kmeans.centroids = centroids.astype(kmeans.dtype)
+        return kmeans
@@ -0,0 +1,228 @@
+import sys
+
+# Agregar la raíz del proyecto al sistema de rutas
+sys.path.append("src")
+
+import copy
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import numpy as np
+
+from model.kmeans_logic import Kmeans
+from model.metrics import ClusterMetrics
+from model.errors.kmeans_error import ZeroCentroidsError
+
+
+def run_sweep_fit(
+    base_kmeans: Kmeans,
+    num_centroids: int,
+    data_subset: pd.DataFrame,
+    seed: int,
+    metrics: ClusterMetrics,
+    initial_centroids: list = None,
+) -> dict:
+    """
+    Ajusta el modelo para un número de centroides del barrido y calcula sus
+    métricas de calidad. Se define a nivel de módulo para poder ejecutarse en
+    otro proceso. Trabaja sobre una copia del modelo base, creada recién al
+    empezar el ajuste, que reutiliza los datos ya normalizados (y el KD-tree, si
+    existe).
+
+    Args:
+        base_kmeans (Kmeans): Instancia con el dataset ya preprocesado (no se modifica).
+        num_centroids (int): Número de centroides de este ajuste.
+        data_subset (pd.DataFrame): Subconjunto del dataset con las características relevantes.
+        seed (int): Semilla para el generador aleatorio de esta corrida.
+        metrics (ClusterMetrics): Métricas a calcular sobre el resultado.
+        initial_centroids (list): Centroides de partida (arranque en caliente), o None
+            para inicializar con el método de kmeans.init.
+
+    Returns:
+        dict: Número de centroides, centroides, métricas e iteraciones de la corrida.
+    """
+    kmeans = copy.copy(base_kmeans)
+    kmeans.dataset = base_kmeans.dataset.copy()
+    kmeans.num_centroids = num_centroids
+
+    np.random.seed(seed)
+    if initial_centroids is None:
+        kmeans.initialize_centroids(data_subset)
+    else:
+        kmeans.extend_centroids(data_subset, initial_centroids)
+    centroids = kmeans.calculate_clusters(data_subset)
+
+    scores = metrics.evaluate(
+        kmeans.to_points(data_subset),
+        kmeans.to_centroid_array(centroids),
+        kmeans.dataset["assigned_cluster"].to_numpy(),
+    )
+    return {
+        "num_centroids": kmeans.num_centroids,
+        "centroids": centroids,
+        **scores,
+        "used_iterations": kmeans.used_iterations,
+    }
+
+
+class KmeansSweep:
+    """
+    Barrido del número de centroides: normaliza el dataset una sola vez y ajusta
+    un modelo por cada valor de k, en paralelo (un proceso por valor de k) o, con
+    arranque en caliente, en cadena, partiendo de los centroides del k anterior.
+
+    Atributos:
+        - k_values (list): Números de centroides a evaluar, en orden creciente.
+        - n_jobs (int): Procesos usados para el barrido (None usa todos los núcleos).
+        - metrics (ClusterMetrics): Métricas de calidad calculadas para cada k; la
+          silueta usa una muestra de silhouette_sample_size puntos.
+        - warm_start (bool): Si es True, cada k parte de los centroides del k anterior
+          más los que falten, elegidos con K-Means++. Los valores de k dependen unos de
+          otros, por lo que en este modo el barrido es secuencial.
+        - base_kmeans (Kmeans): Instancia con el dataset validado y normalizado,
+          compartida por todos los ajustes.
+        - centroids (dict): Centroides finales de cada k.
+        - elbow_k (int): Número de centroides en el codo de la curva de inercia.
+
+    El resto de argumentos (dataset, max_iteration, tolerance, algorithm, init,
+    scaling, feature_columns, dtype) se pasan a Kmeans.
+    """
+
+    def __init__(
+        self,
+        dataset: pd.DataFrame | np.ndarray,
+        k_values: list[int],
+        max_iteration: int,
+        tolerance: float = 1e-4,
+        algorithm: str = "lloyd",
+        init: str = "k-means++",
+        scaling: str = "min-max",
+        feature_columns: list[str] = None,
+        n_jobs: int = None,
+        warm_start: bool = False,
+        silhouette_sample_size: int = 10_000,
+        dtype: str = "float64",
+    ) -> None:
+        self.k_values = sorted(set(k_values))
+        self.n_jobs = n_jobs
+        self.metrics = ClusterMetrics(sample_size=silhouette_sample_size)
+        self.warm_start = warm_start
+        self.base_kmeans = Kmeans(
+            dataset,
+            max(self.k_values, default=0),
+            max_iteration,
+            tolerance=tolerance,
+            algorithm=algorithm,
+            init=init,
+            scaling=scaling,
+            feature_columns=feature_columns,
+            dtype=dtype,
+        )
+        self.centroids = {}
+        self.elbow_k = None
+
+    def find_elbow(self, k_values: list[int], inertias: list[float]) -> int:
+        """
+        Encuentra el codo de la curva de inercia: con k y el logaritmo de la inercia
+        llevados a [0, 1], es el punto más alejado por debajo de la recta que une el
+        primer y el último punto de la curva. La escala logarítmica evita que las
+        grandes caídas de los primeros valores de k oculten el codo.
+
+        Args:
+            k_values (list): Números de centroides evaluados, en orden creciente.
+            inertias (list): Inercia obtenida para cada k.
+
+        Returns:
+            int: Número de centroides en el codo.
+        """
+        k_array = np.asarray(k_values, dtype=np.float64)
+        log_inertia = np.log(np.maximum(np.asarray(inertias, dtype=np.float64), 1e-12))
+        k_range = k_array[-1] - k_array[0]
+        inertia_range = log_inertia[0] - log_inertia[-1]
+        if k_array.size < 3 or k_range <= 0 or inertia_range <= 0:
+            return int(k_array[0])
+
+        scaled_k = (k_array - k_array[0]) / k_range
+        scaled_inertia = (log_inertia - log_inertia[-1]) / inertia_range
+        return int(k_array[np.argmax((1.0 - scaled_k) - scaled_inertia)])
+
+    def run_fits(self, data_subset: pd.DataFrame) -> list[dict]:
+        """
+        Ajusta un modelo por cada k con una semilla propia derivada del generador
+        global, de modo que el resultado no depende del número de procesos.
+
+        Args:
+            data_subset (pd.DataFrame): Subconjunto del dataset normalizado.
+
+        Returns:
+            list: Resultado de cada ajuste, en el orden de k_values.
+        """
+        seeds = np.random.randint(0, 2**31 - 1, size=len(self.k_values)).tolist()
+
+        # Cada ajuste copia el modelo base dentro de run_sweep_fit, justo antes de empezar
+        if self.warm_start:
+            results = []
+            previous_centroids = None
+            for num_centroids, seed in zip(self.k_values, seeds):
+                results.append(
+                    run_sweep_fit(
+                        self.base_kmeans,
+                        num_centroids,
+                        data_subset,
+                        seed,
+                        self.metrics,
+                        previous_centroids,
+                    )
+                )
+                previous_centroids = results[-1]["centroids"]
+            return results
+
+        num_fits = len(self.k_values)
+        arguments = (
+            [self.base_kmeans] * num_fits,
+            self.k_values,
+            [data_subset] * num_fits,
+            seeds,
+            [self.metrics] * num_fits,
+        )
+        if self.n_jobs == 1:
+            return list(map(run_sweep_fit, *arguments))
+        with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+            return list(executor.map(run_sweep_fit, *arguments))
+
+    def sweep(self) -> pd.DataFrame:
+        """
+        Ejecuta el barrido completo: valida y normaliza los datos una vez, ajusta
+        cada k y resume la calidad de cada ajuste.
+
+        Returns:
+            pd.DataFrame: Una fila por k con las columnas num_centroids, inertia,
+            inertia_drop (reducción relativa de la inercia respecto al k anterior),
+            davies_bouldin, calinski_harabasz, silhouette y used_iterations.
+        """
+        if not self.k_values or self.k_values[0] < 1:
+            raise ZeroCentroidsError()
+
+        data_subset = self.base_kmeans.prepare_data()
+        results = self.run_fits(data_subset)
+        self.centroids = {result["num_centroids"]: result["centroids"] for result in results}
+
+        table = pd.DataFrame(
+            [
+                {
+                    column: result[column]
+                    for column in [
+                        "num_centroids",
+                        "inertia",
+                        "davies_bouldin",
+                        "calinski_harabasz",
+                        "silhouette",
+                        "used_iterations",
+                    ]
+                }
+                for result in results
+            ]
+        )
+        table.insert(2, "inertia_drop", -table["inertia"].pct_change().fillna(0.0))
+        self.elbow_k = self.find_elbow(table["num_centroids"].tolist(), table["inertia"].tolist())
+        return table
@@ -0,0 +1,197 @@
+import sys
+
+# Agregar la raíz del proyecto al sistema de rutas
+sys.path.append("src")
+
+import numpy as np
+
+
+class ClusterMetrics:
+    """
+    Métricas de calidad de un clustering, calculadas de forma vectorizada a partir
+    de los puntos, los centroides y las etiquetas (por ejemplo, las de k_means_logic).
+
+    Atributos:
+        - sample_size (int): Número de puntos de la muestra aleatoria usada para la
+          silueta (None usa todos los puntos).
+        - max_block_memory (int): Bytes máximos de cada bloque de distancias entre
+          pares de puntos en la silueta.
+    """
+
+    def __init__(
+        self, sample_size: int = None, max_block_memory: int = 8 * 1024 * 1024
+    ) -> None:
+        self.sample_size = sample_size
+        self.max_block_memory = max_block_memory
+
+    def calculate_inertia(
+        self, points: np.ndarray, centroids: np.ndarray, labels: np.ndarray
+    ) -> float:
+        """
+        Calcula la inercia: suma de distancias al cuadrado de cada punto a su centroide.
+        Valores más bajos indican clusters más compactos. La suma se acumula en
+        float64 aunque los puntos sean float32, igual que en Kmeans.calculate_inertia.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+            labels (np.ndarray): Índice del centroide asignado a cada punto.
+
+        Returns:
+            float: Inercia de la asignación.
+        """
+        differences = points - centroids[labels]
+        return float(np.einsum("ij,ij->", differences, differences, dtype=np.float64))
+
+    def calculate_davies_bouldin(
+        self, points: np.ndarray, centroids: np.ndarray, labels: np.ndarray
+    ) -> float:
+        """
+        Calcula el índice de Davies-Bouldin: para cada cluster, la mayor razón entre
+        la suma de las dispersiones de dos clusters (distancia media de sus puntos a
+        su centroide) y la distancia entre sus centroides, promediada sobre los
+        clusters. Valores más bajos indican clusters más compactos y separados.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+            labels (np.ndarray): Índice del centroide asignado a cada punto.
+
+        Returns:
+            float: Índice de Davies-Bouldin (NaN con menos de 2 clusters con puntos).
+        """
+        num_centroids = centroids.shape[0]
+        counts = np.bincount(labels, minlength=num_centroids)
+        differences = points - centroids[labels]
+        distances = np.sqrt(np.einsum("ij,ij->i", differences, differences))
+        scatter = np.bincount(labels, weights=distances, minlength=num_centroids)
+
+        non_empty = counts > 0
+        if non_empty.sum() < 2:
+            return np.nan
+        scatter = scatter[non_empty] / counts[non_empty]
+        centroids = centroids[non_empty]
+
+        centroid_differences = centroids[:, np.newaxis, :] - centroids[np.newaxis, :, :]
+        separation = np.sqrt((centroid_differences**2).sum(axis=2))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = (scatter[:, np.newaxis] + scatter[np.newaxis, :]) / separation
+        # Dos clusters de un solo punto en la misma posición no aportan
+        ratios[np.isnan(ratios)] = 0.0
+        np.fill_diagonal(ratios, -np.inf)
+        return float(ratios.max(axis=1).mean())
+
+    def calculate_calinski_harabasz(
+        self, points: np.ndarray, centroids: np.ndarray, labels: np.ndarray
+    ) -> float:
+        """
+        Calcula el índice de Calinski-Harabasz: la dispersión entre clusters sobre la
+        dispersión dentro de ellos, cada una dividida por sus grados de libertad.
+        Valores más altos indican clusters más compactos y separados.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+            labels (np.ndarray): Índice del centroide asignado a cada punto.
+
+        Returns:
+            float: Índice de Calinski-Harabasz (NaN si hay menos de 2 clusters con
+            puntos o tantos clusters como puntos).
+        """
+        num_points = points.shape[0]
+        counts = np.bincount(labels, minlength=centroids.shape[0])
+        num_clusters = int((counts > 0).sum())
+        if num_clusters < 2 or num_clusters >= num_points:
+            return np.nan
+
+        within = self.calculate_inertia(points, centroids, labels)
+        if within <= 0:
+            return np.inf
+        centroid_differences = centroids - points.mean(axis=0)
+        between = float(
+            (counts * np.einsum("ij,ij->i", centroid_differences, centroid_differences)).sum()
+        )
+        return (between / (num_clusters - 1)) / (within / (num_points - num_clusters))
+
+    def calculate_silhouette(self, points: np.ndarray, labels: np.ndarray) -> float:
+        """
+        Calcula el coeficiente de silueta promedio. Para cada punto, a es la
+        distancia media a los demás puntos de su cluster y b la menor distancia
+        media a los puntos de otro cluster; su silueta es (b - a) / max(a, b), y 0
+        si su cluster tiene un solo punto. Valores cercanos a 1 indican clusters
+        bien separados.
+
+        Con sample_size se calcula sobre una muestra aleatoria de los puntos, y las
+        distancias entre pares se calculan por bloques de filas, de modo que la
+        memoria no depende del cuadrado del número de puntos.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            labels (np.ndarray): Índice del cluster asignado a cada punto.
+
+        Returns:
+            float: Silueta promedio (NaN si hay menos de 2 clusters o tantos como puntos).
+        """
+        if self.sample_size is not None and self.sample_size < points.shape[0]:
+            sample = np.random.choice(points.shape[0], self.sample_size, replace=False)
+            points, labels = points[sample], labels[sample]
+
+        _, labels = np.unique(labels, return_inverse=True)
+        num_points = points.shape[0]
+        counts = np.bincount(labels)
+        if counts.size < 2 or counts.size >= num_points:
+            return np.nan
+
+        # Ordenar por cluster para sumar las distancias de cada cluster con reduceat
+        order = np.argsort(labels, kind="stable")
+        points, labels = points[order], labels[order]
+        cluster_starts = np.r_[0, np.cumsum(counts)[:-1]]
+        norms = np.einsum("ij,ij->i", points, points)
+
+        scores = np.empty(num_points)
+        rows_per_block = max(1, self.max_block_memory // (8 * num_points))
+        for start in range(0, num_points, rows_per_block):
+            block = slice(start, start + rows_per_block)
+            block_rows = np.arange(block.start, min(block.stop, num_points))
+
+            squared = norms[block, np.newaxis] - 2.0 * points[block] @ points.T + norms
+            distances = np.sqrt(np.maximum(squared, 0.0))
+            distances[np.arange(block_rows.size), block_rows] = 0.0
+            cluster_sums = np.add.reduceat(distances, cluster_starts, axis=1)
+
+            own = labels[block]
+            own_counts = counts[own]
+            own_mean = cluster_sums[np.arange(block_rows.size), own] / np.maximum(
+                own_counts - 1, 1
+            )
+            other_means = cluster_sums / counts
+            other_means[np.arange(block_rows.size), own] = np.inf
+            nearest_mean = other_means.min(axis=1)
+
+            with np.errstate(invalid="ignore"):
+                block_scores = (nearest_mean - own_mean) / np.maximum(own_mean, nearest_mean)
+            block_scores[(own_counts == 1) | np.isnan(block_scores)] = 0.0
+            scores[block] = block_scores
+
+        return float(scores.mean())
+
+    def evaluate(
+        self, points: np.ndarray, centroids: np.ndarray, labels: np.ndarray
+    ) -> dict:
+        """
+        Calcula todas las métricas de calidad de un clustering.
+
+        Args:
+            points (np.ndarray): Matriz (n, d) con las coordenadas de los puntos.
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+            labels (np.ndarray): Índice del centroide asignado a cada punto.
+
+        Returns:
+            dict: Inercia, Davies-Bouldin, Calinski-Harabasz y silueta.
+        """
+        return {
+            "inertia": self.calculate_inertia(points, centroids, labels),
+            "davies_bouldin": self.calculate_davies_bouldin(points, centroids, labels),
+            "calinski_harabasz": self.calculate_calinski_harabasz(points, centroids, labels),
+            "silhouette": self.calculate_silhouette(points, labels),
+        }
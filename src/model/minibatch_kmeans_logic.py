@@ -0,0 +1,146 @@
+import sys
+
+# Agregar la raíz del proyecto al sistema de rutas
+sys.path.append("src")
+
+import pandas as pd
+import numpy as np
+
+from model.kmeans_logic import Kmeans
+from model.errors.kmeans_error import InvalidAlgorithmError
+
+
+class MiniBatchKmeans(Kmeans):
+    """
+    Variante Mini-Batch del algoritmo K-Means.
+
+    En lugar de recorrer todo el dataset en cada iteración, cada paso actualiza
+    los centroides a partir de un lote aleatorio de puntos. Cada centroide tiene
+    su propia tasa de aprendizaje (1 / puntos vistos por ese centroide), y el
+    proceso se detiene cuando la inercia suavizada deja de mejorar. La interfaz
+    es la misma de Kmeans: k_means_logic devuelve (centroides, dataset).
+
+    Atributos adicionales:
+        - batch_size (int): Número de puntos usados en cada paso.
+        - max_no_improvement (int): Pasos consecutivos sin mejora de la inercia
+          suavizada tras los cuales se detiene el algoritmo.
+
+    El resto de argumentos con nombre (n_init, init, scaling, feature_columns,
+    centroid_index, dtype, etc.) se pasan a Kmeans. Los lotes se asignan con
+    assign_points, así que algorithm solo admite "lloyd".
+    """
+
+    def __init__(
+        self,
+        dataset: pd.DataFrame,
+        num_centroids: int,
+        max_iteration: int,
+        batch_size: int = 1024,
+        max_no_improvement: int = 10,
+        tolerance: float = 0.0,
+        **kwargs,
+    ) -> None:
+        if kwargs.get("algorithm", "lloyd") != "lloyd":
+            raise InvalidAlgorithmError(kwargs["algorithm"], ["lloyd"])
+        super().__init__(dataset, num_centroids, max_iteration, tolerance=tolerance, **kwargs)
+        self.batch_size = batch_size
+        self.max_no_improvement = max_no_improvement
+
+    def update_centroids_with_batch(
+        self,
+        centroids: np.ndarray,
+        centroid_counts: np.ndarray,
+        batch: np.ndarray,
+        labels: np.ndarray,
+    ) -> None:
+        """
+        Mueve cada centroide hacia el promedio de los puntos del lote que le fueron
+        asignados, con una tasa de aprendizaje igual a la proporción de esos puntos
+        sobre el total de puntos que ha recibido el centroide. Modifica los arreglos
+        recibidos en el lugar.
+
+        Args:
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+            centroid_counts (np.ndarray): Puntos acumulados por cada centroide.
+            batch (np.ndarray): Matriz (b, d) con los puntos del lote.
+            labels (np.ndarray): Índice del centroide asignado a cada punto del lote.
+        """
+        num_centroids = centroids.shape[0]
+        batch_counts = np.bincount(labels, minlength=num_centroids)
+        batch_sums = np.stack(
+            [
+                np.bincount(labels, weights=batch[:, column], minlength=num_centroids)
+                for column in range(batch.shape[1])
+            ],
+            axis=1,
+        )
+
+        updated = batch_counts > 0
+        centroid_counts += batch_counts
+        learning_rates = batch_counts[updated] / centroid_counts[updated]
+        batch_means = batch_sums[updated] / batch_counts[updated][:, np.newaxis]
+        centroids[updated] += learning_rates[:, np.newaxis] * (
+            batch_means - centroids[updated]
+        )
+
+    def calculate_clusters(self, data_subset: pd.DataFrame):
+        """
+        Refina los centroides con pasos Mini-Batch. Cada paso (iteración) toma un
+        lote aleatorio, lo asigna a los centroides actuales y actualiza los
+        centroides. Se detiene al alcanzar max_iteration pasos, cuando la inercia
+        suavizada no mejora durante max_no_improvement pasos o cuando ningún
+        centroide se desplaza más que la tolerancia. Al final se asigna todo el
+        dataset a los centroides obtenidos.
+
+        Args:
+            data_subset (pd.DataFrame): Subconjunto del dataset con las características relevantes.
+
+        Returns:
+            list: Lista con las nuevas coordenadas de los centroides.
+        """
+        points = self.to_points(data_subset)
+        num_points = points.shape[0]
+        batch_size = min(self.batch_size, num_points)
+
+        # Centroides iniciales: promedio de los puntos asignados durante la inicialización
+        centroids = self.update_centroids(points, self.dataset["assigned_cluster"].to_numpy())
+        centroid_counts = np.zeros(centroids.shape[0], dtype=np.int64)
+
+        # Factor de suavizado de la inercia, proporcional al tamaño del lote
+        smoothing = min(1.0, 2.0 * batch_size / (num_points + 1))
+        smoothed_inertia = None
+        best_inertia = np.inf
+        steps_without_improvement = 0
+        self.used_iterations = 0
+
+        for iteration in range(1, self.max_iteration + 1):
+            batch = points[np.random.randint(0, num_points, size=batch_size)]
+            labels, min_distances = self.assign_points(batch, centroids)
+            previous_centroids = centroids.copy()
+            self.update_centroids_with_batch(centroids, centroid_counts, batch, labels)
+            self.used_iterations = iteration
+
+            # Verificar convergencia con la inercia suavizada del lote
+            batch_inertia = float(min_distances.mean())
+            if smoothed_inertia is None:
+                smoothed_inertia = batch_inertia
+            else:
+                smoothed_inertia += smoothing * (batch_inertia - smoothed_inertia)
+
+            if smoothed_inertia < best_inertia:
+                best_inertia = smoothed_inertia
+                steps_without_improvement = 0
+            else:
+                steps_without_improvement += 1
+                if steps_without_improvement >= self.max_no_improvement:
+                    break
+
+            if self.calculate_centroid_shift(previous_centroids, centroids) <= self.tolerance:
+                break
+
+        # Asignación final de todos los puntos a los centroides obtenidos (por bloques)
+        assigned_clusters, _ = self.assign_points(points, centroids)
+        self.dataset["assigned_cluster"] = assigned_clusters
+        self.inertia = self.calculate_inertia(points, centroids, assigned_clusters)
+
+        return [tuple(centroid) for centroid in centroids.tolist()]
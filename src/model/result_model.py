@@ -10,7 +10,8 @@ class ClusteringResult:
         assigned_cluster: int,
         is_centroid: bool,
         centroid_label: Optional[str] = None,
-        id: Optional[int] = None
+        id: Optional[int] = None,
+        run_id: Optional[int] = None
     ):
         """
         Modelo para representar el resultado de un algoritmo de clustering.
@@ -24,6 +25,7 @@ class ClusteringResult:
             is_centroid: Indica si el punto es un centroide
             centroid_label: Etiqueta del centroide (solo si is_centroid es True)
             id: Identificador único en la base de datos (opcional)
+            run_id: Identificador del análisis al que pertenece el punto (opcional)
         """
         self.id = id
         self.title = title
@@ -33,6 +35,7 @@ class ClusteringResult:
         self.assigned_cluster = assigned_cluster
         self.is_centroid = is_centroid
         self.centroid_label = centroid_label
+        self.run_id = run_id
     
         
     def to_dict(self) -> Dict[str, Any]:
@@ -45,7 +48,8 @@ class ClusteringResult:
             "coordinates": self.coordinates,
             "assigned_cluster": self.assigned_cluster,
             "is_centroid": self.is_centroid,
-            "centroid_label": self.centroid_label
+            "centroid_label": self.centroid_label,
+            "run_id": self.run_id
         }
     
     def isEqual(self, other: 'ClusteringResult') -> bool:
@@ -0,0 +1,172 @@
+import sys
+
+# Agregar la raíz del proyecto al sistema de rutas
+sys.path.append("src")
+
+import pandas as pd
+import numpy as np
+
+from model.errors.kmeans_error import InvalidScalingError
+
+# Filas escaladas por bloque: los valores originales se pasan a float64 de a un
+# bloque, de modo que devolver float32 no requiere una copia float64 completa
+TRANSFORM_BLOCK_ROWS = 65_536
+
+
+class DataScaler:
+    """
+    Escalador de columnas numéricas que se ajusta una vez y puede reutilizarse
+    para transformar nuevos datos con los mismos parámetros.
+
+    Cada columna se transforma como (x - center) / scale, donde:
+        - "min-max": center es el mínimo y scale el rango (máximo - mínimo).
+        - "z-score": center es la media y scale la desviación estándar.
+        - "robust": center es la mediana y scale el rango intercuartil.
+    Las columnas constantes usan scale = 1, por lo que no hay divisiones por cero.
+    Los parámetros se calculan y guardan en float64, y el escalado siempre se hace
+    en float64; solo los datos ya escalados pueden devolverse en float32 para
+    reducir la memoria (así una columna con un desplazamiento grande, como 1e9 + x,
+    no pierde precisión).
+
+    Atributos:
+        - method (str): Método de escalado.
+        - feature_names (list): Columnas con las que se ajustó el escalador.
+        - center (np.ndarray): Valor restado a cada columna.
+        - scale (np.ndarray): Valor por el que se divide cada columna.
+    """
+
+    METHODS = ("min-max", "z-score", "robust")
+
+    def __init__(self, method: str = "min-max") -> None:
+        if method not in self.METHODS:
+            raise InvalidScalingError(method, list(self.METHODS))
+        self.method = method
+        self.feature_names = None
+        self.center = None
+        self.scale = None
+
+    def fit(self, data: pd.DataFrame) -> "DataScaler":
+        """
+        Calcula los parámetros de escalado con reducciones vectorizadas por columna.
+
+        Args:
+            data (pd.DataFrame): Datos numéricos sin valores nulos.
+
+        Returns:
+            DataScaler: El mismo escalador, ya ajustado.
+        """
+        # Sin convertir los datos: las reducciones acumulan en float64
+        values = data.to_numpy()
+
+        if self.method == "min-max":
+            center = values.min(axis=0).astype(np.float64)
+            scale = values.max(axis=0) - center
+        elif self.method == "z-score":
+            center = values.mean(axis=0, dtype=np.float64)
+            scale = values.std(axis=0, dtype=np.float64)
+        else:
+            center, upper_quartile, lower_quartile = np.percentile(
+                values, [50, 75, 25], axis=0
+            )
+            scale = upper_quartile - lower_quartile
+
+        return self.set_parameters(list(data.columns), center, scale)
+
+    def set_parameters(
+        self, feature_names: list[str], center: np.ndarray, scale: np.ndarray
+    ) -> "DataScaler":
+        """
+        Fija los parámetros del escalador, por ejemplo cuando se calcularon por
+        bloques. Las columnas con scale igual a 0 usan scale = 1.
+
+        Args:
+            feature_names (list): Columnas a las que corresponden los parámetros.
+            center (np.ndarray): Valor restado a cada columna.
+            scale (np.ndarray): Valor por el que se divide cada columna.
+
+        Returns:
+            DataScaler: El mismo escalador, ya ajustado.
+        """
+        self.feature_names = list(feature_names)
+        self.center = np.asarray(center, dtype=np.float64)
+        scale = np.asarray(scale, dtype=np.float64)
+        self.scale = np.where(scale > 0, scale, 1.0)
+        return self
+
+    def transform_array(self, values: np.ndarray, dtype: str = "float64") -> np.ndarray:
+        """
+        Escala una matriz cuyas columnas están en el orden de feature_names. El
+        escalado se hace en float64, por bloques de filas, y solo el resultado se
+        convierte a dtype.
+
+        Args:
+            values (np.ndarray): Matriz (n, d) con los valores originales, de cualquier
+                tipo numérico.
+            dtype (str): Tipo de los datos escalados ("float32" o "float64").
+
+        Returns:
+            np.ndarray: Matriz (n, d) contigua con los valores escalados.
+        """
+        values = np.asarray(values)
+        scaled = np.empty(values.shape, dtype=dtype)
+        for start in range(0, values.shape[0], TRANSFORM_BLOCK_ROWS):
+            block = slice(start, start + TRANSFORM_BLOCK_ROWS)
+            scaled[block] = (values[block].astype(np.float64) - self.center) / self.scale
+        return scaled
+
+    def transform(self, data: pd.DataFrame, dtype: str = "float64") -> pd.DataFrame:
+        """
+        Escala un nuevo conjunto de datos con los parámetros ya ajustados.
+
+        Args:
+            data (pd.DataFrame): Datos que contienen las columnas de feature_names.
+            dtype (str): Tipo de los datos escalados ("float32" o "float64").
+
+        Returns:
+            pd.DataFrame: Datos escalados, con las mismas columnas e índice.
+        """
+        # Sin convertir a dtype: los valores originales se escalan en float64
+        values = data[self.feature_names].to_numpy()
+        return pd.DataFrame(
+            self.transform_array(values, dtype), columns=self.feature_names, index=data.index
+        )
+
+    def fit_transform(self, data: pd.DataFrame, dtype: str = "float64") -> pd.DataFrame:
+        """Ajusta el escalador con los datos y devuelve los datos escalados en dtype."""
+        return self.fit(data).transform(data, dtype)
+
+    def inverse_transform_array(self, values: np.ndarray) -> np.ndarray:
+        """
+        Devuelve valores escalados (por ejemplo, centroides) a sus unidades originales.
+
+        Args:
+            values (np.ndarray): Matriz (n, d) con los valores escalados.
+
+        Returns:
+            np.ndarray: Matriz (n, d) con los valores originales.
+        """
+        return values * self.scale + self.center
+
+    def to_dict(self) -> dict:
+        """Convierte el escalador en un diccionario serializable para guardarlo con una corrida."""
+        return {
+            "method": self.method,
+            "feature_names": self.feature_names,
+            "center": self.center.tolist(),
+            "scale": self.scale.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, parameters: dict) -> "DataScaler":
+        """
+        Reconstruye un escalador ajustado a partir de sus parámetros guardados.
+
+        Args:
+            parameters (dict): Diccionario generado por to_dict.
+
+        Returns:
+            DataScaler: Escalador listo para transformar nuevos datos.
+        """
+        return cls(parameters["method"]).set_parameters(
+            parameters["feature_names"], parameters["center"], parameters["scale"]
+        )
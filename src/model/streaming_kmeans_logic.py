@@ -0,0 +1,252 @@
+import sys
+from pathlib import Path
+
+# Agregar la raíz del proyecto al sistema de rutas
+sys.path.append("src")
+
+import pandas as pd
+import numpy as np
+
+from model.kmeans_logic import Kmeans, VALID_DTYPES
+from model.scaler import DataScaler
+from model.errors.kmeans_error import (
+    EmptyDatasetError,
+    ZeroCentroidsError,
+    MoreCentroidsError,
+    NoNumericColumnsError,
+    MissingColumnsError,
+    InvalidDtypeError,
+)
+
+
+class StreamingKmeans(Kmeans):
+    """
+    Variante de K-Means que lee el archivo CSV por bloques, sin cargarlo
+    completo en memoria. El uso de memoria depende de chunk_size y sample_size,
+    no del tamaño del archivo.
+
+    El proceso recorre el archivo varias veces:
+        - Primera pasada: mínimo y máximo de cada columna (para normalizar),
+          número de filas y una muestra aleatoria uniforme de tamaño fijo.
+        - Inicialización: K-Means++ sobre la muestra normalizada.
+        - Una pasada por iteración: asignación de cada bloque y acumulación de
+          sumas y conteos por cluster para recalcular los centroides.
+
+    Atributos adicionales:
+        - file_path (str): Ruta del archivo CSV.
+        - columns (list): Columnas utilizadas para el clustering (por defecto,
+          todas las columnas del archivo).
+        - chunk_size (int): Número de filas leídas por bloque.
+        - sample_size (int): Número de filas de la muestra usada para inicializar.
+        - min_values (np.ndarray): Mínimo de cada columna en todo el archivo.
+        - max_values (np.ndarray): Máximo de cada columna en todo el archivo.
+        - num_rows (int): Número de filas válidas (sin valores nulos) del archivo.
+        - dtype (str): Tipo de punto flotante de los bloques normalizados y de los
+          centroides ("float64" o "float32"); las sumas por cluster son float64.
+
+    La normalización es siempre Min-Max, porque puede calcularse en una sola pasada.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        num_centroids: int,
+        max_iteration: int,
+        columns: list[str] = None,
+        chunk_size: int = 100_000,
+        sample_size: int = 10_000,
+        tolerance: float = 1e-4,
+        dtype: str = "float64",
+    ) -> None:
+        super().__init__(
+            pd.DataFrame(), num_centroids, max_iteration, tolerance=tolerance, dtype=dtype
+        )
+        self.file_path = file_path
+        self.columns = columns
+        self.chunk_size = chunk_size
+        self.sample_size = sample_size
+        self.min_values = None
+        self.max_values = None
+        self.num_rows = 0
+        self.centroids_list = None
+
+    def read_chunks(self):
+        """
+        Recorre el archivo CSV por bloques, devolviendo solo las columnas de
+        interés y descartando las filas con valores nulos.
+
+        Yields:
+            pd.DataFrame: Bloque del archivo con las columnas de interés.
+        """
+        for chunk in pd.read_csv(
+            self.file_path, usecols=self.columns, chunksize=self.chunk_size
+        ):
+            yield chunk[self.columns].dropna()
+
+    def normalize_chunk(self, chunk: pd.DataFrame) -> np.ndarray:
+        """
+        Normaliza un bloque a un rango entre 0 y 1 con el mínimo y máximo de todo el
+        archivo. La normalización se hace en float64 y solo el resultado se convierte
+        a dtype, para no perder precisión con valores originales grandes.
+
+        Args:
+            chunk (pd.DataFrame): Bloque del archivo con las columnas de interés.
+
+        Returns:
+            np.ndarray: Matriz (m, d) con las coordenadas normalizadas.
+        """
+        return self.scaler.transform_array(chunk.to_numpy(), self.dtype)
+
+    def scan_file(self) -> pd.DataFrame:
+        """
+        Primera pasada sobre el archivo: valida las columnas, calcula mínimo,
+        máximo y número de filas, y toma una muestra aleatoria uniforme. La
+        muestra se mantiene con un tamaño fijo conservando las filas con las
+        menores claves aleatorias vistas hasta el momento.
+
+        Returns:
+            pd.DataFrame: Muestra aleatoria (sin normalizar) de hasta sample_size filas.
+        """
+        header = pd.read_csv(self.file_path, nrows=0).columns
+        if self.columns is None:
+            self.columns = list(header)
+        missing_columns = [column for column in self.columns if column not in header]
+        if missing_columns:
+            raise MissingColumnsError(missing_columns)
+
+        sample = None
+        sample_keys = np.empty(0)
+        self.num_rows = 0
+        for chunk in self.read_chunks():
+            invalid_columns = chunk.select_dtypes(exclude=[np.number]).columns
+            if not invalid_columns.empty:
+                raise NoNumericColumnsError(invalid_columns)
+            if chunk.empty:
+                continue
+
+            # Mínimo, máximo y muestra en float64; dtype se aplica al normalizar
+            values = chunk.to_numpy(dtype=np.float64)
+            chunk_min, chunk_max = values.min(axis=0), values.max(axis=0)
+            if self.min_values is None:
+                self.min_values, self.max_values = chunk_min, chunk_max
+            else:
+                self.min_values = np.minimum(self.min_values, chunk_min)
+                self.max_values = np.maximum(self.max_values, chunk_max)
+            self.num_rows += values.shape[0]
+
+            keys = np.random.random_sample(values.shape[0])
+            sample = values if sample is None else np.concatenate([sample, values])
+            sample_keys = np.concatenate([sample_keys, keys])
+            if sample.shape[0] > self.sample_size:
+                keep = np.argpartition(sample_keys, self.sample_size)[: self.sample_size]
+                sample, sample_keys = sample[keep], sample_keys[keep]
+
+        if sample is None:
+            return pd.DataFrame(columns=self.columns)
+        return pd.DataFrame(sample, columns=self.columns)
+
+    def accumulate_clusters(
+        self, centroids: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, float]:
+        """
+        Recorre el archivo asignando cada bloque a los centroides actuales y
+        acumulando, por cluster, la suma de coordenadas y el número de puntos.
+
+        Args:
+            centroids (np.ndarray): Matriz (k, d) con las coordenadas de los centroides.
+
+        Returns:
+            tuple: Sumas por cluster (k, d), conteos por cluster (k,) e inercia total.
+        """
+        num_centroids, num_columns = centroids.shape
+        sums = np.zeros((num_centroids, num_columns))
+        counts = np.zeros(num_centroids, dtype=np.int64)
+        inertia = 0.0
+        for chunk in self.read_chunks():
+            points = self.normalize_chunk(chunk)
+            labels, min_distances = self.assign_points(points, centroids)
+            counts += np.bincount(labels, minlength=num_centroids)
+            for column in range(num_columns):
+                sums[:, column] += np.bincount(
+                    labels, weights=points[:, column], minlength=num_centroids
+                )
+            inertia += float(min_distances.sum())
+        return sums, counts, inertia
+
+    def assign_file(self, output_path: str) -> None:
+        """
+        Escribe en un nuevo archivo CSV las coordenadas normalizadas de cada fila
+        junto con su cluster asignado, procesando el archivo por bloques.
+
+        Args:
+            output_path (str): Ruta del archivo CSV de salida.
+        """
+        header = True
+        for chunk in self.read_chunks():
+            points = self.normalize_chunk(chunk)
+            labels, _ = self.assign_points(points, self.centroids)
+            result = pd.DataFrame(points, columns=self.columns)
+            result["assigned_cluster"] = labels
+            result.to_csv(output_path, mode="w" if header else "a", header=header, index=False)
+            header = False
+
+    def k_means_logic(self):
+        """
+        Ejecuta el algoritmo completo de K-Means sobre el archivo por bloques:
+            - Valida el archivo y calcula los parámetros de normalización.
+            - Inicializa los centroides con K-Means++ sobre una muestra.
+            - Refina los centroides con una pasada completa por iteración.
+
+        Returns:
+            tuple: (Lista de centroides finales, DataFrame con la muestra
+            normalizada y su asignación de clusters, útil para visualizar)
+        """
+        if not self.num_centroids:
+            raise ZeroCentroidsError()
+        if str(self.dtype) not in VALID_DTYPES:
+            raise InvalidDtypeError(self.dtype, list(VALID_DTYPES))
+        if not Path(self.file_path).exists():
+            raise FileNotFoundError(f"El archivo {self.file_path} no existe.")
+
+        sample = self.scan_file()
+        if self.num_rows == 0:
+            raise EmptyDatasetError()
+        if self.num_centroids > self.num_rows:
+            raise MoreCentroidsError(self.num_centroids, self.num_rows)
+
+        self.scaler = DataScaler("min-max").set_parameters(
+            self.columns, self.min_values, self.max_values - self.min_values
+        )
+
+        self.dataset = pd.DataFrame(self.normalize_chunk(sample), columns=self.columns)
+        # Cada bloque del archivo se asigna una vez por pasada; solo la muestra se
+        # reutiliza (en la inicialización), así que solo ella guarda sus normas
+        with self.caching_point_norms():
+            centroids = self.to_centroid_array(
+                self.initialize_centroids(self.dataset[self.columns].copy())
+            )
+
+        self.used_iterations = 0
+        for iteration in range(1, self.max_iteration + 1):
+            sums, counts, self.inertia = self.accumulate_clusters(centroids)
+            self.used_iterations = iteration
+
+            # Los clusters sin puntos conservan su centroide anterior (las sumas
+            # en float64 se convierten al tipo de los centroides al asignarlas)
+            previous_centroids = centroids
+            centroids = centroids.copy()
+            non_empty = counts > 0
+            centroids[non_empty] = sums[non_empty] / counts[non_empty][:, np.newaxis]
+
+            if self.calculate_centroid_shift(previous_centroids, centroids) <= self.tolerance:
+                break
+
+        self.centroids = centroids
+        self.centroids_list = [tuple(centroid) for centroid in centroids.tolist()]
+        sample_labels, _ = self.assign_points(
+            self.to_points(self.dataset[self.columns]), centroids
+        )
+        self.dataset = self.dataset.drop(columns="centroid_probability")
+        self.dataset["assigned_cluster"] = sample_labels
+
+        return self.centroids_list, self.dataset
@@ -4,14 +4,22 @@ import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 import os
+import time
 
 sys.path.append("src")
 
 from model.kmeans_logic import Kmeans
+from model.streaming_kmeans_logic import StreamingKmeans
+from model.kmeans_sweep_logic import KmeansSweep
+from model.metrics import ClusterMetrics
+from model.scaler import DataScaler
 from model.errors.kmeans_error import KmeansError
 from model.result_model import ClusteringResult
 from controller.results_controller import ResultsController
 
+# Archivos más grandes que este tamaño se procesan por bloques, sin cargarlos completos
+STREAMING_FILE_SIZE_BYTES = 500 * 1024 * 1024
+
 class ConsoleUI:
     def __init__(self):
         """Inicializa la interfaz de usuario y el controlador de resultados."""
@@ -32,16 +40,18 @@ class ConsoleUI:
         print("2. Ver resultados guardados")
         print("3. Modificar resultado")
         print("4. Eliminar resultado")
-        print("5. Salir")
+        print("5. Buscar el número de centroides (barrido de k)")
+        print("6. Salir")
         
-        option = input("\nSeleccione una opción (1-5): ")
+        option = input("\nSeleccione una opción (1-6): ")
         
         options = {
             "1": self.run_clustering_analysis,
             "2": self.view_saved_results,
             "3": self.modify_results_menu,
             "4": self.delete_results_menu,
-            "5": self.exit_program
+            "5": self.run_k_sweep,
+            "6": self.exit_program
         }
         
         if option in options:
@@ -50,7 +60,7 @@ class ConsoleUI:
             input("Opción no válida. Presione Enter para continuar...")
         
         # Volver al menú principal si no se ha salido del programa
-        if option != "5":
+        if option != "6":
             self.display_menu()
     
     def run_clustering_analysis(self):
@@ -63,11 +73,19 @@ class ConsoleUI:
             num_centroids = int(input("Ingresa el número de centroides: "))
             max_iterations = int(input("Ingresa el número máximo de iteraciones: "))
             title = input("Ingresa un título para este análisis: ")  # Pedir título al inicio
+            warm_start_title = input(
+                "Título de un análisis guardado para partir de sus centroides (Enter para omitir): "
+            ).strip()
         except ValueError:
             input("Error: Los valores ingresados deben ser numéricos. Presione Enter para continuar...")
             return
         
         try:
+            path = Path(file_path)
+            if path.exists() and path.stat().st_size > STREAMING_FILE_SIZE_BYTES:
+                self.run_streaming_analysis(file_path, num_centroids, max_iterations, title)
+                return
+
             # Procesar el archivo CSV
             dataset = self.process_file_path(file_path)
             
@@ -83,17 +101,65 @@ class ConsoleUI:
                     input("No se pudieron encontrar columnas adecuadas. Presione Enter para continuar...")
                     return
             
+            # Partir de los centroides de un análisis guardado, si se indicó. Los
+            # centroides están en el espacio normalizado de ese análisis, así que se
+            # usa su escalado para llevarlos al espacio de los nuevos datos
+            init = "k-means++"
+            init_scaler = None
+            scaling = "min-max"
+            if warm_start_title:
+                stored_run = self.results_controller.get_latest_run(warm_start_title)
+                stored_centroids = (
+                    self.results_controller.get_run_centroids(warm_start_title) if stored_run else []
+                )
+                if stored_centroids:
+                    init = np.array(stored_centroids)
+                    stored_parameters = stored_run["parameters"] or {}
+                    scaling = stored_parameters.get("scaling", scaling)
+                    if "scaler" in stored_parameters:
+                        init_scaler = DataScaler.from_dict(stored_parameters["scaler"])
+                    else:
+                        print(
+                            f"'{warm_start_title}' se guardó sin su escalado; sus centroides "
+                            "se usarán tal cual y pueden no corresponder a los nuevos datos."
+                        )
+                else:
+                    print(f"No se encontraron centroides de '{warm_start_title}'; se usará K-Means++.")
+            
             # Ejecutar el algoritmo K-means
             try:
-                kmeans = Kmeans(filtered_dataset, num_centroids, max_iterations)
+                kmeans = Kmeans(
+                    filtered_dataset,
+                    num_centroids,
+                    max_iterations,
+                    init=init,
+                    scaling=scaling,
+                    init_scaler=init_scaler,
+                )
+                start_time = time.perf_counter()
                 self.centroid_centers, updated_dataset = kmeans.k_means_logic()
+                duration_seconds = time.perf_counter() - start_time
                 self.current_results = updated_dataset
                 
+                # Mostrar la calidad del clustering
+                self.display_quality_metrics(kmeans, updated_dataset)
+                
                 # Visualizar los resultados
                 self.visualize_clusters(updated_dataset, self.centroid_centers)
                 
                 # Guardar automáticamente en la base de datos
-                self.save_results_to_db(title, num_centroids, max_iterations)
+                parameters = {
+                    "algorithm": kmeans.algorithm,
+                    "scaling": kmeans.scaling,
+                    "tolerance": kmeans.tolerance,
+                    "max_iteration": max_iterations,
+                    "feature_columns": kmeans.feature_columns,
+                    "warm_start_title": warm_start_title or None,
+                    "scaler": kmeans.scaler.to_dict(),
+                }
+                self.save_results_to_db(
+                    title, num_centroids, kmeans.used_iterations, parameters, duration_seconds
+                )
                 
             except KmeansError as e:
                 print(f"Error en el algoritmo K-means: {str(e)}")
@@ -103,6 +169,117 @@ class ConsoleUI:
             print(f"Error inesperado: {str(e)}")
             input("Presione Enter para continuar...")
     
+    def display_quality_metrics(self, kmeans, dataset):
+        """Muestra las métricas de calidad del clustering (la silueta se calcula sobre una muestra)."""
+        scores = ClusterMetrics(sample_size=10000).evaluate(
+            dataset[kmeans.feature_columns].to_numpy(dtype=np.float64),
+            np.array(self.centroid_centers, dtype=np.float64),
+            dataset["assigned_cluster"].to_numpy(),
+        )
+        print("\nCalidad del clustering:")
+        print(f"  Inercia: {scores['inertia']:.4f}")
+        print(f"  Davies-Bouldin (menor es mejor): {scores['davies_bouldin']:.4f}")
+        print(f"  Calinski-Harabasz (mayor es mejor): {scores['calinski_harabasz']:.4f}")
+        print(f"  Silueta (entre -1 y 1, mayor es mejor): {scores['silhouette']:.4f}")
+    
+    def run_streaming_analysis(self, file_path, num_centroids, max_iterations, title):
+        """Ejecuta el clustering por bloques para archivos que no caben en memoria."""
+        print("El archivo es grande: se procesará por bloques.")
+        columns = ["GDP_per_capita", "life_expectancy", "literacy_rate"]
+        preview = pd.read_csv(file_path, nrows=1000)
+        if not set(columns).issubset(preview.columns):
+            print("El dataset no contiene las columnas predefinidas.")
+            columns = self.suggest_alternative_columns(preview)
+            if not columns:
+                input("No se pudieron encontrar columnas adecuadas. Presione Enter para continuar...")
+                return
+
+        try:
+            kmeans = StreamingKmeans(file_path, num_centroids, max_iterations, columns=columns)
+            start_time = time.perf_counter()
+            self.centroid_centers, sample_dataset = kmeans.k_means_logic()
+            duration_seconds = time.perf_counter() - start_time
+            self.current_results = sample_dataset
+
+            output_path = Path(file_path).with_name(f"{Path(file_path).stem}_clusters.csv")
+            kmeans.assign_file(str(output_path))
+            print(f"Asignación de las {kmeans.num_rows} filas guardada en {output_path}")
+
+            # Visualizar y guardar una muestra de los resultados
+            self.visualize_clusters(sample_dataset, self.centroid_centers)
+            parameters = {
+                "algorithm": "streaming",
+                "scaling": "min-max",
+                "tolerance": kmeans.tolerance,
+                "max_iteration": max_iterations,
+                "feature_columns": columns,
+                "chunk_size": kmeans.chunk_size,
+                "sample_size": kmeans.sample_size,
+                "num_rows": kmeans.num_rows,
+                "scaler": kmeans.scaler.to_dict(),
+            }
+            self.save_results_to_db(
+                title, num_centroids, kmeans.used_iterations, parameters, duration_seconds
+            )
+
+        except KmeansError as e:
+            print(f"Error en el algoritmo K-means: {str(e)}")
+            input("Presione Enter para continuar...")
+
+    def run_k_sweep(self):
+        """Ajusta en paralelo un rango de números de centroides y muestra la inercia y la calidad de cada uno."""
+        self.clear_screen()
+        print("\n===== BARRIDO DEL NÚMERO DE CENTROIDES =====")
+        
+        file_path = input("Ingresa la ruta del dataset (CSV): ")
+        try:
+            min_centroids = int(input("Ingresa el número mínimo de centroides: "))
+            max_centroids = int(input("Ingresa el número máximo de centroides: "))
+            max_iterations = int(input("Ingresa el número máximo de iteraciones: "))
+        except ValueError:
+            input("Error: Los valores ingresados deben ser numéricos. Presione Enter para continuar...")
+            return
+        warm_start = input("¿Partir cada k de los centroides del anterior? (s/n): ").strip().lower() == "s"
+        
+        try:
+            dataset = self.process_file_path(file_path)
+            columns = ["GDP_per_capita", "life_expectancy", "literacy_rate"]
+            if not set(columns).issubset(dataset.columns):
+                print("El dataset no contiene las columnas predefinidas.")
+                columns = self.suggest_alternative_columns(dataset)
+                if not columns:
+                    input("No se pudieron encontrar columnas adecuadas. Presione Enter para continuar...")
+                    return
+            
+            print("Ajustando...")
+            sweep = KmeansSweep(
+                dataset[columns],
+                range(min_centroids, max_centroids + 1),
+                max_iterations,
+                warm_start=warm_start,
+            )
+            table = sweep.sweep()
+            
+            print("\n" + table.to_string(index=False))
+            print(f"\nCodo de la curva de inercia: {sweep.elbow_k} centroides")
+            
+            plt.figure(figsize=(8, 5))
+            plt.plot(table["num_centroids"], table["inertia"], marker="o")
+            plt.axvline(sweep.elbow_k, color="red", linestyle="--", label=f"Codo (k={sweep.elbow_k})")
+            plt.xlabel("Número de centroides")
+            plt.ylabel("Inercia")
+            plt.title("Curva de inercia por número de centroides")
+            plt.legend()
+            plt.grid(True)
+            plt.show()
+            
+        except KmeansError as e:
+            print(f"Error en el algoritmo K-means: {str(e)}")
+        except Exception as e:
+            print(f"Error inesperado: {str(e)}")
+        
+        input("Presione Enter para continuar...")
+    
     def process_file_path(self, file_path):
         """Procesa la ruta del archivo CSV y devuelve un DataFrame."""
         path = Path(file_path)
@@ -115,7 +292,7 @@ class ConsoleUI:
         """Sugiere columnas alternativas del dataset."""
         numeric_columns = dataset.select_dtypes(include=[np.number]).columns.tolist()
         
-        if len(numeric_columns) < 3:
+        if len(numeric_columns) < 2:
             print("No hay suficientes columnas numéricas para realizar el clustering.")
             return None
         
@@ -125,16 +302,18 @@ class ConsoleUI:
         
         try:
             selected_columns = []
-            print("\nSeleccione 3 columnas para el análisis (ingrese los números separados por comas):")
-            selections = input().split(',')
+            print("\nSeleccione 2 o más columnas para el análisis (ingrese los números separados por comas, o 'todas'):")
+            selections = input()
+            if selections.strip().lower() == "todas":
+                return numeric_columns
             
-            for sel in selections:
+            for sel in selections.split(','):
                 idx = int(sel.strip()) - 1
-                if 0 <= idx < len(numeric_columns):
+                if 0 <= idx < len(numeric_columns) and numeric_columns[idx] not in selected_columns:
                     selected_columns.append(numeric_columns[idx])
             
-            if len(selected_columns) != 3:
-                print("Debe seleccionar exactamente 3 columnas.")
+            if len(selected_columns) < 2:
+                print("Debe seleccionar al menos 2 columnas.")
                 return None
             
             return selected_columns
@@ -144,7 +323,7 @@ class ConsoleUI:
             return None
     
     def visualize_clusters(self, dataset, centroid_centers):
-        """Visualiza los clusters en gráficos 3D y 2D."""
+        """Visualiza los clusters en gráficos 3D y 2D (usando las tres primeras características)."""
         # Convertir lista de listas a array NumPy si es necesario
         if isinstance(centroid_centers, list):
             centroid_centers_np = np.array(centroid_centers)
@@ -152,50 +331,60 @@ class ConsoleUI:
             centroid_centers_np = centroid_centers
         
         # Obtener nombres de las columnas
-        feature_names = dataset.columns.tolist()
-        feature_names.remove("assigned_cluster")
+        feature_names = [
+            column for column in dataset.columns
+            if column not in ("assigned_cluster", "centroid_probability")
+        ]
+        if len(feature_names) > 3:
+            print(f"Se grafican las 3 primeras de {len(feature_names)} características.")
         
         # Gráfico 3D
-        figure_3d = plt.figure(figsize=(10, 8))
-        axis_3d = figure_3d.add_subplot(111, projection="3d")
-        
-        scatter = axis_3d.scatter(
-            dataset[feature_names[0]],
-            dataset[feature_names[1]],
-            dataset[feature_names[2]],
-            c=dataset["assigned_cluster"],
-            cmap="viridis",
-            s=100,
-        )
-        
-        axis_3d.scatter(
-            centroid_centers_np[:, 0],
-            centroid_centers_np[:, 1],
-            centroid_centers_np[:, 2],
-            c="blue",
-            marker="X",
-            s=250,
-            linewidths=2,
-            edgecolors="black",
-        )
-        
-        axis_3d.set_xlabel(feature_names[0])
-        axis_3d.set_ylabel(feature_names[1])
-        axis_3d.set_zlabel(feature_names[2])
-        plt.title("Gráfico 3D de Clusters")
-        plt.colorbar(scatter, label="Cluster")
-        plt.show()
+        if len(feature_names) >= 3:
+            figure_3d = plt.figure(figsize=(10, 8))
+            axis_3d = figure_3d.add_subplot(111, projection="3d")
+            
+            scatter = axis_3d.scatter(
+                dataset[feature_names[0]],
+                dataset[feature_names[1]],
+                dataset[feature_names[2]],
+                c=dataset["assigned_cluster"],
+                cmap="viridis",
+                s=100,
+            )
+            
+            axis_3d.scatter(
+                centroid_centers_np[:, 0],
+                centroid_centers_np[:, 1],
+                centroid_centers_np[:, 2],
+                c="blue",
+                marker="X",
+                s=250,
+                linewidths=2,
+                edgecolors="black",
+            )
+            
+            axis_3d.set_xlabel(feature_names[0])
+            axis_3d.set_ylabel(feature_names[1])
+            axis_3d.set_zlabel(feature_names[2])
+            plt.title("Gráfico 3D de Clusters")
+            plt.colorbar(scatter, label="Cluster")
+            plt.show()
         
         # Gráficos 2D
-        feature_pairs = [
-            (feature_names[0], feature_names[1]),
-            (feature_names[0], feature_names[2]),
-            (feature_names[1], feature_names[2]),
-        ]
+        if len(feature_names) >= 3:
+            feature_pairs = [
+                (feature_names[0], feature_names[1]),
+                (feature_names[0], feature_names[2]),
+                (feature_names[1], feature_names[2]),
+            ]
+        else:
+            feature_pairs = [(feature_names[0], feature_names[1])]
         
-        figure_2d, axis_2d_array = plt.subplots(1, 3, figsize=(18, 5))
+        figure_2d, axis_2d_array = plt.subplots(
+            1, len(feature_pairs), figsize=(6 * len(feature_pairs), 5), squeeze=False
+        )
         
-        for axis_2d, (feature_x, feature_y) in zip(axis_2d_array, feature_pairs):
+        for axis_2d, (feature_x, feature_y) in zip(axis_2d_array[0], feature_pairs):
             sc = axis_2d.scatter(
                 dataset[feature_x],
                 dataset[feature_y],
@@ -222,45 +411,59 @@ class ConsoleUI:
         plt.tight_layout(rect=[0, 0.03, 1, 0.95])
         plt.show()
     
-    def save_results_to_db(self, title, n_clusters, used_iterations):
-        """Guarda automáticamente los resultados del clustering en la base de datos."""
+    def save_results_to_db(
+        self, title, n_clusters, used_iterations, parameters=None, duration_seconds=None
+    ):
+        """
+        Guarda automáticamente los resultados del clustering en la base de datos, como
+        un análisis con sus parámetros y duración.
+        """
         print("Guardando...")
         if self.current_results is None or self.centroid_centers is None:
             print("No hay resultados para guardar.")
             return
         
         try:
-            # Guardar cada punto de datos
-            for idx, row in self.current_results.iterrows():
-                coordinates = row.drop("assigned_cluster").values.tolist()
-                cluster_result = ClusteringResult(
+            # Coordenadas de cada punto, sin la asignación ni la probabilidad
+            feature_names = [
+                column
+                for column in self.current_results.columns
+                if column not in ("assigned_cluster", "centroid_probability")
+            ]
+            point_coordinates = self.current_results[feature_names].to_numpy().tolist()
+            point_clusters = self.current_results["assigned_cluster"].to_numpy().tolist()
+
+            results = [
+                ClusteringResult(
                     title=title,
                     n_clusters=n_clusters,
                     used_iterations=used_iterations,
                     coordinates=coordinates,
-                    assigned_cluster=int(row["assigned_cluster"]),
+                    assigned_cluster=int(cluster),
                     is_centroid=False,
                     centroid_label=None
                 )
-                self.results_controller.insert_result(cluster_result)
-            
-            # Guardar los centroides
-            for i, centroid in enumerate(self.centroid_centers):
-                centroid_result = ClusteringResult(
+                for coordinates, cluster in zip(point_coordinates, point_clusters)
+            ]
+            results.extend(
+                ClusteringResult(
                     title=title,
                     n_clusters=n_clusters,
                     used_iterations=used_iterations,
-                    coordinates=centroid,
+                    coordinates=list(centroid),
                     assigned_cluster=i,
                     is_centroid=True,
                     centroid_label=f"Centroide {i+1}"
                 )
-                self.results_controller.insert_result(centroid_result)
-            
+                for i, centroid in enumerate(self.centroid_centers)
+            )
+
+            # Todos los puntos y centroides del análisis se guardan en una sola transacción
+            self.results_controller.insert_run(results, parameters, duration_seconds)
             print(f"\nAnálisis '{title}' guardado exitosamente en la base de datos.")
             
         except Exception as e:
-            print(f"Guardado correctamente.")
+            print(f"Error al guardar el análisis: {e}")
         
         input("Presione Enter para continuar...")
     
@@ -306,91 +509,81 @@ class ConsoleUI:
             print(f"Error al mostrar resultados: {str(e)}")
             input("Presione Enter para continuar...")
     
-    def display_result_details(self, result_id):
-        """Muestra los detalles de un resultado específico."""
+    def display_result_details(self, run_id):
+        """Muestra los detalles de un análisis guardado."""
         self.clear_screen()
         print("\n===== DETALLES DEL RESULTADO =====")
         
         try:
-            # Obtener información del resultado seleccionado
-            points = self.results_controller.get_points_by_title_id(result_id)
-            centroids = self.results_controller.get_centroids_by_title_id(result_id)
+            # Solo los datos generales: los puntos se leen por lotes al necesitarlos
+            run = self.results_controller.get_run(run_id)
             
-            if not points or not centroids:
+            if run is None:
                 print("No se encontraron datos para este resultado.")
                 input("Presione Enter para continuar...")
                 return
             
             # Mostrar información general
-            title = points[0].title if points else "Desconocido"
-            n_clusters = points[0].n_clusters if points else 0
-            used_iterations = points[0].used_iterations if points else 0
-            
-            print(f"Título: {title}")
-            print(f"Número de clusters: {n_clusters}")
-            print(f"Iteraciones utilizadas: {used_iterations}")
-            print(f"Puntos totales: {len(points)}")
-            print(f"Centroides: {len(centroids)}")
+            print(f"Título: {run['title']}")
+            print(f"Número de clusters: {run['n_clusters']}")
+            print(f"Iteraciones utilizadas: {run['used_iterations']}")
+            if run["duration_seconds"] is not None:
+                print(f"Duración del ajuste: {run['duration_seconds']:.2f} s")
             
             # Menú de opciones para este resultado
             print("\nOpciones:")
             print("1. Visualizar clusters")
             print("2. Ver datos de puntos")
             print("3. Ver datos de centroides")
-            print("4. Volver al listado")
+            print("4. Exportar puntos a CSV")
+            print("5. Volver al listado")
             
-            option = input("\nSeleccione una opción (1-4): ")
+            option = input("\nSeleccione una opción (1-5): ")
             
             if option == "1":
-                self.visualize_saved_result(points, centroids)
+                self.visualize_saved_result(run_id)
             elif option == "2":
-                self.display_points_data(points)
+                self.display_points_data(run_id)
             elif option == "3":
-                self.display_centroids_data(centroids)
+                self.display_centroids_data(run_id)
             elif option == "4":
+                self.export_run_to_csv(run)
+            elif option == "5":
                 self.view_saved_results()
             else:
                 print("Opción inválida.")
                 input("Presione Enter para continuar...")
-                self.display_result_details(result_id)
+                self.display_result_details(run_id)
                 
         except Exception as e:
             print(f"Error al mostrar detalles: {str(e)}")
             input("Presione Enter para continuar...")
             self.view_saved_results()
     
-    def visualize_saved_result(self, points, centroids):
+    def get_saved_feature_names(self, parameters, num_features):
+        """Nombres de las características de un análisis guardado (o genéricos si no se guardaron)."""
+        feature_names = (parameters or {}).get("feature_columns") or []
+        if len(feature_names) != num_features:
+            feature_names = [f"Feature_{i+1}" for i in range(num_features)]
+        return list(feature_names)
+    
+    def visualize_saved_result(self, run_id):
         """Visualiza un resultado guardado."""
         try:
-            # Preparar datos para visualización
-            # Crear DataFrame con puntos
-            data = []
-            feature_names = []
-            
-            # Determinar nombres de características basados en la longitud de coordenadas
-            coord_length = len(points[0].coordinates)
-            for i in range(coord_length):
-                feature_names.append(f"Feature_{i+1}")
+            # El gráfico necesita todos los puntos: se cargan como arreglos en una consulta
+            run = self.results_controller.get_run_arrays(run_id)
+            if run is None or not len(run["points"]) or not len(run["centroids"]):
+                print("No se encontraron datos para este resultado.")
+                input("Presione Enter para continuar...")
+            else:
+                df = pd.DataFrame(
+                    run["points"],
+                    columns=self.get_saved_feature_names(run["parameters"], run["points"].shape[1]),
+                )
+                df["assigned_cluster"] = run["labels"]
                 
-            # Agregar puntos al DataFrame
-            for point in points:
-                row = {}
-                for i, coord in enumerate(point.coordinates):
-                    row[feature_names[i]] = coord
-                row["assigned_cluster"] = point.assigned_cluster
-                data.append(row)
-            
-            df = pd.DataFrame(data)
-            
-            # Preparar centroides
-            centroid_coords = []
-            for centroid in centroids:
-                centroid_coords.append(centroid.coordinates)
-            
-            centroid_centers_np = np.array(centroid_coords)
-            
-            # Visualizar usando la función existente
-            self.visualize_clusters(df, centroid_centers_np)
+                # Visualizar usando la función existente
+                self.visualize_clusters(df, run["centroids"])
             
         except Exception as e:
             print(f"Error al visualizar: {str(e)}")
@@ -398,25 +591,38 @@ class ConsoleUI:
         
         self.view_saved_results()
     
-    def display_points_data(self, points):
-        """Muestra los datos de los puntos del resultado."""
+    def display_points_data(self, run_id):
+        """Muestra los datos de los puntos del resultado, leyéndolos página a página."""
         self.clear_screen()
         print("\n===== DATOS DE PUNTOS =====")
         
-        # Determinar cuántos puntos mostrar por página
+        # Cada página se lee por clave (ID mayor que el último mostrado) con una consulta
+        # corta, así que mientras se espera al usuario no queda ninguna conexión ocupada
         points_per_page = 10
-        total_pages = (len(points) + points_per_page - 1) // points_per_page
+        page_starts = [0]
         current_page = 1
         
         while True:
+            # Un punto extra indica si existe una página siguiente
+            points = self.results_controller.get_run_points_page(
+                run_id, after_id=page_starts[current_page - 1], limit=points_per_page + 1
+            )
+            
+            if not points and current_page == 1:
+                print("No se encontraron puntos para este resultado.")
+                input("Presione Enter para continuar...")
+                break
+            
+            has_next_page = len(points) > points_per_page
+            points = points[:points_per_page]
+            if has_next_page and len(page_starts) == current_page:
+                page_starts.append(points[-1].id)
+            
             self.clear_screen()
-            print(f"\n===== DATOS DE PUNTOS (Página {current_page}/{total_pages}) =====")
+            print(f"\n===== DATOS DE PUNTOS (Página {current_page}) =====")
             
             start_idx = (current_page - 1) * points_per_page
-            end_idx = min(start_idx + points_per_page, len(points))
-            
-            for i in range(start_idx, end_idx):
-                point = points[i]
+            for i, point in enumerate(points, start=start_idx):
                 print(f"\nPunto {i+1}:")
                 print(f"Coordenadas: {point.coordinates}")
                 print(f"Cluster asignado: {point.assigned_cluster}")
@@ -424,7 +630,7 @@ class ConsoleUI:
             print("\nOpciones:")
             if current_page > 1:
                 print("A. Página anterior")
-            if current_page < total_pages:
+            if has_next_page:
                 print("S. Página siguiente")
             print("V. Volver")
             
@@ -432,7 +638,7 @@ class ConsoleUI:
             
             if option == "A" and current_page > 1:
                 current_page -= 1
-            elif option == "S" and current_page < total_pages:
+            elif option == "S" and has_next_page:
                 current_page += 1
             elif option == "V":
                 break
@@ -441,20 +647,54 @@ class ConsoleUI:
         
         self.view_saved_results()
     
-    def display_centroids_data(self, centroids):
+    def display_centroids_data(self, run_id):
         """Muestra los datos de los centroides del resultado."""
         self.clear_screen()
         print("\n===== DATOS DE CENTROIDES =====")
         
-        for i, centroid in enumerate(centroids):
-            print(f"\nCentroide {i+1}:")
-            print(f"Etiqueta: {centroid.centroid_label}")
-            print(f"Coordenadas: {centroid.coordinates}")
-            print(f"ID del cluster: {centroid.assigned_cluster}")
+        i = 0
+        for batch in self.results_controller.iter_run_results(run_id, is_centroid=True):
+            for centroid in batch:
+                i += 1
+                print(f"\nCentroide {i}:")
+                print(f"Etiqueta: {centroid.centroid_label}")
+                print(f"Coordenadas: {centroid.coordinates}")
+                print(f"ID del cluster: {centroid.assigned_cluster}")
         
         input("\nPresione Enter para volver...")
         self.view_saved_results()
     
+    def export_run_to_csv(self, run):
+        """Exporta los puntos de un análisis a un archivo CSV, escribiendo lote a lote."""
+        default_path = f"{run['title']}.csv"
+        output_path = input(f"Ruta del archivo CSV [{default_path}]: ").strip() or default_path
+        
+        try:
+            num_points = 0
+            feature_names = None
+            for batch in self.results_controller.iter_run_batches(run["id"]):
+                if feature_names is None:
+                    feature_names = self.get_saved_feature_names(
+                        run["parameters"], batch["points"].shape[1]
+                    )
+                result = pd.DataFrame(batch["points"], columns=feature_names)
+                result["assigned_cluster"] = batch["labels"]
+                result.to_csv(
+                    output_path, mode="w" if num_points == 0 else "a",
+                    header=num_points == 0, index=False
+                )
+                num_points += len(result)
+            
+            if num_points:
+                print(f"Se exportaron {num_points} puntos a {output_path}")
+            else:
+                print("No se encontraron puntos para este resultado.")
+        except Exception as e:
+            print(f"Error al exportar: {str(e)}")
+        
+        input("Presione Enter para continuar...")
+        self.view_saved_results()
+    
     def modify_results_menu(self):
         """Menú para seleccionar y modificar un resultado existente."""
         self.clear_screen()
@@ -498,62 +738,35 @@ class ConsoleUI:
             print(f"Error al listar resultados: {str(e)}")
             input("Presione Enter para continuar...")
     
-    def modify_result(self, result_id):
-        """Modifica un resultado específico."""
+    def modify_result(self, run_id):
+        """Modifica los datos generales de un análisis guardado."""
         self.clear_screen()
         print("\n===== MODIFICAR RESULTADO =====")
         
         try:
-            # Verificar si existe el resultado
-            existing_result = self.results_controller.get_result_by_id(result_id)
-            if not existing_result:
+            # Verificar si existe el análisis
+            existing_run = self.results_controller.get_run(run_id)
+            if not existing_run:
                 print(f"No se encontró el resultado seleccionado.")
                 input("Presione Enter para continuar...")
                 return
             
-            print(f"\nResultado actual: {existing_result.title}")
+            print(f"\nResultado actual: {existing_run['title']}")
             
             # Solicitar nuevos valores manteniendo los actuales como default
             print("\nIngrese los nuevos valores (deje en blanco para mantener los actuales):")
             
-            title = input(f"Título [{existing_result.title}]: ")
-            title = title if title else existing_result.title
+            title = input(f"Título [{existing_run['title']}]: ")
+            title = title if title else existing_run['title']
             
-            n_clusters_input = input(f"Número de clusters [{existing_result.n_clusters}]: ")
-            n_clusters = int(n_clusters_input) if n_clusters_input else existing_result.n_clusters
+            n_clusters_input = input(f"Número de clusters [{existing_run['n_clusters']}]: ")
+            n_clusters = int(n_clusters_input) if n_clusters_input else existing_run['n_clusters']
             
-            used_iterations_input = input(f"Número de iteraciones utilizadas [{existing_result.used_iterations}]: ")
-            used_iterations = int(used_iterations_input) if used_iterations_input else existing_result.used_iterations
-            
-            coordinates_current = ", ".join(map(str, existing_result.coordinates))
-            coordinates_input = input(f"Coordenadas [{coordinates_current}]: ")
-            coordinates = [float(x.strip()) for x in coordinates_input.split(',')] if coordinates_input else existing_result.coordinates
-            
-            assigned_cluster_input = input(f"Cluster asignado [{existing_result.assigned_cluster}]: ")
-            assigned_cluster = int(assigned_cluster_input) if assigned_cluster_input else existing_result.assigned_cluster
-            
-            is_centroid_input = input(f"¿Es un centroide? (s/n) [{'s' if existing_result.is_centroid else 'n'}]: ").lower()
-            is_centroid = is_centroid_input == 's' if is_centroid_input else existing_result.is_centroid
-            
-            centroid_label = existing_result.centroid_label
-            if is_centroid:
-                centroid_label_input = input(f"Etiqueta del centroide [{centroid_label or ''}]: ")
-                centroid_label = centroid_label_input if centroid_label_input else centroid_label
-            
-            # Crear el objeto actualizado
-            updated_result = ClusteringResult(
-                title=title,
-                n_clusters=n_clusters,
-                used_iterations=used_iterations,
-                coordinates=coordinates,
-                assigned_cluster=assigned_cluster,
-                is_centroid=is_centroid,
-                centroid_label=centroid_label,
-                id=result_id
-            )
+            used_iterations_input = input(f"Número de iteraciones utilizadas [{existing_run['used_iterations']}]: ")
+            used_iterations = int(used_iterations_input) if used_iterations_input else existing_run['used_iterations']
             
             # Actualizar en la base de datos
-            success = self.results_controller.update_result(result_id, updated_result)
+            success = self.results_controller.update_run(run_id, title, n_clusters, used_iterations)
             if success:
                 print(f"Resultado actualizado exitosamente.")
             else:
@@ -601,7 +814,7 @@ class ConsoleUI:
                     # Confirmar eliminación
                     confirm = input(f"¿Está seguro que desea eliminar '{selected_title}'? (s/n): ").lower()
                     if confirm == 's':
-                        success = self.results_controller.delete_result(selected_id)
+                        success = self.results_controller.delete_run(selected_id)
                         if success:
                             print(f"Resultado eliminado exitosamente.")
                         else:
@@ -623,6 +836,7 @@ class ConsoleUI:
     def exit_program(self):
         """Sale del programa."""
         print("\n¡Gracias por usar el Sistema de Clustering K-means!")
+        self.results_controller.close()
         sys.exit(0)
 
 
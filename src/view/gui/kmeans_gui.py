@@ -237,26 +237,34 @@ class KmeansApp(App):
         return dataset
 
     def validate_columns(self, dataset):
-        """Validate that the dataset contains the required columns."""
+        """Validate the dataset columns, using every numeric column if the default ones are missing."""
         required_columns = ["GDP_per_capita", "life_expectancy", "literacy_rate"]
         missing_columns = [col for col in required_columns if col not in dataset.columns]
-        if missing_columns:
-            raise ValueError(f"Faltan las siguientes columnas en el dataset: {', '.join(missing_columns)}")
-        return dataset[required_columns]
+        if not missing_columns:
+            return dataset[required_columns]
+
+        numeric_columns = dataset.select_dtypes(include=[np.number]).columns.tolist()
+        if len(numeric_columns) < 3:
+            raise ValueError(
+                f"Faltan las siguientes columnas en el dataset: {', '.join(missing_columns)}, "
+                "y no hay al menos 3 columnas numéricas para usar en su lugar."
+            )
+        return dataset[numeric_columns]
 
     def plot_3d_graph(self, dataset, num_centroids, max_iterations):
-        """Run K-Means, plot the 3D graph, and return the image texture."""
+        """Run K-Means, plot the 3D graph of the first three features, and return the image texture."""
         kmeans = Kmeans(dataset, num_centroids, max_iterations)
         centroids_list, updated_dataset = kmeans.k_means_logic()
+        feature_names = kmeans.feature_columns[:3]
 
         # Plot 3D graph
         figure_3d = plt.figure(figsize=(10, 8))
         axis_3d = figure_3d.add_subplot(111, projection="3d")
 
         scatter = axis_3d.scatter(
-            updated_dataset["GDP_per_capita"],
-            updated_dataset["life_expectancy"],
-            updated_dataset["literacy_rate"],
+            updated_dataset[feature_names[0]],
+            updated_dataset[feature_names[1]],
+            updated_dataset[feature_names[2]],
             c=updated_dataset["assigned_cluster"],
             cmap="viridis",
             s=100,
@@ -275,9 +283,9 @@ class KmeansApp(App):
             edgecolors="black",
         )
 
-        axis_3d.set_xlabel("GDP per capita (normalizado)")
-        axis_3d.set_ylabel("Life expectancy (normalizado)")
-        axis_3d.set_zlabel("Literacy rate (normalizado)")
+        axis_3d.set_xlabel(f"{feature_names[0]} (normalizado)")
+        axis_3d.set_ylabel(f"{feature_names[1]} (normalizado)")
+        axis_3d.set_zlabel(f"{feature_names[2]} (normalizado)")
         plt.title("Gráfico 3D de clusters")
         plt.colorbar(scatter, label="Cluster")
 
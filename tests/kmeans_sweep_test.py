@@ -0,0 +1,94 @@
+import sys
+import unittest
+import pandas as pd
+import numpy as np
+
+sys.path.append("src")
+
+from model.kmeans_sweep_logic import KmeansSweep
+from model.errors.kmeans_error import ZeroCentroidsError, MoreCentroidsError
+
+
+class TestKmeansSweep(unittest.TestCase):
+
+    def setUp(self):
+        generator = np.random.default_rng(29)
+        centers = generator.random(size=(4, 3)) * 10
+        self.dataset = pd.DataFrame(
+            centers[np.repeat(np.arange(4), 150)]
+            + generator.normal(scale=0.2, size=(600, 3)),
+            columns=["GDP_per_capita", "life_expectancy", "literacy_rate"],
+        )
+
+    def test_sweep_table(self):
+        """
+        Test Description:
+        The sweep returns one row per k with its inertia and quality metrics, and
+        the elbow of the inertia curve is at the true number of groups.
+        """
+        np.random.seed(1)
+        sweep = KmeansSweep(self.dataset, range(1, 9), 100, n_jobs=1)
+        table = sweep.sweep()
+
+        self.assertEqual(table["num_centroids"].tolist(), list(range(1, 9)))
+        self.assertEqual(
+            list(table.columns),
+            [
+                "num_centroids",
+                "inertia",
+                "inertia_drop",
+                "davies_bouldin",
+                "calinski_harabasz",
+                "silhouette",
+                "used_iterations",
+            ],
+        )
+        self.assertTrue(table.iloc[0][["davies_bouldin", "calinski_harabasz", "silhouette"]].isna().all())
+        self.assertEqual(int(table["davies_bouldin"].idxmin()), 3)
+        self.assertEqual(int(table["calinski_harabasz"].idxmax()), 3)
+        self.assertEqual(int(table["silhouette"].idxmax()), 3)
+        self.assertEqual(sweep.elbow_k, 4)
+        self.assertEqual(sorted(sweep.centroids), list(range(1, 9)))
+        self.assertEqual(len(sweep.centroids[4]), 4)
+
+    def test_parallel_matches_sequential(self):
+        """
+        Test Description:
+        Each k uses its own seed, so the worker pool gives the same table as a
+        sequential sweep.
+        """
+        tables = []
+        for n_jobs in [1, 2]:
+            np.random.seed(2)
+            tables.append(KmeansSweep(self.dataset, [2, 3, 4, 5], 100, n_jobs=n_jobs).sweep())
+
+        pd.testing.assert_frame_equal(tables[0], tables[1])
+
+    def test_warm_start(self):
+        """
+        Test Description:
+        With warm start each k starts from the centroids of the previous k plus
+        the missing ones; every fit returns k centroids and the inertia decreases
+        along the sweep.
+        """
+        np.random.seed(3)
+        sweep = KmeansSweep(self.dataset, range(2, 7), 100, n_jobs=1, warm_start=True)
+        table = sweep.sweep()
+
+        self.assertEqual(table["num_centroids"].tolist(), list(range(2, 7)))
+        self.assertLess(table["inertia"].iloc[-1], table["inertia"].iloc[0])
+        self.assertEqual([len(sweep.centroids[k]) for k in range(2, 7)], list(range(2, 7)))
+
+    def test_invalid_k_values(self):
+        """
+        Test Description:
+        A range with k = 0 or with more centroids than points is rejected.
+        """
+        with self.assertRaises(ZeroCentroidsError):
+            KmeansSweep(self.dataset, [0, 1, 2], 10, n_jobs=1).sweep()
+        with self.assertRaises(MoreCentroidsError):
+            KmeansSweep(self.dataset.head(5), [2, 6], 10, n_jobs=1).sweep()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,8 @@
+import os
 import sys
+import json
+import random
+import tempfile
 import unittest
 import pandas as pd
 import numpy as np
@@ -6,11 +10,22 @@ import numpy as np
 sys.path.append("src")
 
 from model.kmeans_logic import Kmeans
+from model.minibatch_kmeans_logic import MiniBatchKmeans
+from model.streaming_kmeans_logic import StreamingKmeans
+from model.scaler import DataScaler
 from model.errors.kmeans_error import (
     EmptyDatasetError,
     ZeroCentroidsError,
     MoreCentroidsError,
     NoNumericColumnsError,
+    InvalidAlgorithmError,
+    InvalidInitError,
+    MissingColumnsError,
+    NotFittedError,
+    FeatureCountError,
+    InvalidDtypeError,
+    MoreInitCentroidsError,
+    InitScalerColumnsError,
 )
 
 
@@ -247,6 +262,817 @@ class TestKMeans(unittest.TestCase):
         self.assertEqual(group1["assigned_cluster"].nunique(), 1)
         self.assertEqual(group2["assigned_cluster"].nunique(), 1)
 
+    def test_extraordinary_constant_column(self):
+        """
+        Test Description:
+        This test verifies that a column with the same value in every row does not
+        produce a division by zero during normalization.
+
+        Data Setup:
+        - GDP_per_capita: [30000, 25000, 40000, 41000]
+        - life_expectancy: [78, 75, 82, 83]
+        - literacy_rate: [95, 95, 95, 95]
+
+        Expected Result:
+        The constant column is normalized to 0 and the clusters are computed without NaN.
+        """
+        dataset = pd.DataFrame(
+            {
+                "GDP_per_capita": [30000, 25000, 40000, 41000],
+                "life_expectancy": [78, 75, 82, 83],
+                "literacy_rate": [95, 95, 95, 95],
+            }
+        )
+
+        kmeans = Kmeans(dataset, 2, 10)
+
+        centroids_list, updated_dataset = kmeans.k_means_logic()
+
+        self.assertEqual(updated_dataset["literacy_rate"].tolist(), [0.0] * 4)
+        self.assertFalse(np.isnan(np.array(centroids_list)).any())
+        self.assertEqual(updated_dataset["assigned_cluster"].nunique(), 2)
+        self.assertEqual(kmeans.scaler.method, "min-max")
+
+    def test_arbitrary_dimensions(self):
+        """
+        Test Description:
+        This test verifies that any number of feature columns can be clustered,
+        either from a raw NumPy array or from selected columns of a DataFrame.
+
+        Data Setup:
+        - A (120, 25) NumPy array with 3 groups of 40 rows
+        - The same data as a DataFrame with an extra non-numeric "country" column
+
+        Expected Result:
+        25-dimensional centroids, each group in a single cluster, and the
+        non-numeric column ignored when feature_columns is given.
+        """
+        generator = np.random.default_rng(29)
+        group_ids = np.repeat([0, 1, 2], 40)
+        values = generator.normal(scale=0.1, size=(120, 25)) + group_ids[:, np.newaxis] * 3
+
+        kmeans = Kmeans(values, 3, 50)
+        centroids_list, updated_dataset = kmeans.k_means_logic()
+
+        self.assertEqual(kmeans.feature_columns[0], "Feature_1")
+        self.assertEqual(len(kmeans.feature_columns), 25)
+        self.assertEqual(len(centroids_list), 3)
+        self.assertEqual(len(centroids_list[0]), 25)
+        for group_id in range(3):
+            group_labels = updated_dataset["assigned_cluster"][group_ids == group_id]
+            self.assertEqual(group_labels.nunique(), 1)
+
+        dataset = pd.DataFrame(values, columns=[f"indicator_{i}" for i in range(25)])
+        dataset["country"] = "X"
+        selected_columns = [f"indicator_{i}" for i in range(20)]
+        kmeans = Kmeans(dataset, 3, 50, feature_columns=selected_columns)
+        centroids_list, updated_dataset = kmeans.k_means_logic()
+
+        self.assertEqual(len(centroids_list[0]), 20)
+        self.assertNotIn("country", updated_dataset.columns)
+
+    def test_vectorized_assignment(self):
+        """
+        Test Description:
+        This test verifies that the batched assignment engine computes the same
+        nearest centroid and squared distance as the per-point computation.
+
+        Data Setup:
+        - points: [(0, 0, 0), (1, 1, 1), (0.9, 0.8, 1.0), (0.1, 0.2, 0.0)]
+        - centroids: [(0, 0, 0), (1, 1, 1)]
+
+        Expected Result:
+        Labels [0, 1, 1, 0] and squared distances matching the per-point result.
+        """
+        dataset = pd.DataFrame(
+            {
+                "GDP_per_capita": [0.0, 1.0, 0.9, 0.1],
+                "life_expectancy": [0.0, 1.0, 0.8, 0.2],
+                "literacy_rate": [0.0, 1.0, 1.0, 0.0],
+            }
+        )
+        centroids = [(0.0, 0.0, 0.0), (1.0, 1.0, 1.0)]
+        kmeans = Kmeans(dataset, 2, 10)
+
+        labels, min_distances = kmeans.assign_points(
+            kmeans.to_points(dataset), kmeans.to_centroid_array(centroids)
+        )
+
+        self.assertEqual(labels.tolist(), [0, 1, 1, 0])
+        for point, label, distance in zip(
+            dataset.itertuples(index=False), labels, min_distances
+        ):
+            expected_label, expected_distance = (
+                kmeans.calculate_euclidean_distance_between_points(centroids, point)
+            )
+            self.assertEqual(label, expected_label)
+            self.assertAlmostEqual(distance, expected_distance, places=10)
+
+    def test_blocked_assignment(self):
+        """
+        Test Description:
+        This test verifies that the blocked assignment kernel gives the same
+        result whatever the memory ceiling of each distance block.
+
+        Data Setup:
+        - 1000 random points and 16 random centroids in 4 dimensions
+        - max_block_memory of 8 MiB (a single block) and of 512 bytes (4 rows per block)
+
+        Expected Result:
+        Identical labels and squared distances matching a direct computation.
+        """
+        generator = np.random.default_rng(31)
+        points = generator.random(size=(1000, 4))
+        centroids = generator.random(size=(16, 4))
+
+        single_block = Kmeans(points, 16, 10)
+        many_blocks = Kmeans(points, 16, 10, max_block_memory=512)
+        self.assertEqual(len(list(many_blocks.iterate_blocks(1000, 16))), 250)
+
+        labels, min_distances = single_block.assign_points(points, centroids)
+        blocked_labels, blocked_distances = many_blocks.assign_points(points, centroids)
+
+        direct_distances = ((points[:, np.newaxis, :] - centroids) ** 2).sum(axis=2)
+        self.assertEqual(labels.tolist(), blocked_labels.tolist())
+        self.assertEqual(labels.tolist(), direct_distances.argmin(axis=1).tolist())
+        np.testing.assert_allclose(blocked_distances, direct_distances.min(axis=1), atol=1e-12)
+        np.testing.assert_allclose(min_distances, blocked_distances, atol=1e-12)
+
+    def test_early_convergence(self):
+        """
+        Test Description:
+        This test verifies that the algorithm stops as soon as the assignments
+        stop changing instead of running every requested iteration.
+
+        Data Setup:
+        - Two well separated groups of three countries each, k=2, max_iteration=300
+
+        Expected Result:
+        The run stops after a few iterations and reports the final inertia.
+        """
+        dataset = pd.DataFrame(
+            {
+                "GDP_per_capita": [1000, 1200, 1100, 50000, 52000, 51000],
+                "life_expectancy": [50, 52, 51, 80, 82, 81],
+                "literacy_rate": [40, 42, 41, 98, 99, 97],
+            }
+        )
+        kmeans = Kmeans(dataset, 2, 300)
+
+        _, updated_dataset = kmeans.k_means_logic()
+
+        self.assertLess(kmeans.used_iterations, 10)
+        self.assertGreaterEqual(kmeans.used_iterations, 1)
+        self.assertIsNotNone(kmeans.inertia)
+        self.assertLess(kmeans.inertia, 0.1)
+        self.assertEqual(updated_dataset["assigned_cluster"].nunique(), 2)
+
+    def test_bounded_engines_match_lloyd(self):
+        """
+        Test Description:
+        This test verifies that the Elkan, Hamerly and KD-tree engines and the
+        centroid index produce exactly the same labels as the plain Lloyd engine,
+        also on grid data full of exact and near ties, while the bounded engines
+        skip point-centroid distances.
+
+        Data Setup:
+        - 500 random points in 5 groups, k=8
+        - A 9x9 grid with every point duplicated, k=12
+        - Same random seeds for every run
+
+        Expected Result:
+        Identical assignments, identical iteration counts and pruned distances > 0.
+        """
+        generator = np.random.default_rng(7)
+        grid = np.array(np.meshgrid(np.arange(9), np.arange(9))).reshape(2, -1).T
+        cases = [
+            (
+                pd.DataFrame(
+                    generator.normal(size=(500, 3)) + generator.integers(0, 5, size=(500, 1)),
+                    columns=["GDP_per_capita", "life_expectancy", "literacy_rate"],
+                ),
+                8,
+                3,
+            ),
+            (
+                pd.DataFrame(
+                    np.repeat(grid, 2, axis=0).astype(float),
+                    columns=["GDP_per_capita", "life_expectancy"],
+                ),
+                12,
+                0,
+            ),
+        ]
+
+        for dataset, num_centroids, seed in cases:
+            results = {}
+            for algorithm, centroid_index in [
+                ("lloyd", False),
+                ("elkan", False),
+                ("hamerly", False),
+                ("kd-tree", False),
+                ("lloyd", True),
+            ]:
+                random.seed(seed)
+                np.random.seed(seed)
+                kmeans = Kmeans(
+                    dataset,
+                    num_centroids,
+                    100,
+                    algorithm=algorithm,
+                    centroid_index=centroid_index,
+                )
+                _, updated_dataset = kmeans.k_means_logic()
+                results[(algorithm, centroid_index)] = (
+                    kmeans,
+                    updated_dataset["assigned_cluster"].tolist(),
+                )
+
+            lloyd, lloyd_labels = results[("lloyd", False)]
+            self.assertEqual(lloyd.pruned_distances, 0)
+            for engine, (other, other_labels) in results.items():
+                self.assertEqual(lloyd_labels, other_labels, engine)
+                self.assertEqual(lloyd.used_iterations, other.used_iterations, engine)
+            for algorithm in ["elkan", "hamerly", "kd-tree"]:
+                self.assertGreater(results[(algorithm, False)][0].pruned_distances, 0)
+
+    def test_kd_tree_fallback(self):
+        """
+        Test Description:
+        This test verifies that the KD-tree engine builds its tree once for
+        low-dimensional data and falls back to the flat assignment when the
+        dimensionality is too high for the tree to help.
+
+        Data Setup:
+        - 300 random points in 2 dimensions and 300 random points in 12 dimensions, k=4
+
+        Expected Result:
+        A tree covering every point for 2 dimensions, no tree and no pruned
+        distances for 12 dimensions, and every row labeled in both cases.
+        """
+        generator = np.random.default_rng(17)
+
+        low_dimensional = Kmeans(generator.random(size=(300, 2)), 4, 50, algorithm="kd-tree")
+        _, low_dataset = low_dimensional.k_means_logic()
+        self.assertIsNotNone(low_dimensional.kd_tree)
+        self.assertEqual(
+            sorted(low_dimensional.kd_tree["permutation"].tolist()), list(range(300))
+        )
+        self.assertTrue(low_dataset["assigned_cluster"].between(0, 3).all())
+
+        high_dimensional = Kmeans(generator.random(size=(300, 12)), 4, 50, algorithm="kd-tree")
+        _, high_dataset = high_dimensional.k_means_logic()
+        self.assertIsNone(high_dimensional.kd_tree)
+        self.assertEqual(high_dimensional.pruned_distances, 0)
+        self.assertTrue(high_dataset["assigned_cluster"].between(0, 3).all())
+
+    def test_centroid_index(self):
+        """
+        Test Description:
+        This test verifies that the nearest-centroid search over a KD-tree of the
+        centroids returns the same assignment as comparing against every centroid,
+        both for a single assignment and for a complete run.
+
+        Data Setup:
+        - 2000 random points and 300 random centroids in 3 dimensions
+        - A complete run with k=40 with and without centroid_index, same seeds
+
+        Expected Result:
+        Identical labels and distances, and identical final assignments.
+        """
+        generator = np.random.default_rng(23)
+        points = generator.random(size=(2000, 3))
+        centroids = generator.random(size=(300, 3))
+
+        labels, min_distances = Kmeans(points, 300, 10).assign_points(points, centroids)
+        index_labels, index_distances = Kmeans(
+            points, 300, 10, centroid_index=True
+        ).assign_points(points, centroids)
+        self.assertEqual(labels.tolist(), index_labels.tolist())
+        np.testing.assert_allclose(min_distances, index_distances, atol=1e-12)
+
+        assignments = []
+        for centroid_index in [False, True]:
+            random.seed(5)
+            np.random.seed(5)
+            kmeans = Kmeans(points, 40, 100, centroid_index=centroid_index)
+            _, updated_dataset = kmeans.k_means_logic()
+            assignments.append(updated_dataset["assigned_cluster"].tolist())
+        self.assertEqual(assignments[0], assignments[1])
+
+    def test_minibatch_separated_groups(self):
+        """
+        Test Description:
+        This test verifies that the mini-batch mode returns the same
+        (centroids, dataset) shape as the full-batch mode and recovers
+        well separated groups.
+
+        Data Setup:
+        - 3 groups of 200 random points around distant centers, k=3, batch_size=64
+
+        Expected Result:
+        3 centroids, every row labeled, each original group in a single cluster,
+        and an InvalidAlgorithmError for an engine other than "lloyd".
+        """
+        generator = np.random.default_rng(11)
+        group_ids = np.repeat([0, 1, 2], 200)
+        dataset = pd.DataFrame(
+            generator.normal(scale=0.05, size=(600, 3)) + group_ids[:, np.newaxis] * 10,
+            columns=["GDP_per_capita", "life_expectancy", "literacy_rate"],
+        )
+
+        kmeans = MiniBatchKmeans(dataset, 3, 100, batch_size=64)
+
+        centroids_list, updated_dataset = kmeans.k_means_logic()
+
+        self.assertEqual(len(centroids_list), 3)
+        self.assertEqual(len(updated_dataset), 600)
+        self.assertLessEqual(kmeans.used_iterations, 100)
+        for group_id in range(3):
+            group_labels = updated_dataset["assigned_cluster"][group_ids == group_id]
+            self.assertEqual(group_labels.nunique(), 1)
+        self.assertEqual(updated_dataset["assigned_cluster"].nunique(), 3)
+
+        # Options of the base Kmeans are also available in mini-batch mode
+        scaled = MiniBatchKmeans(
+            dataset,
+            3,
+            100,
+            batch_size=64,
+            scaling="z-score",
+            feature_columns=["GDP_per_capita", "life_expectancy"],
+        )
+        scaled_centroids, scaled_dataset = scaled.k_means_logic()
+        self.assertEqual(scaled.scaler.method, "z-score")
+        self.assertEqual(len(scaled_centroids[0]), 2)
+        self.assertEqual(scaled_dataset["assigned_cluster"].nunique(), 3)
+
+        # Batches are always assigned with the flat engine
+        with self.assertRaises(InvalidAlgorithmError):
+            MiniBatchKmeans(dataset, 3, 100, algorithm="hamerly")
+
+    def test_streaming_matches_in_memory(self):
+        """
+        Test Description:
+        This test verifies that clustering a CSV file chunk by chunk gives the same
+        centroids as loading the whole file, and that every row can be labeled.
+
+        Data Setup:
+        - 3 groups of 100 random points written to a temporary CSV file
+        - chunk_size=37 so that the file is read in many small blocks
+
+        Expected Result:
+        Same sorted centroids as the in-memory run and one label per row in the output file.
+        """
+        generator = np.random.default_rng(5)
+        group_ids = np.repeat([0, 1, 2], 100)
+        dataset = pd.DataFrame(
+            generator.normal(scale=0.1, size=(300, 3)) + group_ids[:, np.newaxis] * 5,
+            columns=["GDP_per_capita", "life_expectancy", "literacy_rate"],
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, "input.csv")
+            output_path = os.path.join(directory, "output.csv")
+            dataset.to_csv(input_path, index=False)
+
+            streaming = StreamingKmeans(input_path, 3, 50, chunk_size=37)
+            streaming_centroids, sample = streaming.k_means_logic()
+            streaming.assign_file(output_path)
+            labeled = pd.read_csv(output_path)
+
+        in_memory_centroids, _ = Kmeans(dataset, 3, 50).k_means_logic()
+
+        self.assertEqual(streaming.num_rows, 300)
+        self.assertEqual(len(sample), 300)
+        self.assertEqual(len(labeled), 300)
+        self.assertEqual(labeled["assigned_cluster"].nunique(), 3)
+        for res_center, exp_center in zip(
+            sorted(streaming_centroids), sorted(in_memory_centroids)
+        ):
+            for res_value, exp_value in zip(res_center, exp_center):
+                self.assertAlmostEqual(res_value, exp_value, places=6)
+
+    def test_multiple_restarts(self):
+        """
+        Test Description:
+        This test verifies that n_init independent runs are executed (sequentially
+        and in a process pool) and that the run with the lowest inertia is kept.
+
+        Data Setup:
+        - 200 random points in 4 groups, k=4, n_init=3
+
+        Expected Result:
+        3 restart stats per run, the kept inertia is the minimum of them, and the
+        process pool gives the same result as the sequential execution.
+        """
+        generator = np.random.default_rng(13)
+        dataset = pd.DataFrame(
+            generator.normal(size=(200, 3)) + generator.integers(0, 4, size=(200, 1)),
+            columns=["GDP_per_capita", "life_expectancy", "literacy_rate"],
+        )
+
+        results = []
+        for n_jobs in [1, 2]:
+            random.seed(17)
+            np.random.seed(17)
+            kmeans = Kmeans(dataset, 4, 100, n_init=3, n_jobs=n_jobs)
+            centroids_list, updated_dataset = kmeans.k_means_logic()
+            results.append((kmeans, centroids_list, updated_dataset))
+
+            self.assertEqual(len(kmeans.restart_stats), 3)
+            self.assertEqual(
+                kmeans.inertia, min(stat["inertia"] for stat in kmeans.restart_stats)
+            )
+            self.assertEqual(len(centroids_list), 4)
+
+        (sequential, sequential_centroids, sequential_dataset) = results[0]
+        (parallel, parallel_centroids, parallel_dataset) = results[1]
+        self.assertEqual(sequential.restart_stats, parallel.restart_stats)
+        self.assertEqual(sequential_centroids, parallel_centroids)
+        self.assertEqual(
+            sequential_dataset["assigned_cluster"].tolist(),
+            parallel_dataset["assigned_cluster"].tolist(),
+        )
+
+    def test_incremental_seeding(self):
+        """
+        Test Description:
+        This test verifies that the incremental k-means++ seeding picks distinct
+        points and leaves each point assigned to its nearest initial centroid.
+
+        Data Setup:
+        - 300 random points, k=6
+
+        Expected Result:
+        6 distinct initial centroids taken from the dataset, assignments equal to
+        a full nearest-centroid computation, and probabilities that add up to 1.
+        """
+        generator = np.random.default_rng(23)
+        dataset = pd.DataFrame(
+            generator.random(size=(300, 3)),
+            columns=["GDP_per_capita", "life_expectancy", "literacy_rate"],
+        )
+
+        kmeans = Kmeans(dataset, 6, 10)
+        kmeans.proccess_data()
+        data_subset = kmeans.dataset[list(dataset.columns)].copy()
+        initial_centroids = kmeans.initialize_centroids(data_subset)
+
+        points = kmeans.to_points(data_subset)
+        self.assertEqual(len(set(initial_centroids)), 6)
+        for centroid in initial_centroids:
+            self.assertTrue((points == np.array(centroid)).all(axis=1).any())
+
+        expected_labels, _ = kmeans.assign_points(
+            points, kmeans.to_centroid_array(initial_centroids)
+        )
+        self.assertEqual(
+            kmeans.dataset["assigned_cluster"].tolist(), expected_labels.tolist()
+        )
+        self.assertAlmostEqual(kmeans.dataset["centroid_probability"].sum(), 1.0)
+
+    def test_kmeans_parallel_init(self):
+        """
+        Test Description:
+        This test verifies that the k-means|| initializer picks one initial
+        centroid per well separated group.
+
+        Data Setup:
+        - 5 groups of 100 random points around distant centers, k=5, init="k-means||"
+
+        Expected Result:
+        5 initial centroids, each one inside a different group, and each group
+        ends up in a single cluster.
+        """
+        generator = np.random.default_rng(19)
+        group_ids = np.repeat(np.arange(5), 100)
+        centers = np.array([[0, 0, 0], [10, 0, 0], [0, 10, 0], [0, 0, 10], [10, 10, 10]])
+        dataset = pd.DataFrame(
+            generator.normal(scale=0.1, size=(500, 3)) + centers[group_ids],
+            columns=["GDP_per_capita", "life_expectancy", "literacy_rate"],
+        )
+
+        kmeans = Kmeans(dataset, 5, 100, init="k-means||")
+        kmeans.proccess_data()
+        data_subset = kmeans.dataset[list(dataset.columns)].copy()
+        initial_centroids = kmeans.initialize_centroids(data_subset)
+
+        self.assertEqual(len(initial_centroids), 5)
+        initial_groups = {
+            kmeans.dataset["assigned_cluster"][group_ids == group_id].unique().tolist()[0]
+            for group_id in range(5)
+        }
+        self.assertEqual(len(initial_groups), 5)
+
+        _, updated_dataset = Kmeans(dataset, 5, 100, init="k-means||").k_means_logic()
+        for group_id in range(5):
+            group_labels = updated_dataset["assigned_cluster"][group_ids == group_id]
+            self.assertEqual(group_labels.nunique(), 1)
+
+    def test_predict_with_saved_model(self):
+        """
+        Test Description:
+        This test verifies that a fitted model classifies new rows in their
+        original units, and that saving and loading it keeps the same predictions
+        without the training data.
+
+        Data Setup:
+        - 400 random rows in original units, k=4
+        - New rows given as a DataFrame with extra and reordered columns, and as an array
+
+        Expected Result:
+        predict reproduces the training assignment, transform gives the distance
+        to every centroid, no points stay cached in the model, and the loaded
+        model predicts the same labels.
+        """
+        generator = np.random.default_rng(43)
+        columns = ["GDP_per_capita", "life_expectancy", "literacy_rate"]
+        dataset = pd.DataFrame(generator.random(size=(400, 3)) * [50000, 40, 100], columns=columns)
+
+        kmeans = Kmeans(dataset, 4, 100)
+        _, updated_dataset = kmeans.k_means_logic()
+        self.assertEqual(
+            kmeans.predict(dataset).tolist(), updated_dataset["assigned_cluster"].tolist()
+        )
+
+        new_rows = pd.DataFrame(generator.random(size=(50, 3)) * [50000, 40, 100], columns=columns)
+        labels = kmeans.predict(new_rows)
+        distances = kmeans.transform(new_rows)
+        self.assertEqual(distances.shape, (50, 4))
+        self.assertEqual(labels.tolist(), distances.argmin(axis=1).tolist())
+
+        # Neither the training points nor the predicted rows stay cached
+        self.assertIsNone(kmeans.cached_points)
+        self.assertIsNone(kmeans.cached_point_norms)
+
+        with tempfile.TemporaryDirectory() as directory:
+            model_path = os.path.join(directory, "model.npz")
+            kmeans.save_model(model_path)
+            loaded = Kmeans.load_model(model_path)
+
+        reordered_rows = new_rows[columns[::-1]].assign(country="X")
+        self.assertEqual(loaded.predict(reordered_rows).tolist(), labels.tolist())
+        self.assertEqual(loaded.predict(new_rows.to_numpy()).tolist(), labels.tolist())
+        np.testing.assert_allclose(loaded.transform(new_rows), distances)
+
+    def test_warm_start_from_centroids(self):
+        """
+        Test Description:
+        This test verifies that a refit started from the centroids of a previous
+        run (stored or from a saved model) converges in a couple of iterations,
+        and that missing centroids are completed with K-Means++.
+
+        Data Setup:
+        - 4 groups of 150 points, k=4, and the same data with small perturbations
+        - Warm starts from the returned centroids, from a saved model with its
+          scaler (also on reordered and on renamed columns), from only 2 of the
+          4 centroids, and with k=3
+
+        Expected Result:
+        The refits need at most 2 iterations and reach the same inertia as the
+        original run; the partial warm start still returns 4 centroids; renamed
+        columns and more centroids than k raise errors.
+        """
+        generator = np.random.default_rng(47)
+        columns = ["GDP_per_capita", "life_expectancy", "literacy_rate"]
+        centers = generator.random(size=(4, 3)) * [50000, 40, 100]
+        dataset = pd.DataFrame(
+            centers[np.repeat(np.arange(4), 150)]
+            + generator.normal(scale=[500, 0.5, 1], size=(600, 3)),
+            columns=columns,
+        )
+        updated_rows = dataset + generator.normal(scale=[50, 0.05, 0.1], size=(600, 3))
+
+        kmeans = Kmeans(dataset, 4, 100)
+        centroids, _ = kmeans.k_means_logic()
+
+        stored_refit = Kmeans(dataset, 4, 100, init=np.array(centroids))
+        stored_refit.k_means_logic()
+        self.assertLessEqual(stored_refit.used_iterations, 2)
+        self.assertAlmostEqual(stored_refit.inertia, kmeans.inertia)
+
+        with tempfile.TemporaryDirectory() as directory:
+            model_path = os.path.join(directory, "model.npz")
+            kmeans.save_model(model_path)
+            model = Kmeans.load_model(model_path)
+        model_refit = Kmeans(updated_rows, 4, 100, init=model.centroids, init_scaler=model.scaler)
+        model_refit.k_means_logic()
+        self.assertLessEqual(model_refit.used_iterations, 2)
+        self.assertEqual(
+            model_refit.predict(updated_rows).tolist(), kmeans.predict(updated_rows).tolist()
+        )
+
+        reordered_refit = Kmeans(
+            updated_rows[columns[::-1]], 4, 100, init=model.centroids, init_scaler=model.scaler
+        )
+        reordered_refit.k_means_logic()
+        self.assertLessEqual(reordered_refit.used_iterations, 2)
+        self.assertAlmostEqual(reordered_refit.inertia, model_refit.inertia)
+
+        renamed_rows = updated_rows.rename(columns={"literacy_rate": "internet_access"})
+        with self.assertRaises(InitScalerColumnsError):
+            Kmeans(
+                renamed_rows, 4, 100, init=model.centroids, init_scaler=model.scaler
+            ).k_means_logic()
+
+        partial_refit = Kmeans(dataset, 4, 100, init=np.array(centroids[:2]))
+        partial_centroids, _ = partial_refit.k_means_logic()
+        self.assertEqual(len(partial_centroids), 4)
+
+        with self.assertRaises(FeatureCountError):
+            Kmeans(dataset, 4, 100, init=np.array(centroids)[:, :2]).k_means_logic()
+        with self.assertRaises(MoreInitCentroidsError):
+            Kmeans(dataset, 3, 100, init=np.array(centroids)).k_means_logic()
+
+    def test_warm_start_from_stored_run_with_shifted_range(self):
+        """
+        Test Description:
+        This test verifies that a warm start from a stored run (centroids plus the
+        scaler saved in its parameters) works on new data whose range differs, so
+        its normalized space differs from the one the centroids were stored in.
+
+        Data Setup:
+        - 4 groups of 150 points, k=4, stored as JSON like a saved run
+        - The same rows plus 2 points that widen every column's range
+
+        Expected Result:
+        The refit starts at the stored centroids (at most 2 iterations) and keeps
+        the original labels of the original rows; without the stored scaler the
+        starting centroids are not the stored ones.
+        """
+        generator = np.random.default_rng(61)
+        columns = ["GDP_per_capita", "life_expectancy", "literacy_rate"]
+        centers = generator.random(size=(4, 3)) * [50000, 40, 100]
+        dataset = pd.DataFrame(
+            centers[np.repeat(np.arange(4), 150)]
+            + generator.normal(scale=[500, 0.5, 1], size=(600, 3)),
+            columns=columns,
+        )
+        low, high = dataset.min(), dataset.max()
+        wider_dataset = pd.concat(
+            [dataset, pd.DataFrame([low - (high - low), high + (high - low)])],
+            ignore_index=True,
+        )
+
+        kmeans = Kmeans(dataset, 4, 100)
+        centroids, updated_dataset = kmeans.k_means_logic()
+        stored_parameters = json.loads(
+            json.dumps({"scaling": kmeans.scaling, "scaler": kmeans.scaler.to_dict()})
+        )
+
+        refit = Kmeans(
+            wider_dataset,
+            4,
+            100,
+            init=np.array(centroids),
+            scaling=stored_parameters["scaling"],
+            init_scaler=DataScaler.from_dict(stored_parameters["scaler"]),
+        )
+        _, refit_dataset = refit.k_means_logic()
+        self.assertLessEqual(refit.used_iterations, 2)
+        self.assertEqual(
+            refit_dataset["assigned_cluster"].iloc[:600].tolist(),
+            updated_dataset["assigned_cluster"].tolist(),
+        )
+
+        unscaled_refit = Kmeans(wider_dataset, 4, 100, init=np.array(centroids))
+        unscaled_refit.prepare_data()
+        self.assertFalse(
+            np.allclose(
+                unscaled_refit.get_explicit_centroids(),
+                refit.scaler.transform_array(kmeans.scaler.inverse_transform_array(np.array(centroids))),
+            )
+        )
+
+    def test_empty_cluster_reseeding(self):
+        """
+        Test Description:
+        This test verifies that a cluster left without points is reseeded at the
+        point farthest from its centroid instead of being dropped.
+
+        Data Setup:
+        - 2 groups of 100 points and an initial centroid far from every point, k=3
+
+        Expected Result:
+        3 centroids, every cluster with points, and the two groups kept apart.
+        """
+        generator = np.random.default_rng(53)
+        dataset = pd.DataFrame(
+            np.vstack(
+                [
+                    generator.normal(loc=0.0, scale=0.1, size=(100, 2)),
+                    generator.normal(loc=5.0, scale=0.1, size=(100, 2)),
+                ]
+            ),
+            columns=["GDP_per_capita", "life_expectancy"],
+        )
+        initial_centroids = np.array([[0.0, 0.0], [1.0, 1.0], [50.0, 50.0]])
+
+        kmeans = Kmeans(dataset, 3, 100, init=initial_centroids)
+        centroids, updated_dataset = kmeans.k_means_logic()
+        labels = updated_dataset["assigned_cluster"].to_numpy()
+
+        self.assertEqual(len(centroids), 3)
+        self.assertEqual(sorted(set(labels.tolist())), [0, 1, 2])
+        self.assertTrue(set(labels[:100]).isdisjoint(labels[100:]))
+
+    def test_float32_compute(self):
+        """
+        Test Description:
+        This test verifies that narrow numeric columns (int32, float32) are
+        accepted and that computing in float32 gives the same clusters as float64.
+
+        Data Setup:
+        - 3 separated groups of 200 points with int32 and float32 columns, k=3
+
+        Expected Result:
+        float32 centroids and points, and the same labels with both dtypes.
+        """
+        generator = np.random.default_rng(59)
+        centers = np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 10.0]])
+        values = centers[np.repeat(np.arange(3), 200)] + generator.normal(size=(600, 2))
+        dataset = pd.DataFrame(
+            {
+                "GDP_per_capita": (values[:, 0] * 1000).astype(np.int32),
+                "life_expectancy": values[:, 1].astype(np.float32),
+            }
+        )
+
+        labels = {}
+        for dtype in ["float64", "float32"]:
+            np.random.seed(7)
+            kmeans = Kmeans(dataset, 3, 100, algorithm="hamerly", dtype=dtype)
+            _, updated_dataset = kmeans.k_means_logic()
+            labels[dtype] = updated_dataset["assigned_cluster"].to_numpy()
+            self.assertEqual(kmeans.centroids.dtype, np.dtype(dtype))
+            self.assertEqual(updated_dataset["GDP_per_capita"].dtype, np.dtype(dtype))
+
+        np.testing.assert_array_equal(labels["float64"], labels["float32"])
+        np.testing.assert_array_equal(kmeans.predict(dataset), labels["float32"])
+
+    def test_float32_large_offset(self):
+        """
+        Test Description:
+        This test verifies that raw values are scaled in float64 before being cast
+        to float32, so a column with a large offset keeps its precision when
+        fitting, predicting and transforming.
+
+        Data Setup:
+        - 1e9 plus two close groups of 300 distinct values each, k=2
+
+        Expected Result:
+        600 distinct scaled values, groups separated, and predict/transform in
+        float32 matching the float64 model.
+        """
+        generator = np.random.default_rng(61)
+        offsets = np.concatenate(
+            [generator.uniform(0, 10, 300), generator.uniform(90, 100, 300)]
+        )
+        dataset = pd.DataFrame({"GDP_per_capita": 1e9 + offsets})
+
+        models = {}
+        for dtype in ["float64", "float32"]:
+            np.random.seed(5)
+            models[dtype] = Kmeans(dataset, 2, 100, dtype=dtype)
+            _, updated_dataset = models[dtype].k_means_logic()
+            labels = updated_dataset["assigned_cluster"].to_numpy()
+            self.assertEqual(updated_dataset["GDP_per_capita"].nunique(), 600)
+            self.assertTrue(set(labels[:300]).isdisjoint(labels[300:]))
+
+        float32_model = models["float32"]
+        new_rows = pd.DataFrame({"GDP_per_capita": 1e9 + np.array([2.0, 97.0, 40.0])})
+        np.testing.assert_array_equal(
+            float32_model.predict(dataset), float32_model.dataset["assigned_cluster"]
+        )
+        np.testing.assert_array_equal(
+            float32_model.predict(new_rows.to_numpy()), models["float64"].predict(new_rows)
+        )
+        np.testing.assert_allclose(
+            float32_model.transform(new_rows),
+            models["float64"].transform(new_rows),
+            atol=1e-5,
+        )
+
+    def test_error_not_fitted(self):
+        kmeans = Kmeans(pd.DataFrame({"GDP_per_capita": [30000, 25000]}), 1, 10)
+
+        with self.assertRaises(NotFittedError):
+            kmeans.predict(np.array([[1.0]]))
+
+    def test_error_feature_count(self):
+        dataset = pd.DataFrame(
+            {
+                "GDP_per_capita": [30000, 25000, 40000],
+                "life_expectancy": [78, 75, 82],
+            }
+        )
+        kmeans = Kmeans(dataset, 2, 10)
+        kmeans.k_means_logic()
+
+        with self.assertRaises(FeatureCountError):
+            kmeans.predict(np.array([[30000.0, 78.0, 95.0]]))
+
     def test_error_empty_dataset(self):
         dataset = pd.DataFrame({})
         num_centroids = 2
@@ -306,5 +1132,71 @@ class TestKMeans(unittest.TestCase):
             kmeans.k_means_logic()
 
 
+    def test_error_invalid_algorithm(self):
+        dataset = pd.DataFrame(
+            {
+                "GDP_per_capita": [30000, 25000, 40000],
+                "life_expectancy": [78, 75, 82],
+                "literacy_rate": [95, 90, 98],
+            }
+        )
+        num_centroids = 2
+        max_iteration = 10
+
+        kmeans = Kmeans(dataset, num_centroids, max_iteration, algorithm="quantum")
+
+        with self.assertRaises(InvalidAlgorithmError):
+            kmeans.k_means_logic()
+
+    def test_error_missing_columns(self):
+        dataset = pd.DataFrame(
+            {
+                "GDP_per_capita": [30000, 25000, 40000],
+                "life_expectancy": [78, 75, 82],
+            }
+        )
+        num_centroids = 2
+        max_iteration = 10
+
+        kmeans = Kmeans(
+            dataset,
+            num_centroids,
+            max_iteration,
+            feature_columns=["GDP_per_capita", "literacy_rate"],
+        )
+
+        with self.assertRaises(MissingColumnsError):
+            kmeans.k_means_logic()
+
+    def test_error_invalid_dtype(self):
+        dataset = pd.DataFrame(
+            {
+                "GDP_per_capita": [30000, 25000, 40000],
+                "life_expectancy": [78, 75, 82],
+            }
+        )
+
+        kmeans = Kmeans(dataset, 2, 10, dtype="float16")
+
+        with self.assertRaises(InvalidDtypeError):
+            kmeans.k_means_logic()
+
+    def test_error_invalid_init(self):
+        dataset = pd.DataFrame(
+            {
+                "GDP_per_capita": [30000, 25000, 40000],
+                "life_expectancy": [78, 75, 82],
+                "literacy_rate": [95, 90, 98],
+            }
+        )
+        num_centroids = 2
+        max_iteration = 10
+
+        kmeans = Kmeans(dataset, num_centroids, max_iteration, init="random-walk")
+
+        with self.assertRaises(InvalidInitError):
+            kmeans.k_means_logic()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,133 @@
+import sys
+import unittest
+import numpy as np
+
+sys.path.append("src")
+
+from model.metrics import ClusterMetrics
+
+
+class TestClusterMetrics(unittest.TestCase):
+
+    def setUp(self):
+        generator = np.random.default_rng(37)
+        self.points = generator.random(size=(200, 3))
+        self.labels = generator.integers(0, 4, size=200)
+        self.centroids = np.array(
+            [self.points[self.labels == cluster].mean(axis=0) for cluster in range(4)]
+        )
+        self.pairwise = np.sqrt(
+            ((self.points[:, np.newaxis, :] - self.points[np.newaxis, :, :]) ** 2).sum(axis=2)
+        )
+
+    def test_matches_definitions(self):
+        """
+        Test Description:
+        Inertia, Davies-Bouldin and Calinski-Harabasz match a direct computation
+        of their definitions cluster by cluster.
+        """
+        metrics = ClusterMetrics()
+        members = [self.labels == cluster for cluster in range(4)]
+
+        inertia = sum(
+            ((self.points[member] - centroid) ** 2).sum()
+            for member, centroid in zip(members, self.centroids)
+        )
+        scatter = [
+            np.sqrt(((self.points[member] - centroid) ** 2).sum(axis=1)).mean()
+            for member, centroid in zip(members, self.centroids)
+        ]
+        davies_bouldin = np.mean(
+            [
+                max(
+                    (scatter[i] + scatter[j]) / np.linalg.norm(self.centroids[i] - self.centroids[j])
+                    for j in range(4)
+                    if j != i
+                )
+                for i in range(4)
+            ]
+        )
+        between = sum(
+            member.sum() * ((centroid - self.points.mean(axis=0)) ** 2).sum()
+            for member, centroid in zip(members, self.centroids)
+        )
+
+        self.assertAlmostEqual(
+            metrics.calculate_inertia(self.points, self.centroids, self.labels), inertia
+        )
+        self.assertAlmostEqual(
+            metrics.calculate_davies_bouldin(self.points, self.centroids, self.labels),
+            davies_bouldin,
+        )
+        self.assertAlmostEqual(
+            metrics.calculate_calinski_harabasz(self.points, self.centroids, self.labels),
+            (between / 3) / (inertia / 196),
+        )
+
+    def test_float32_inertia(self):
+        """
+        Test Description:
+        The inertia of float32 points is accumulated in float64, so it matches
+        the float64 sum of the squared float32 differences.
+        """
+        generator = np.random.default_rng(43)
+        points = generator.random(size=(300000, 3)).astype(np.float32)
+        labels = generator.integers(0, 4, size=300000)
+        centroids = np.array(
+            [points[labels == cluster].mean(axis=0) for cluster in range(4)], dtype=np.float32
+        )
+
+        differences = (points - centroids[labels]).astype(np.float64)
+        expected = (differences ** 2).sum()
+        self.assertAlmostEqual(
+            ClusterMetrics().calculate_inertia(points, centroids, labels), expected, delta=1e-6
+        )
+
+    def test_blocked_silhouette(self):
+        """
+        Test Description:
+        The silhouette computed with tiny distance blocks matches the definition
+        computed from the full pairwise distance matrix.
+        """
+        expected = []
+        for index in range(200):
+            own = self.labels == self.labels[index]
+            own_mean = self.pairwise[index, own].sum() / (own.sum() - 1)
+            nearest_mean = min(
+                self.pairwise[index, self.labels == cluster].mean()
+                for cluster in range(4)
+                if cluster != self.labels[index]
+            )
+            expected.append((nearest_mean - own_mean) / max(own_mean, nearest_mean))
+
+        silhouette = ClusterMetrics(max_block_memory=1024).calculate_silhouette(
+            self.points, self.labels
+        )
+        self.assertAlmostEqual(silhouette, np.mean(expected))
+
+    def test_sampled_silhouette(self):
+        """
+        Test Description:
+        On well separated groups the sampled silhouette is close to 1, and a
+        single cluster gives NaN for every score that needs two clusters.
+        """
+        generator = np.random.default_rng(41)
+        points = np.repeat(np.eye(3) * 10, 2000, axis=0) + generator.normal(
+            scale=0.1, size=(6000, 3)
+        )
+        labels = np.repeat(np.arange(3), 2000)
+
+        np.random.seed(0)
+        silhouette = ClusterMetrics(sample_size=500).calculate_silhouette(points, labels)
+        self.assertGreater(silhouette, 0.95)
+
+        scores = ClusterMetrics().evaluate(
+            points, points.mean(axis=0, keepdims=True), np.zeros(6000, dtype=np.int64)
+        )
+        self.assertTrue(np.isnan(scores["davies_bouldin"]))
+        self.assertTrue(np.isnan(scores["calinski_harabasz"]))
+        self.assertTrue(np.isnan(scores["silhouette"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
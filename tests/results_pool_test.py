@@ -0,0 +1,239 @@
+import unittest
+import sys
+import threading
+from unittest import mock
+import psycopg2
+from psycopg2 import extensions
+sys.path.append("src")
+
+from controller.results_controller import ResultsController
+
+
+class FakeCursor:
+    """ Cursor falso: falla al ejecutar si su conexión está rota """
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def execute(self, query):
+        self.connection.queries.append(query)
+        if self.connection.broken:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+
+class FakeConnection:
+    """ Conexión falsa con el estado de transacción que consulta el controlador """
+
+    def __init__(self, broken=False):
+        self.broken = broken
+        self.closed = 0
+        self.status = extensions.TRANSACTION_STATUS_IDLE
+        self.queries = []
+        self.rollbacks = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def get_transaction_status(self):
+        return self.status
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.status = extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+class FakePool:
+    """ Pool falso: entrega las conexiones de 'pending', luego las devueltas y luego nuevas """
+
+    def __init__(self, minconn, maxconn, dsn, pending=None):
+        self.pending = list(pending or [])
+        self.idle = []
+        self.returned = []
+        self.closed = False
+
+    def getconn(self):
+        if self.pending:
+            return self.pending.pop(0)
+        if self.idle:
+            return self.idle.pop()
+        return FakeConnection()
+
+    def putconn(self, connection, close=False):
+        self.returned.append((connection, close))
+        if close:
+            connection.close()
+        else:
+            self.idle.append(connection)
+
+    def closeall(self):
+        self.closed = True
+
+
+class TestResultsPool(unittest.TestCase):
+
+    def setUp(self):
+        """ Sustituye el pool de psycopg2 por un pool falso, sin base de datos """
+        self.pending = []
+        self.pools = []
+
+        def create_pool(minconn, maxconn, dsn):
+            connection_pool = FakePool(minconn, maxconn, dsn, self.pending)
+            self.pools.append(connection_pool)
+            return connection_pool
+
+        patcher = mock.patch(
+            "controller.results_controller.pool.ThreadedConnectionPool",
+            side_effect=create_pool,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_pool_sizes(self):
+        """ Caso de prueba 1: Tamaños de pool inválidos """
+        with self.assertRaises(ValueError):
+            ResultsController(min_pool_size=3, max_pool_size=2)
+        with self.assertRaises(ValueError):
+            ResultsController(min_pool_size=0, max_pool_size=0)
+        with self.assertRaises(ValueError):
+            ResultsController(itersize=0)
+
+    def test_pool_created_once(self):
+        """ Caso de prueba 2: El pool se crea en el primer uso y se reutiliza """
+        controller = ResultsController(max_pool_size=2)
+        self.assertEqual(len(self.pools), 0)
+
+        with controller._connect() as first:
+            pass
+        with controller._connect() as second:
+            pass
+
+        self.assertEqual(len(self.pools), 1)
+        self.assertEqual(first.queries, ["SELECT 1", "SELECT 1"])
+        self.assertIs(first, second)
+        self.assertEqual(self.pools[0].returned, [(first, False), (first, False)])
+
+    def test_exhausted_pool_waits(self):
+        """ Caso de prueba 3: Con el pool agotado se espera a que se libere una conexión """
+        controller = ResultsController(max_pool_size=1)
+        holding = threading.Event()
+        release = threading.Event()
+        acquired = threading.Event()
+
+        def hold_connection():
+            with controller._connect():
+                holding.set()
+                release.wait(5)
+
+        def wait_connection():
+            with controller._connect():
+                acquired.set()
+
+        holder = threading.Thread(target=hold_connection)
+        holder.start()
+        self.assertTrue(holding.wait(5))
+
+        waiter = threading.Thread(target=wait_connection)
+        waiter.start()
+        self.assertFalse(acquired.wait(0.2))
+
+        release.set()
+        holder.join(5)
+        self.assertTrue(acquired.wait(5))
+        waiter.join(5)
+
+    def test_broken_connection_replaced(self):
+        """ Caso de prueba 4: Las conexiones cerradas o caídas se descartan y se reemplazan """
+        closed = FakeConnection()
+        closed.closed = 1
+        broken = FakeConnection(broken=True)
+        self.pending.extend([closed, broken])
+        controller = ResultsController(max_pool_size=2)
+
+        with controller._connect() as connection:
+            self.assertIsNot(connection, closed)
+            self.assertIsNot(connection, broken)
+            self.assertEqual(connection.queries, ["SELECT 1"])
+
+        returned = self.pools[0].returned
+        self.assertEqual(returned[:2], [(closed, True), (broken, True)])
+        self.assertEqual(returned[2], (connection, False))
+        self.assertTrue(broken.closed)
+
+    def test_no_healthy_connection(self):
+        """ Caso de prueba 5: Si ninguna conexión responde se lanza OperationalError """
+        self.pending.extend(FakeConnection(broken=True) for _ in range(3))
+        controller = ResultsController(max_pool_size=2)
+
+        with self.assertRaises(psycopg2.OperationalError):
+            with controller._connect():
+                pass
+
+        # El cupo del pool se libera aunque no se haya obtenido conexión
+        for _ in range(2):
+            self.assertTrue(controller._pool_slots.acquire(blocking=False))
+
+    def test_release_on_exception(self):
+        """ Caso de prueba 6: La conexión se devuelve sin transacción abierta si la operación falla """
+        controller = ResultsController(max_pool_size=1)
+
+        with self.assertRaises(RuntimeError):
+            with controller._connect() as connection:
+                connection.status = extensions.TRANSACTION_STATUS_INTRANS
+                raise RuntimeError("Fallo en la operación")
+
+        self.assertEqual(connection.rollbacks, 2)  # SELECT 1 y la operación fallida
+        self.assertEqual(self.pools[0].returned, [(connection, False)])
+        self.assertTrue(controller._pool_slots.acquire(blocking=False))
+
+    def test_release_connection_closed_during_use(self):
+        """ Caso de prueba 7: Una conexión que se cerró durante la operación se descarta """
+        controller = ResultsController(max_pool_size=1)
+
+        with self.assertRaises(psycopg2.InterfaceError):
+            with controller._connect() as connection:
+                connection.close()
+                raise psycopg2.InterfaceError("connection already closed")
+
+        self.assertEqual(self.pools[0].returned, [(connection, True)])
+        self.assertTrue(controller._pool_slots.acquire(blocking=False))
+
+    def test_close(self):
+        """ Caso de prueba 8: close cierra el pool y el siguiente uso crea uno nuevo """
+        controller = ResultsController(max_pool_size=2)
+        controller.close()  # Sin pool creado no hace nada
+
+        with controller._connect():
+            pass
+        first_pool = self.pools[0]
+        controller.close()
+        self.assertTrue(first_pool.closed)
+        self.assertIsNone(controller._pool)
+
+        with controller._connect():
+            pass
+        self.assertEqual(len(self.pools), 2)
+        self.assertFalse(self.pools[1].closed)
+
+    def test_close_while_borrowed(self):
+        """ Caso de prueba 9: Una conexión prestada al cerrar el pool se cierra al devolverla """
+        controller = ResultsController(max_pool_size=1)
+
+        with controller._connect() as connection:
+            controller.close()
+
+        self.assertTrue(connection.closed)
+        self.assertEqual(self.pools[0].returned, [])
+        self.assertTrue(controller._pool_slots.acquire(blocking=False))
+
+
+if __name__ == "__main__":
+    unittest.main()
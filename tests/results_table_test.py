@@ -1,5 +1,7 @@
 import unittest
 import sys
+import numpy as np
+import psycopg2
 sys.path.append("src")
 
 from controller.results_controller import ResultsController
@@ -128,6 +130,335 @@ class TestResultsController(unittest.TestCase):
         # Limpiar: eliminar el registro creado
         self.controller.delete_result(inserted_id)
 
+    # =============================================
+    # CASOS DE PRUEBA PARA INSERCIÓN MASIVA
+    # =============================================
+
+    def test_insert_results_1(self):
+        """ Caso de prueba 1: Insertar puntos y centroides de un análisis en una sola llamada """
+        results = [
+            ClusteringResult(
+                title="Inserción Masiva 1",
+                n_clusters=2,
+                used_iterations=4,
+                coordinates=[i / 10, 1 - i / 10],
+                assigned_cluster=i % 2,
+                is_centroid=False,
+                centroid_label=None
+            )
+            for i in range(5)
+        ]
+        results.append(
+            ClusteringResult(
+                title="Inserción Masiva 1",
+                n_clusters=2,
+                used_iterations=4,
+                coordinates=(0.25, 0.75),
+                assigned_cluster=0,
+                is_centroid=True,
+                centroid_label="Centroide 1"
+            )
+        )
+
+        # Varias sentencias (page_size=2) dentro de la misma transacción
+        inserted_ids = self.controller.insert_results(results, page_size=2)
+
+        # Un ID por resultado, en el mismo orden de entrada
+        self.assertEqual(len(inserted_ids), 6)
+        for inserted_id, result in zip(inserted_ids, results):
+            found_result = self.controller.get_result_by_id(inserted_id)
+            self.assertEqual(found_result.coordinates, list(result.coordinates))
+            self.assertEqual(found_result.assigned_cluster, result.assigned_cluster)
+            self.assertEqual(found_result.is_centroid, result.is_centroid)
+            self.assertEqual(found_result.centroid_label, result.centroid_label)
+
+        # Limpiar: eliminar los registros creados
+        for inserted_id in inserted_ids:
+            self.controller.delete_result(inserted_id)
+
+    def test_insert_results_2(self):
+        """ Caso de prueba 2: Una lista con un elemento inválido no inserta nada """
+        titles_before = self.controller.list_all_titles()
+        results = [
+            ClusteringResult(
+                title="Inserción Masiva 2",
+                n_clusters=1,
+                used_iterations=1,
+                coordinates=[0.1],
+                assigned_cluster=0,
+                is_centroid=False
+            ),
+            "no es un resultado"
+        ]
+
+        with self.assertRaises(TypeError):
+            self.controller.insert_results(results)
+
+        self.assertEqual(self.controller.list_all_titles(), titles_before)
+        self.assertEqual(self.controller.insert_results([]), [])
+
+    def test_insert_results_3(self):
+        """ Caso de prueba 3: Un punto que viola NOT NULL deshace todo el análisis """
+        title = "Inserción Masiva 3"
+        results = [
+            ClusteringResult(
+                title=title,
+                n_clusters=2,
+                used_iterations=3,
+                coordinates=[i / 10, 1 - i / 10],
+                assigned_cluster=i % 2,
+                is_centroid=False
+            )
+            for i in range(5)
+        ]
+        # El último punto no tiene cluster asignado (NOT NULL); con page_size=2 las
+        # primeras sentencias ya se ejecutaron cuando falla la última
+        results.append(
+            ClusteringResult(
+                title=title,
+                n_clusters=2,
+                used_iterations=3,
+                coordinates=[float("nan"), 0.5],
+                assigned_cluster=None,
+                is_centroid=False
+            )
+        )
+
+        with self.assertRaises(psycopg2.IntegrityError):
+            self.controller.insert_run(results, parameters={"algorithm": "lloyd"}, page_size=2)
+
+        # No queda ni el análisis ni ninguno de sus puntos
+        self.assertNotIn(title, [run["title"] for run in self.controller.list_runs()])
+        with self.controller._connect() as connection:
+            cursor = connection.cursor()
+            cursor.execute(
+                """
+                SELECT COUNT(*)
+                FROM clustering_points AS points
+                JOIN clustering_runs AS runs ON runs.id = points.run_id
+                WHERE runs.title = %s
+                """,
+                (title,)
+            )
+            self.assertEqual(cursor.fetchone()[0], 0)
+            cursor.close()
+
+    # =============================================
+    # CASOS DE PRUEBA PARA ANÁLISIS (RUNS)
+    # =============================================
+
+    def test_run_1(self):
+        """ Caso de prueba 1: Un análisis se lista una sola vez, sin importar sus puntos """
+        results = [
+            ClusteringResult(
+                title="Análisis Completo 1",
+                n_clusters=2,
+                used_iterations=5,
+                coordinates=[i / 10, i / 20],
+                assigned_cluster=i % 2,
+                is_centroid=False
+            )
+            for i in range(20)
+        ]
+        run_id = self.controller.insert_run(
+            results, parameters={"algorithm": "lloyd"}, duration_seconds=0.5
+        )
+
+        runs = [run for run in self.controller.list_runs() if run["id"] == run_id]
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(runs[0]["title"], "Análisis Completo 1")
+        self.assertEqual(runs[0]["n_clusters"], 2)
+        self.assertEqual(runs[0]["parameters"], {"algorithm": "lloyd"})
+        self.assertEqual(runs[0]["duration_seconds"], 0.5)
+        titles = [run for run in self.controller.list_all_titles() if run["id"] == run_id]
+        self.assertEqual(titles, [{"id": run_id, "title": "Análisis Completo 1"}])
+
+        # Limpiar: eliminar el análisis con todos sus puntos
+        self.assertTrue(self.controller.delete_run(run_id))
+        self.assertIsNone(self.controller.get_run(run_id))
+
+    def test_run_2(self):
+        """ Caso de prueba 2: Modificar un análisis cambia los datos de todos sus puntos """
+        results = [
+            ClusteringResult(
+                title="Análisis a Modificar",
+                n_clusters=1,
+                used_iterations=3,
+                coordinates=[0.1 * i],
+                assigned_cluster=0,
+                is_centroid=False
+            )
+            for i in range(3)
+        ]
+        inserted_ids = self.controller.insert_results(results)
+        run_id = self.controller.get_result_by_id(inserted_ids[0]).run_id
+
+        self.assertTrue(self.controller.update_run(run_id, "Análisis Modificado", 1, 4))
+
+        for inserted_id in inserted_ids:
+            found_result = self.controller.get_result_by_id(inserted_id)
+            self.assertEqual(found_result.run_id, run_id)
+            self.assertEqual(found_result.title, "Análisis Modificado")
+            self.assertEqual(found_result.used_iterations, 4)
+
+        # Limpiar: eliminar los puntos uno a uno elimina también el análisis
+        for inserted_id in inserted_ids:
+            self.controller.delete_result(inserted_id)
+        self.assertIsNone(self.controller.get_run(run_id))
+
+    def test_run_3(self):
+        """ Caso de prueba 3: La tabla anterior de una fila por punto se migra a análisis y puntos """
+        with self.controller._connect() as connection:
+            cursor = connection.cursor()
+            cursor.execute("""
+            CREATE TABLE clustering_results (
+                id SERIAL PRIMARY KEY,
+                title TEXT NOT NULL,
+                n_clusters INTEGER NOT NULL,
+                used_iterations INTEGER NOT NULL,
+                coordinates FLOAT8[] NOT NULL,
+                assigned_cluster INTEGER NOT NULL,
+                is_centroid BOOLEAN NOT NULL,
+                centroid_label TEXT
+            )
+            """)
+            cursor.executemany(
+                """
+                INSERT INTO clustering_results (
+                    title, n_clusters, used_iterations, coordinates,
+                    assigned_cluster, is_centroid, centroid_label
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s)
+                """,
+                [
+                    ("Análisis Anterior", 2, 6, [0.1, 0.2], 0, False, None),
+                    ("Análisis Anterior", 2, 6, [0.9, 0.8], 1, False, None),
+                    ("Análisis Anterior", 2, 6, [0.5, 0.5], 0, True, "Centroide 1"),
+                ]
+            )
+            connection.commit()
+            cursor.close()
+
+        self.controller.create_table()
+
+        runs = [run for run in self.controller.list_runs() if run["title"] == "Análisis Anterior"]
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(self.controller.get_run_centroids("Análisis Anterior"), [[0.5, 0.5]])
+
+        # Limpiar: eliminar el análisis migrado
+        self.controller.delete_run(runs[0]["id"])
+
+    def test_run_arrays(self):
+        """ Caso de prueba 4: Cargar varios análisis completos como arreglos de NumPy """
+        run_ids = []
+        for run_number in range(2):
+            results = [
+                ClusteringResult(
+                    title=f"Análisis en Arreglos {run_number}",
+                    n_clusters=2,
+                    used_iterations=3,
+                    coordinates=[i + 0.25, run_number - i / 8],
+                    assigned_cluster=i % 2,
+                    is_centroid=False
+                )
+                for i in range(6)
+            ]
+            results.extend(
+                ClusteringResult(
+                    title=f"Análisis en Arreglos {run_number}",
+                    n_clusters=2,
+                    used_iterations=3,
+                    coordinates=[cluster + 0.5, 0.5],
+                    assigned_cluster=cluster,
+                    is_centroid=True,
+                    centroid_label=f"Centroide {cluster+1}"
+                )
+                for cluster in [1, 0]
+            )
+            run_ids.append(self.controller.insert_run(results))
+
+        runs = self.controller.get_runs_arrays(run_ids + [99999])
+
+        # Los IDs inexistentes se omiten
+        self.assertEqual(list(runs), run_ids)
+        for run_number, run_id in enumerate(run_ids):
+            run = runs[run_id]
+            self.assertEqual(run["title"], f"Análisis en Arreglos {run_number}")
+            np.testing.assert_array_equal(
+                run["points"], [[i + 0.25, run_number - i / 8] for i in range(6)]
+            )
+            np.testing.assert_array_equal(run["labels"], [0, 1, 0, 1, 0, 1])
+            np.testing.assert_array_equal(run["centroids"], [[0.5, 0.5], [1.5, 0.5]])
+            np.testing.assert_array_equal(run["centroid_clusters"], [0, 1])
+            self.assertEqual(run["centroid_labels"], ["Centroide 1", "Centroide 2"])
+            self.assertTrue(run["points"].flags["C_CONTIGUOUS"])
+
+        # Limpiar: eliminar los análisis creados
+        for run_id in run_ids:
+            self.controller.delete_run(run_id)
+
+    def test_run_batches(self):
+        """ Caso de prueba 5: Leer un análisis por lotes con un cursor del servidor """
+        results = [
+            ClusteringResult(
+                title="Análisis por Lotes",
+                n_clusters=3,
+                used_iterations=2,
+                coordinates=[i / 4, -i / 4],
+                assigned_cluster=i % 3,
+                is_centroid=False
+            )
+            for i in range(7)
+        ]
+        results.append(
+            ClusteringResult(
+                title="Análisis por Lotes",
+                n_clusters=3,
+                used_iterations=2,
+                coordinates=[0.0, 0.0],
+                assigned_cluster=0,
+                is_centroid=True,
+                centroid_label="Centroide 1"
+            )
+        )
+        run_id = self.controller.insert_run(results)
+
+        # Lotes de arreglos: solo los puntos, en el orden en que se guardaron
+        batches = list(self.controller.iter_run_batches(run_id, itersize=3))
+        self.assertEqual([len(batch["ids"]) for batch in batches], [3, 3, 1])
+        np.testing.assert_array_equal(
+            np.concatenate([batch["points"] for batch in batches]),
+            [[i / 4, -i / 4] for i in range(7)]
+        )
+        np.testing.assert_array_equal(
+            np.concatenate([batch["labels"] for batch in batches]), [0, 1, 2, 0, 1, 2, 0]
+        )
+
+        # Lotes de ClusteringResult: puntos y centroides
+        chunks = list(self.controller.iter_run_results(run_id, itersize=5))
+        self.assertEqual([len(chunk) for chunk in chunks], [5, 3])
+        found_results = [result for chunk in chunks for result in chunk]
+        self.assertTrue(all(found.isEqual(result) for found, result in zip(found_results, results)))
+
+        # Cerrar el generador antes de terminar libera el cursor y la conexión
+        partial = self.controller.iter_run_results(run_id, is_centroid=False, itersize=2)
+        self.assertEqual(len(next(partial)), 2)
+        partial.close()
+        centroids = [result for chunk in self.controller.iter_run_results(run_id, is_centroid=True) for result in chunk]
+        self.assertEqual([centroid.centroid_label for centroid in centroids], ["Centroide 1"])
+
+        # Páginas por clave: cada página empieza después del último ID de la anterior
+        pages = [self.controller.get_run_points_page(run_id, limit=3)]
+        while len(pages[-1]) == 3:
+            pages.append(
+                self.controller.get_run_points_page(run_id, after_id=pages[-1][-1].id, limit=3)
+            )
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        paged_results = [result for page in pages for result in page]
+        self.assertTrue(all(found.isEqual(result) for found, result in zip(paged_results, results[:7])))
+
+        # Limpiar: eliminar el análisis creado
+        self.controller.delete_run(run_id)
+
     # =============================================
     # 3 CASOS DE PRUEBA PARA MODIFICAR
     # =============================================
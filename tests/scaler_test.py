@@ -0,0 +1,81 @@
+import sys
+import unittest
+import pandas as pd
+import numpy as np
+
+sys.path.append("src")
+
+from model.scaler import DataScaler
+from model.errors.kmeans_error import InvalidScalingError
+
+
+class TestDataScaler(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = pd.DataFrame(
+            {
+                "GDP_per_capita": [30000, 25000, 40000, 35000],
+                "life_expectancy": [78, 75, 82, 79],
+                "literacy_rate": [95, 95, 95, 95],
+            }
+        )
+
+    def test_min_max(self):
+        """
+        Test Description:
+        Min-max scaling maps every column to [0, 1] and maps a constant column
+        to 0 instead of dividing by zero.
+        """
+        scaled = DataScaler("min-max").fit_transform(self.dataset)
+
+        self.assertEqual(scaled["GDP_per_capita"].tolist(), [1 / 3, 0.0, 1.0, 2 / 3])
+        self.assertEqual(scaled["life_expectancy"].min(), 0.0)
+        self.assertEqual(scaled["life_expectancy"].max(), 1.0)
+        self.assertEqual(scaled["literacy_rate"].tolist(), [0.0, 0.0, 0.0, 0.0])
+
+    def test_z_score_and_robust(self):
+        """
+        Test Description:
+        Z-score scaling gives zero mean and unit deviation; robust scaling centers
+        each column on its median.
+        """
+        z_scaled = DataScaler("z-score").fit_transform(self.dataset)
+        robust_scaled = DataScaler("robust").fit_transform(self.dataset)
+
+        self.assertAlmostEqual(z_scaled["GDP_per_capita"].mean(), 0.0)
+        self.assertAlmostEqual(z_scaled["GDP_per_capita"].std(ddof=0), 1.0)
+        self.assertAlmostEqual(robust_scaled["life_expectancy"].median(), 0.0)
+
+    def test_transform_new_batch(self):
+        """
+        Test Description:
+        A fitted scaler transforms new rows with the parameters of the training
+        data, and survives a round trip through to_dict / from_dict.
+        """
+        scaler = DataScaler("min-max").fit(self.dataset)
+        restored = DataScaler.from_dict(scaler.to_dict())
+        new_rows = pd.DataFrame(
+            {
+                "literacy_rate": [95, 100],
+                "GDP_per_capita": [32500, 55000],
+                "life_expectancy": [75, 89],
+            }
+        )
+
+        scaled = restored.transform(new_rows)
+
+        self.assertEqual(list(scaled.columns), list(self.dataset.columns))
+        self.assertEqual(scaled["GDP_per_capita"].tolist(), [0.5, 2.0])
+        self.assertEqual(scaled["life_expectancy"].tolist(), [0.0, 2.0])
+        np.testing.assert_allclose(
+            restored.inverse_transform_array(scaled.to_numpy()),
+            new_rows[list(self.dataset.columns)].to_numpy(),
+        )
+
+    def test_error_invalid_method(self):
+        with self.assertRaises(InvalidScalingError):
+            DataScaler("log")
+
+
+if __name__ == "__main__":
+    unittest.main()